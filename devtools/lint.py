@@ -1,8 +1,7 @@
 import subprocess
 
 from funlog import log_calls
-from rich import get_console, reconfigure
-from rich import print as rprint
+from rich import get_console, print as rprint, reconfigure
 
 # Update as needed.
 SRC_PATHS = ["src", "devtools"]
@@ -1,68 +1,121 @@
-from .client import MCIClient, MCIClientError
+"""
+MCI Python adapter.
+
+Public names are resolved lazily (PEP 562) so that `import mcipy` stays cheap:
+the client, parser, models, and MCP SDK are only imported on first attribute access.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .enums import ExecutionType
-from .mcp_client import ClientCfg, LiteMcpClient, ServerCfg, SseCfg, StdioCfg
-from .models import (
-    Annotations,
-    ApiKeyAuth,
-    AudioContent,
-    BasicAuth,
-    BearerAuth,
-    CLIExecutionConfig,
-    ExecutionResult,
-    ExecutionResultContent,
-    FileExecutionConfig,
-    FlagConfig,
-    HTTPBodyConfig,
-    HTTPExecutionConfig,
-    ImageContent,
-    MCISchema,
-    Metadata,
-    OAuth2Auth,
-    RetryConfig,
-    TextContent,
-    TextExecutionConfig,
-    Tool,
-)
-from .parser import SchemaParser, SchemaParserError
-from .tool_manager import ToolManager, ToolManagerError
-
-__all__ = (
+
+if TYPE_CHECKING:
+    from .client import MCIClient as MCIClient, MCIClientError as MCIClientError
+    from .mcp_client import (
+        ClientCfg as ClientCfg,
+        LiteMcpClient as LiteMcpClient,
+        ServerCfg as ServerCfg,
+        SseCfg as SseCfg,
+        StdioCfg as StdioCfg,
+    )
+    from .models import (
+        Annotations as Annotations,
+        ApiKeyAuth as ApiKeyAuth,
+        AudioContent as AudioContent,
+        BasicAuth as BasicAuth,
+        BearerAuth as BearerAuth,
+        CLIExecutionConfig as CLIExecutionConfig,
+        ExecutionResult as ExecutionResult,
+        ExecutionResultContent as ExecutionResultContent,
+        FileExecutionConfig as FileExecutionConfig,
+        FlagConfig as FlagConfig,
+        HTTPBodyConfig as HTTPBodyConfig,
+        HTTPExecutionConfig as HTTPExecutionConfig,
+        ImageContent as ImageContent,
+        MCISchema as MCISchema,
+        Metadata as Metadata,
+        OAuth2Auth as OAuth2Auth,
+        RetryConfig as RetryConfig,
+        TextContent as TextContent,
+        TextExecutionConfig as TextExecutionConfig,
+        Tool as Tool,
+    )
+    from .parser import SchemaParser as SchemaParser, SchemaParserError as SchemaParserError
+    from .tool_manager import ToolManager as ToolManager, ToolManagerError as ToolManagerError
+
+# Maps each lazily exported name to the submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
     # Client
-    "MCIClient",
-    "MCIClientError",
+    "MCIClient": "client",
+    "MCIClientError": "client",
     # MCP Client
-    "LiteMcpClient",
-    "ClientCfg",
-    "ServerCfg",
-    "StdioCfg",
-    "SseCfg",
-    # Enums
-    "ExecutionType",
+    "LiteMcpClient": "mcp_client",
+    "ClientCfg": "mcp_client",
+    "ServerCfg": "mcp_client",
+    "StdioCfg": "mcp_client",
+    "SseCfg": "mcp_client",
     # Models
-    "Annotations",
-    "ApiKeyAuth",
-    "AudioContent",
-    "BasicAuth",
-    "BearerAuth",
-    "CLIExecutionConfig",
-    "ExecutionResult",
-    "ExecutionResultContent",
-    "FileExecutionConfig",
-    "FlagConfig",
-    "HTTPBodyConfig",
-    "HTTPExecutionConfig",
-    "ImageContent",
-    "MCISchema",
-    "Metadata",
-    "OAuth2Auth",
-    "RetryConfig",
-    "TextContent",
-    "TextExecutionConfig",
-    "Tool",
+    "Annotations": "models",
+    "ApiKeyAuth": "models",
+    "AudioContent": "models",
+    "BasicAuth": "models",
+    "BearerAuth": "models",
+    "CLIExecutionConfig": "models",
+    "ExecutionResult": "models",
+    "ExecutionResultContent": "models",
+    "FileExecutionConfig": "models",
+    "FlagConfig": "models",
+    "HTTPBodyConfig": "models",
+    "HTTPExecutionConfig": "models",
+    "ImageContent": "models",
+    "MCISchema": "models",
+    "Metadata": "models",
+    "OAuth2Auth": "models",
+    "RetryConfig": "models",
+    "TextContent": "models",
+    "TextExecutionConfig": "models",
+    "Tool": "models",
     # Parser
-    "SchemaParser",
-    "SchemaParserError",
+    "SchemaParser": "parser",
+    "SchemaParserError": "parser",
     # Tool Manager
-    "ToolManager",
-    "ToolManagerError",
-)
+    "ToolManager": "tool_manager",
+    "ToolManagerError": "tool_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a lazily exported name on first access.
+
+    Imports the defining submodule, caches the attribute in the module globals
+    so later lookups bypass this hook, and returns it.
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The exported object
+
+    Raises:
+        AttributeError: If the name is not a public export of the package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Derived from the lazy map so the export list has a single source of truth; the
+# "X as X" imports above are what linters and type checkers read as re-exports
+__all__ = ("ExecutionType", *_LAZY_IMPORTS)  # pyright: ignore[reportUnsupportedDunderAll]
@@ -0,0 +1,134 @@
+"""
+Background event loop for running MCI coroutines from synchronous code.
+
+This module provides the AsyncLoopThread class, which owns a single asyncio event
+loop running on a daemon thread. Synchronous callers submit coroutines to it instead
+of calling asyncio.run() per operation, so objects bound to the loop (such as open
+MCP client sessions) survive between calls and can be reused.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread:
+    """
+    An asyncio event loop running forever on a dedicated daemon thread.
+
+    The loop and thread are started lazily on first use. Coroutines can be submitted
+    from any thread; the loop thread itself must not block on its own results.
+    """
+
+    def __init__(self, name: str = "mcipy-async-loop"):
+        """
+        Initialize the loop thread without starting it.
+
+        Args:
+            name: Name given to the background thread
+        """
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop has been started and is still running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the background loop if it is not already running.
+
+        Returns:
+            The running event loop
+        """
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop, ready), name=self._name, daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """
+        Schedule a coroutine on the background loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future that resolves with the coroutine's result
+        """
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Optional number of seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the loop thread itself (would deadlock)
+            TimeoutError: If the result is not available within the timeout
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("AsyncLoopThread.run() cannot be called from its own loop thread")
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        """
+        Stop the background loop and wait for its thread to exit.
+
+        Pending tasks are cancelled. The loop can be started again afterwards.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or thread is None or not thread.is_alive():
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """
+        Thread target: run the loop until stopped, then cancel leftovers and close it.
+
+        Args:
+            loop: Event loop owned by this thread
+            ready: Event set once the loop is about to start running
+        """
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
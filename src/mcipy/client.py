@@ -6,9 +6,10 @@ programmatic use of MCI tool contexts. It handles loading tool schemas,
 managing environment variables, filtering tools, and executing tools.
 """
 
+from pathlib import Path
 from typing import Any
 
-from .models import ExecutionResult, Tool
+from .models import ExecutionResult, MCISchema, Tool
 from .parser import SchemaParser
 from .tool_manager import ToolManager, ToolManagerError
 
@@ -64,6 +65,7 @@ class MCIClient:
         env_vars: dict[str, Any] | None = None,
         json_file_path: str | None = None,
         validating: bool = False,
+        schema_cache_dir: str | None = None,
     ):
         """
         Initialize the MCI client with a schema file and environment variables.
@@ -78,6 +80,8 @@ class MCIClient:
             validating: If True, perform pure schema validation without loading MCP servers,
                        toolsets, or resolving templates. No network/file actions are performed.
                        Tool execution is disabled in this mode. (default: False)
+            schema_cache_dir: Optional directory for caching the validated schema across
+                       processes (see SchemaParser.parse_file). (default: None, no caching)
 
         Raises:
             MCIClientError: If the schema file cannot be loaded or parsed
@@ -88,25 +92,96 @@ class MCIClient:
         elif schema_file_path is None:
             raise MCIClientError("Either 'schema_file_path' or 'json_file_path' must be provided")
 
-        # Store schema file path for path validation
-        self._schema_file_path = schema_file_path
-
-        # Store validating mode flag
-        self._validating = validating
-
-        # Store environment variables first (needed for schema parsing)
-        self._env_vars = env_vars if env_vars is not None else {}
+        # Resolve environment variables first (needed for schema parsing)
+        env_vars = env_vars if env_vars is not None else {}
 
         # Load schema using SchemaParser with env_vars for MCP server templating
         try:
-            self._schema = SchemaParser.parse_file(
-                schema_file_path, env_vars=self._env_vars, validating=validating
+            schema = SchemaParser.parse_file(
+                schema_file_path,
+                env_vars=env_vars,
+                validating=validating,
+                cache_dir=schema_cache_dir,
             )
         except Exception as e:
             raise MCIClientError(f"Failed to load schema from {schema_file_path}: {e}") from e
 
-        # Initialize ToolManager with schema file path for path validation
-        self._tool_manager = ToolManager(self._schema, schema_file_path)
+        self._init_state(schema, schema_file_path, env_vars, validating)
+
+    @classmethod
+    def from_dict(
+        cls,
+        schema: dict[str, Any],
+        schema_file_path: str | None = None,
+        env_vars: dict[str, Any] | None = None,
+        validating: bool = False,
+    ) -> "MCIClient":
+        """
+        Create a client from an already-decoded schema dictionary.
+
+        Skips reading and decoding a schema file. If schema_file_path is given, the
+        schema is treated as if it had been loaded from that file: libraryDir and
+        path validation are resolved against its directory. Without it, both use
+        the current working directory, so file and CLI paths are still restricted
+        unless the schema or tool opts out with enableAnyPaths or directoryAllowList.
+
+        Args:
+            schema: Decoded MCI schema data
+            schema_file_path: Optional path the schema is considered to live at
+            env_vars: Environment variables for template substitution (default: empty dict)
+            validating: If True, perform pure schema validation without loading MCP servers,
+                       toolsets, or resolving templates. Tool execution is disabled.
+
+        Returns:
+            MCIClient for the given schema
+
+        Raises:
+            MCIClientError: If the schema is invalid
+        """
+        env_vars = env_vars if env_vars is not None else {}
+
+        try:
+            parsed = SchemaParser.parse_dict(
+                schema,
+                schema_file_path=schema_file_path,
+                env_vars=env_vars,
+                validating=validating,
+            )
+        except Exception as e:
+            raise MCIClientError(f"Failed to load schema: {e}") from e
+
+        client = cls.__new__(cls)
+        client._init_state(parsed, schema_file_path, env_vars, validating)
+        return client
+
+    def _init_state(
+        self,
+        schema: MCISchema,
+        schema_file_path: str | None,
+        env_vars: dict[str, Any],
+        validating: bool,
+    ) -> None:
+        """
+        Set up client state from a parsed schema; shared by __init__ and from_dict.
+
+        Args:
+            schema: Parsed MCI schema
+            schema_file_path: Path the schema was loaded from, if any
+            env_vars: Environment variables for template substitution
+            validating: Whether the client is in validating mode
+        """
+        # Store schema file path for path validation
+        self._schema_file_path = schema_file_path
+
+        # Store validating mode flag
+        self._validating = validating
+
+        self._env_vars = env_vars
+        self._schema = schema
+
+        # Initialize ToolManager for path validation against the schema's directory,
+        # or the current working directory for schemas that were not loaded from a file
+        self._tool_manager = ToolManager(schema, schema_file_path, context_dir=Path.cwd())
 
     def tools(self) -> list[Tool]:
         """
@@ -237,7 +312,7 @@ class MCIClient:
         Returns:
             List of enabled tool names (strings)
         """
-        return [tool.name for tool in self._tool_manager.list_tools()]
+        return self._tool_manager.list_tool_names()
 
     def get_tool_schema(self, tool_name: str) -> dict[str, Any]:
         """
@@ -14,7 +14,7 @@ from ..models import (
     ExecutionResultContent,
     TextContent,
 )
-from ..templating import TemplateEngine
+from ..templating import TemplateEngine, needs_templating
 
 
 class BaseExecutor(ABC):
@@ -49,13 +49,16 @@ class BaseExecutor(ABC):
         """
         pass
 
-    def _build_context(self, props: dict[str, Any], env_vars: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def _build_context(props: dict[str, Any], env_vars: dict[str, Any]) -> dict[str, Any]:
         """
         Build template context from properties and environment variables.
 
         Creates the context dictionary used for template rendering with 'props',
         'env', and 'input' keys. The 'input' key is an alias for 'props' for
-        backward compatibility.
+        backward compatibility. This is the single place execution contexts are
+        built; a plain dict literal is the cheapest mapping the template engine
+        accepts.
 
         Args:
             props: Properties/parameters passed to the tool execution
@@ -70,7 +73,8 @@ class BaseExecutor(ABC):
             "input": props,  # Alias for backward compatibility
         }
 
-    def _handle_timeout(self, timeout_ms: int) -> int:
+    @staticmethod
+    def _handle_timeout(timeout_ms: int) -> int:
         """
         Convert timeout from milliseconds to seconds and apply defaults.
 
@@ -86,9 +90,8 @@ class BaseExecutor(ABC):
         if timeout_ms <= 0:
             return 30  # Default timeout of 30 seconds
 
-        # Convert milliseconds to seconds, rounding up to at least 1 second
-        timeout_s = max(1, (timeout_ms + 999) // 1000)
-        return timeout_s
+        # Ceiling division; any positive timeout_ms already yields at least 1 second
+        return -(-timeout_ms // 1000)
 
     def _format_error(self, error: Exception) -> ExecutionResult:
         """
@@ -103,10 +106,32 @@ class BaseExecutor(ABC):
         Returns:
             ExecutionResult with isError=True and error message
         """
-        return ExecutionResult(
-            result=ExecutionResultContent(
-                isError=True,
-                content=[TextContent(text=str(error))],
+        return self._text_result(str(error), is_error=True)
+
+    @staticmethod
+    def _text_result(
+        text: str, is_error: bool = False, metadata: dict[str, Any] | None = None
+    ) -> ExecutionResult:
+        """
+        Build an ExecutionResult holding a single text content object.
+
+        Every field is produced by the executor itself and already has the right
+        type, so the models are built with model_construct() and skip validation.
+        The returned object is an ordinary ExecutionResult.
+
+        Args:
+            text: Text for the single content object
+            is_error: Whether the result represents an error
+            metadata: Optional result metadata
+
+        Returns:
+            ExecutionResult wrapping one TextContent
+        """
+        return ExecutionResult.model_construct(
+            result=ExecutionResultContent.model_construct(
+                content=[TextContent.model_construct(text=text)],
+                isError=is_error,
+                metadata=metadata,
             )
         )
 
@@ -135,6 +160,9 @@ class BaseExecutor(ABC):
 
             # Apply templating based on field type
             if isinstance(field_value, str):
+                # Literal strings need no templating and no write-back
+                if not needs_templating(field_value):
+                    continue
                 # Apply basic templating to string fields
                 templated_value = self.template_engine.render_basic(field_value, context)
                 setattr(config, field_name, templated_value)
@@ -162,6 +190,8 @@ class BaseExecutor(ABC):
         """
         for key, value in data.items():
             if isinstance(value, str):
+                if not needs_templating(value):
+                    continue
                 # Check if this is a JSON-native placeholder
                 if self.template_engine.is_json_native_placeholder(value):
                     # Resolve to native type
@@ -187,6 +217,8 @@ class BaseExecutor(ABC):
         """
         for i, value in enumerate(data):
             if isinstance(value, str):
+                if not needs_templating(value):
+                    continue
                 # Check if this is a JSON-native placeholder
                 if self.template_engine.is_json_native_placeholder(value):
                     # Resolve to native type
@@ -14,9 +14,7 @@ from ..models import (
     CLIExecutionConfig,
     ExecutionConfig,
     ExecutionResult,
-    ExecutionResultContent,
     FlagConfig,
-    TextContent,
 )
 from .base import BaseExecutor
 
@@ -87,32 +85,27 @@ class CLIExecutor(BaseExecutor):
                 error_msg = f"Command exited with code {returncode}"
                 if stderr:
                     error_msg += f": {stderr}"
-                return ExecutionResult(
-                    result=ExecutionResultContent(
-                        isError=True,
-                        content=[TextContent(text=error_msg)],
-                        metadata={
-                            "exit_code": returncode,
-                            "stdout_bytes": stdout_bytes,
-                            "stderr_bytes": stderr_bytes,
-                            "stderr": stderr,
-                            "stdout": stdout,
-                        },
-                    )
-                )
-
-            # Command succeeded - return stdout
-            return ExecutionResult(
-                result=ExecutionResultContent(
-                    isError=False,
-                    content=[TextContent(text=stdout)],
+                return self._text_result(
+                    error_msg,
+                    is_error=True,
                     metadata={
                         "exit_code": returncode,
                         "stdout_bytes": stdout_bytes,
                         "stderr_bytes": stderr_bytes,
                         "stderr": stderr,
+                        "stdout": stdout,
                     },
                 )
+
+            # Command succeeded - return stdout
+            return self._text_result(
+                stdout,
+                metadata={
+                    "exit_code": returncode,
+                    "stdout_bytes": stdout_bytes,
+                    "stderr_bytes": stderr_bytes,
+                    "stderr": stderr,
+                },
             )
 
         except Exception as e:
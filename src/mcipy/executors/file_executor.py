@@ -5,15 +5,17 @@ This module provides the FileExecutor class that handles file-based tool executi
 It reads files from disk and optionally applies templating to the content.
 """
 
-from pathlib import Path
+import functools
+import hashlib
+import json
+import os
+import stat
 from typing import Any
 
 from ..models import (
     ExecutionConfig,
     ExecutionResult,
-    ExecutionResultContent,
     FileExecutionConfig,
-    TextContent,
 )
 from .base import BaseExecutor
 
@@ -27,9 +29,24 @@ class FileExecutor(BaseExecutor):
     with @for, @foreach, and @if directives when enableTemplating is true.
     """
 
+    # Maximum number of distinct file versions kept in the content cache
+    CONTENT_CACHE_SIZE = 128
+
+    # Maximum number of rendered (content, context) results kept in the render cache
+    RENDER_CACHE_SIZE = 256
+
     def __init__(self):
-        """Initialize the file executor with a template engine."""
+        """Initialize the file executor with a template engine and content cache."""
         super().__init__()
+        self._content_cache = functools.lru_cache(maxsize=self.CONTENT_CACHE_SIZE)(
+            self._read_uncached
+        )
+        self._render_cache: dict[tuple[bytes, bytes], str] = {}
+
+    def reload(self) -> None:
+        """Drop all cached file contents and renders so the next execution starts fresh."""
+        self._content_cache.cache_clear()
+        self._render_cache.clear()
 
     def execute(self, config: ExecutionConfig, context: dict[str, Any]) -> ExecutionResult:
         """
@@ -68,19 +85,17 @@ class FileExecutor(BaseExecutor):
             # Parse content with templating if enabled
             parsed_content = self._parse_content(content, context, config.enableTemplating)
 
-            return ExecutionResult(
-                result=ExecutionResultContent(
-                    isError=False,
-                    content=[TextContent(text=parsed_content)],
-                )
-            )
+            return self._text_result(parsed_content)
 
         except Exception as e:
             return self._format_error(e)
 
     def _read_file(self, path: str) -> str:
         """
-        Read the content of a file from disk.
+        Read the content of a file from disk, reusing cached content when unchanged.
+
+        The file is stat-ed on every call; its content is only read and decoded
+        again when the path, modification time, or size differs from a cached entry.
 
         Args:
             path: Path to the file to read
@@ -92,16 +107,46 @@ class FileExecutor(BaseExecutor):
             FileNotFoundError: If the file does not exist
             IOError: If the file cannot be read
         """
-        file_path = Path(path)
+        return self._content_cache(self._stat_key(path))
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+    @staticmethod
+    def _stat_key(path: str) -> tuple[str, int, int]:
+        """
+        Build the content cache key for a file.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Tuple of (absolute path, mtime in nanoseconds, size in bytes)
 
-        if not file_path.is_file():
+        Raises:
+            FileNotFoundError: If the file does not exist
+            IOError: If the path is not a regular file
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+
+        if not stat.S_ISREG(st.st_mode):
             raise OSError(f"Path is not a file: {path}")
 
-        # Read file content
-        return file_path.read_text(encoding="utf-8")
+        return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _read_uncached(key: tuple[str, int, int]) -> str:
+        """
+        Read and decode a file, bypassing the content cache.
+
+        Args:
+            key: Cache key from _stat_key; only the path is used
+
+        Returns:
+            File content as a string
+        """
+        with open(key[0], encoding="utf-8") as f:
+            return f.read()
 
     def _parse_content(
         self, content: str, context: dict[str, Any], parse_placeholders: bool
@@ -127,5 +172,51 @@ class FileExecutor(BaseExecutor):
         if not parse_placeholders:
             return content
 
+        cache_key = self._render_cache_key(content, context)
+        if cache_key is not None:
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Use advanced templating to support all directives
-        return self.template_engine.render_advanced(content, context)
+        rendered = self.template_engine.render_advanced(content, context)
+
+        if cache_key is not None:
+            if len(self._render_cache) >= self.RENDER_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order). The executor is
+                # shared across threads, so another thread may have evicted it already.
+                oldest = next(iter(self._render_cache), None)
+                if oldest is not None:
+                    self._render_cache.pop(oldest, None)
+            self._render_cache[cache_key] = rendered
+
+        return rendered
+
+    @staticmethod
+    def _render_cache_key(content: str, context: dict[str, Any]) -> tuple[bytes, bytes] | None:
+        """
+        Build the render cache key from digests of the content and template context.
+
+        The path validation entry is left out because templates never read it. Contexts holding values
+        that are not plain JSON types are not cached, since distinct objects could
+        serialize identically and be served a stale render.
+
+        Args:
+            content: File content to be templated
+            context: Context dictionary for template resolution
+
+        Returns:
+            Tuple of (content digest, context digest), or None if the context
+            holds values that are not plain JSON types
+        """
+        template_context = {
+            key: value for key, value in context.items() if key != "path_validation"
+        }
+        try:
+            context_json = json.dumps(template_context, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+        content_digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        context_digest = hashlib.blake2b(context_json.encode("utf-8"), digest_size=16).digest()
+        return content_digest, context_digest
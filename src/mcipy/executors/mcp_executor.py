@@ -31,6 +31,10 @@ class MCPExecutor(BaseExecutor):
     Connects to MCP servers via STDIO or HTTP transports and executes tools
     using the MCP protocol. Handles connection management, tool calls, and
     result formatting.
+
+    Server sessions come from MCPIntegration's pool on its background event loop,
+    so repeated calls to the same server reuse one initialized connection instead
+    of respawning the server process or redoing the handshake each time.
     """
 
     def __init__(self, mcp_servers: dict[str, Any] | None = None):
@@ -45,7 +49,7 @@ class MCPExecutor(BaseExecutor):
 
     def execute(self, config: ExecutionConfig, context: dict[str, Any]) -> ExecutionResult:
         """
-        Execute an MCP tool by connecting to the server and calling the tool.
+        Execute an MCP tool on a pooled server session, connecting on first use.
 
         Args:
             config: MCP execution configuration with server and tool names
@@ -57,120 +61,202 @@ class MCPExecutor(BaseExecutor):
         Raises:
             MCPExecutorError: If server is not registered or execution fails
         """
+        try:
+            mcp_config, server_config = self._resolve_server(config)
+        except MCPExecutorError as e:
+            return self._format_error(e)
+
+        # Run on the shared background loop that owns the pooled server sessions
+        from ..mcp_integration import MCPIntegration
+
+        try:
+            return MCPIntegration._loop_thread.run(
+                self._async_execute(mcp_config, context, server_config)
+            )
+        except Exception as e:
+            return self._format_error(e)
+
+    async def execute_async(
+        self, config: ExecutionConfig, context: dict[str, Any]
+    ) -> ExecutionResult:
+        """
+        Async variant of execute for callers already inside an event loop.
+
+        The tool call runs on the shared background loop (where pooled sessions live)
+        and is awaited from the caller's loop without blocking it.
+
+        Args:
+            config: MCP execution configuration with server and tool names
+            context: Execution context with properties and environment variables
+
+        Returns:
+            ExecutionResult with tool execution results
+        """
+        try:
+            mcp_config, server_config = self._resolve_server(config)
+        except MCPExecutorError as e:
+            return self._format_error(e)
+
+        from ..mcp_integration import MCPIntegration
+
+        try:
+            future = MCPIntegration._loop_thread.submit(
+                self._async_execute(mcp_config, context, server_config)
+            )
+            return await asyncio.wrap_future(future)
+        except Exception as e:
+            return self._format_error(e)
+
+    def _resolve_server(self, config: ExecutionConfig) -> tuple[MCPExecutionConfig, Any]:
+        """
+        Check the config type and look up the server it targets.
+
+        Args:
+            config: Execution configuration passed to execute
+
+        Returns:
+            Tuple of (config as MCPExecutionConfig, server configuration)
+
+        Raises:
+            MCPExecutorError: If the config is not an MCP config or the server is unknown
+        """
         # Type guard: ensure config is MCPExecutionConfig
         if not isinstance(config, MCPExecutionConfig):
-            return self._format_error(
-                MCPExecutorError(
-                    f"Invalid config type: expected MCPExecutionConfig, got {type(config)}"
-                )
+            raise MCPExecutorError(
+                f"Invalid config type: expected MCPExecutionConfig, got {type(config)}"
             )
 
         # Get server configuration
         if config.serverName not in self.mcp_servers:
-            return self._format_error(
-                MCPExecutorError(f"MCP server '{config.serverName}' not registered in main schema")
+            raise MCPExecutorError(
+                f"MCP server '{config.serverName}' not registered in main schema"
             )
 
-        server_config = self.mcp_servers[config.serverName]
+        return config, self.mcp_servers[config.serverName]
 
-        # Execute async operation in sync context
-        try:
-            result = asyncio.run(self._async_execute(config, context, server_config))
-            return result
-        except Exception as e:
-            return self._format_error(e)
+    def connect_all(self, env_vars: dict[str, Any] | None = None) -> dict[str, Exception]:
+        """
+        Open pooled sessions to every configured MCP server concurrently.
 
-    async def _async_execute(
-        self, config: MCPExecutionConfig, context: dict[str, Any], server_config: Any
-    ) -> ExecutionResult:
+        Servers are connected in parallel on the shared background loop, so warming up
+        N servers takes about as long as the slowest one rather than the sum of all.
+        A server that fails to connect does not stop the others.
+
+        Args:
+            env_vars: Environment variables for templating server configurations
+
+        Returns:
+            Mapping of server name to the error raised while connecting, for failed servers
         """
-        Async implementation of MCP tool execution.
+        from ..mcp_integration import MCPIntegration
 
-        Connects to MCP server, calls the tool, and returns formatted results.
+        return MCPIntegration._loop_thread.run(self._async_connect_all(env_vars or {}))
+
+    async def connect_all_async(
+        self, env_vars: dict[str, Any] | None = None
+    ) -> dict[str, Exception]:
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import StdioServerParameters, stdio_client
-        from mcp.client.streamable_http import streamablehttp_client
+        Async variant of connect_all for callers already inside an event loop.
 
-        from ..templating import TemplateEngine
+        The connections are made on the shared background loop (where pooled sessions
+        live) and awaited from the caller's loop without blocking it.
+        """
+        from ..mcp_integration import MCPIntegration
 
-        # Apply templating to server config
-        template_engine = TemplateEngine()
+        future = MCPIntegration._loop_thread.submit(self._async_connect_all(env_vars or {}))
+        return await asyncio.wrap_future(future)
+
+    async def _async_connect_all(self, env_vars: dict[str, Any]) -> dict[str, Exception]:
+        """Connect to all servers with asyncio.gather and collect per-server failures."""
+        context = self._build_context({}, env_vars)
+        server_names = list(self.mcp_servers)
+        results = await asyncio.gather(
+            *(self._async_connect(name, context) for name in server_names),
+            return_exceptions=True,
+        )
+        return {
+            name: result
+            for name, result in zip(server_names, results, strict=True)
+            if isinstance(result, Exception)
+        }
+
+    async def _async_connect(self, server_name: str, context: dict[str, Any]) -> None:
+        """Template one server's configuration and make sure a pooled session is open."""
         from ..mcp_integration import MCPIntegration
 
         templated_config = MCPIntegration._apply_templating_to_config(
-            server_config, context, template_engine
+            self.mcp_servers[server_name], context, self.template_engine
         )
+        await MCPIntegration._get_or_create_session(server_name, templated_config)
 
-        # Connect to MCP server based on type
-        from ..models import StdioMCPServer
+    async def _async_execute(
+        self, config: MCPExecutionConfig, context: dict[str, Any], server_config: Any
+    ) -> ExecutionResult:
+        """
+        Async implementation of MCP tool execution.
 
-        if isinstance(templated_config, StdioMCPServer):
-            # STDIO server
-            import os
+        Must run on MCPIntegration's background loop. Reuses the pooled session for the
+        server (shared with toolset fetches), calls the tool, and returns formatted results.
+        """
+        from ..mcp_integration import MCPIntegration
 
-            # Merge server env vars with current environment
-            merged_env = os.environ.copy()
-            merged_env.update(templated_config.env)
+        # Apply templating to server config
+        templated_config = MCPIntegration._apply_templating_to_config(
+            server_config, context, self.template_engine
+        )
 
-            params = StdioServerParameters(
-                command=templated_config.command, args=templated_config.args, env=merged_env
-            )
-            transport_ctx = stdio_client(params)
-        else:
-            # HTTP server
-            transport_ctx = streamablehttp_client(
-                templated_config.url, headers=templated_config.headers or None
+        # Get a pooled session and call tool
+        try:
+            session = await MCPIntegration._get_or_create_session(
+                config.serverName, templated_config
             )
 
-        # Connect and call tool
-        try:
-            async with transport_ctx as context_result:
-                read, write = context_result[0], context_result[1]
-
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-
-                    # Extract properties for tool arguments
-                    tool_args = context.get("props", {})
-
-                    # Call the tool
-                    result = await session.call_tool(config.toolName, arguments=tool_args)
-
-                    # Convert MCP result to MCI ExecutionResult format
-                    content_objects = []
-                    for content_item in result.content:
-                        if content_item.type == "text":
-                            content_objects.append(TextContent(text=content_item.text))
-                        elif content_item.type == "image":
-                            from ..models import ImageContent
-
-                            content_objects.append(
-                                ImageContent(data=content_item.data, mimeType=content_item.mimeType)
-                            )
-                        elif content_item.type == "audio":
-                            from ..models import AudioContent
-
-                            content_objects.append(
-                                AudioContent(data=content_item.data, mimeType=content_item.mimeType)
-                            )
-                        else:
-                            # Default to text if type is unknown
-                            content_objects.append(TextContent(text=str(content_item)))
-
-                    # Extract jsonrpc and id if present
-                    jsonrpc_value = getattr(result, "jsonrpc", None)
-                    id_value = getattr(result, "id", None)
-
-                    return ExecutionResult(
-                        result=ExecutionResultContent(
-                            content=content_objects,
-                            isError=getattr(result, "isError", False),
-                            metadata={"mcp_server": config.serverName, "mcp_tool": config.toolName},
-                        ),
-                        jsonrpc=jsonrpc_value,
-                        id=id_value,
+            # Extract properties for tool arguments
+            tool_args = context.get("props", {})
+
+            # Call the tool
+            try:
+                result = await session.call_tool(config.toolName, arguments=tool_args)
+            except Exception as e:
+                # Keep the session for protocol errors; replace it if the connection broke
+                if MCPIntegration._is_connection_error(e):
+                    await MCPIntegration._discard_session(config.serverName, templated_config)
+                raise
+
+            # Convert MCP result to MCI ExecutionResult format
+            content_objects = []
+            for content_item in result.content:
+                if content_item.type == "text":
+                    content_objects.append(TextContent(text=content_item.text))
+                elif content_item.type == "image":
+                    from ..models import ImageContent
+
+                    content_objects.append(
+                        ImageContent(data=content_item.data, mimeType=content_item.mimeType)
+                    )
+                elif content_item.type == "audio":
+                    from ..models import AudioContent
+
+                    content_objects.append(
+                        AudioContent(data=content_item.data, mimeType=content_item.mimeType)
                     )
+                else:
+                    # Default to text if type is unknown
+                    content_objects.append(TextContent(text=str(content_item)))
+
+            # Extract jsonrpc and id if present
+            jsonrpc_value = getattr(result, "jsonrpc", None)
+            id_value = getattr(result, "id", None)
+
+            return ExecutionResult(
+                result=ExecutionResultContent(
+                    content=content_objects,
+                    isError=getattr(result, "isError", False),
+                    metadata={"mcp_server": config.serverName, "mcp_tool": config.toolName},
+                ),
+                jsonrpc=jsonrpc_value,
+                id=id_value,
+            )
 
         except Exception as e:
             raise MCPExecutorError(f"Failed to execute MCP tool '{config.toolName}': {e}") from e
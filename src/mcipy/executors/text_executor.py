@@ -10,8 +10,6 @@ from typing import Any
 from ..models import (
     ExecutionConfig,
     ExecutionResult,
-    ExecutionResultContent,
-    TextContent,
     TextExecutionConfig,
 )
 from .base import BaseExecutor
@@ -53,12 +51,7 @@ class TextExecutor(BaseExecutor):
             # Apply advanced templating to the text
             result = self.template_engine.render_advanced(config.text, context)
 
-            return ExecutionResult(
-                result=ExecutionResultContent(
-                    isError=False,
-                    content=[TextContent(text=result)],
-                )
-            )
+            return self._text_result(result)
 
         except Exception as e:
             return self._format_error(e)
@@ -6,10 +6,12 @@ fetching their tool definitions, and building MCI-compatible toolset schemas.
 """
 
 import asyncio
-import concurrent.futures
+import atexit
+import os
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .async_loop import AsyncLoopThread
 from .enums import ExecutionType
 from .models import (
     Annotations,
@@ -22,6 +24,33 @@ from .models import (
 )
 from .templating import TemplateEngine
 
+if TYPE_CHECKING:
+    from mcp import ClientSession, StdioServerParameters
+
+# MCP SDK symbols, imported once on first use by _load_mcp()
+_mcp_mods: tuple[Any, ...] | None = None
+
+
+def _load_mcp() -> tuple[type["ClientSession"], type["StdioServerParameters"], Any, Any]:
+    """
+    Import the MCP SDK symbols needed to connect to servers, caching them.
+
+    The SDK is heavy, so it is not imported at module load time. The first call
+    imports it and later calls return the cached symbols without touching the
+    import system again.
+
+    Returns:
+        Tuple of (ClientSession, StdioServerParameters, stdio_client, streamablehttp_client)
+    """
+    global _mcp_mods
+    if _mcp_mods is None:
+        from mcp import ClientSession, StdioServerParameters
+        from mcp.client.stdio import stdio_client
+        from mcp.client.streamable_http import streamablehttp_client
+
+        _mcp_mods = (ClientSession, StdioServerParameters, stdio_client, streamablehttp_client)
+    return _mcp_mods
+
 
 class MCPIntegrationError(Exception):
     """Exception raised for MCP integration errors."""
@@ -29,14 +58,104 @@ class MCPIntegrationError(Exception):
     pass
 
 
+class _PooledSession:
+    """
+    An MCP ClientSession kept open by a dedicated owner task.
+
+    The MCP transports are anyio context managers that must be exited by the same
+    task that entered them, so a single task enters the transport and session,
+    hands the initialized session back, and then waits until asked to close.
+    """
+
+    def __init__(self):
+        """Initialize an unopened pooled session."""
+        self.session: ClientSession | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stop = asyncio.Event()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the owner task has finished (session closed or failed)."""
+        return self._task is None or self._task.done()
+
+    async def open(self, transport_ctx: Any, session_cls: type["ClientSession"]) -> "ClientSession":
+        """
+        Start the owner task and wait until the session is initialized.
+
+        Args:
+            transport_ctx: Unentered MCP transport context manager (stdio or HTTP)
+            session_cls: ClientSession class to wrap the transport streams with
+
+        Returns:
+            The initialized ClientSession
+
+        Raises:
+            Exception: Any error raised while connecting or initializing
+        """
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._own(transport_ctx, session_cls, ready))
+        self.session = await ready
+        return self.session
+
+    async def close(self) -> None:
+        """Signal the owner task to exit its contexts and wait for it."""
+        self._stop.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _own(
+        self,
+        transport_ctx: Any,
+        session_cls: type["ClientSession"],
+        ready: "asyncio.Future[ClientSession]",
+    ) -> None:
+        """Owner task body: hold the transport and session open until closed."""
+        try:
+            async with transport_ctx as (read, write, *_):
+                async with session_cls(read, write) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await self._stop.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+
 class MCPIntegration:
     """
     Handles MCP server integration and toolset generation.
 
     Provides methods to fetch tools from MCP servers (STDIO and HTTP),
     build MCI-compatible toolsets, and manage toolset metadata.
+
+    Server sessions are opened on a shared background event loop and pooled by
+    server name and connection settings, so repeated fetches (e.g. on cache
+    expiry or re-parsing) reuse the same connection instead of respawning the
+    server process or redoing the HTTP handshake.
     """
 
+    # Maximum number of open sessions; the least recently used one is closed beyond this
+    MAX_POOLED_SESSIONS = 16
+
+    # Maximum number of memoized toolsets; the oldest entry is evicted beyond this
+    TOOLSET_CACHE_SIZE = 128
+
+    # Background loop that owns every pooled session
+    _loop_thread: AsyncLoopThread = AsyncLoopThread()
+
+    # Open sessions keyed by (server_name, serialized connection settings), least
+    # recently used first
+    _sessions: dict[tuple[str, str], _PooledSession] = {}
+
+    # Per-key locks so concurrent fetches for one server share a single connection
+    _session_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    # Built toolsets keyed by (server_name, serialized connection settings,
+    # serialized server options, schema_version)
+    _toolset_cache: dict[tuple[str, str, str, str], ToolsetSchema] = {}
+
     @staticmethod
     def _annotations_to_tags(mcp_annotations: Any) -> list[str]:
         """
@@ -84,9 +203,18 @@ class MCPIntegration:
         env_context: dict[str, Any],
         template_engine: TemplateEngine,
     ) -> ToolsetSchema:
-        return await MCPIntegration._async_fetch_and_build_toolset(
-            server_name, server_config, schema_version, env_context, template_engine
+        """
+        Async variant of fetch_and_build_toolset for callers already inside an event loop.
+
+        The work runs on the shared background loop (where pooled sessions live) and
+        is awaited from the caller's loop without blocking it.
+        """
+        future = MCPIntegration._loop_thread.submit(
+            MCPIntegration._async_fetch_and_build_toolset(
+                server_name, server_config, schema_version, env_context, template_engine
+            )
         )
+        return await asyncio.wrap_future(future)
 
     @staticmethod
     def fetch_and_build_toolset(
@@ -99,39 +227,210 @@ class MCPIntegration:
         """
         Sync convenience for callers.
 
-        - If NO event loop is running, use asyncio.run(...) in this thread.
-        - If a loop IS running (e.g., inside an async CLI), offload the async
-          work to a separate thread that owns its own loop, and block until it finishes.
+        Runs the async fetch on the shared background event loop and blocks until it
+        finishes. This works the same whether or not the calling thread already has
+        a running loop, and lets repeated fetches reuse open server sessions.
         """
-
-        async def _coro():
-            return await MCPIntegration.fetch_and_build_toolset_async(
-                server_name, server_config, schema_version, env_context, template_engine
+        try:
+            return MCPIntegration._loop_thread.run(
+                MCPIntegration._async_fetch_and_build_toolset(
+                    server_name, server_config, schema_version, env_context, template_engine
+                )
             )
+        except Exception as e:
+            raise MCPIntegrationError(
+                f"Failed to fetch from MCP server '{server_name}': {e}"
+            ) from e
+
+    @staticmethod
+    def close_all(timeout: float | None = None) -> None:
+        """
+        Close every pooled MCP server session.
+
+        Safe to call at any time; does nothing if no session was ever opened.
+        Sessions are reopened on demand by later fetches.
+
+        Args:
+            timeout: Optional number of seconds to wait for sessions to close
+        """
+        if not MCPIntegration._loop_thread.is_running:
+            return
+        MCPIntegration._loop_thread.run(MCPIntegration._async_close_all(), timeout)
+
+    @staticmethod
+    def clear_toolset_cache() -> None:
+        """Forget all memoized toolsets so the next fetch queries the servers again."""
+        MCPIntegration._toolset_cache.clear()
+
+    @staticmethod
+    def _get_cached_toolset(key: tuple[str, str, str, str]) -> ToolsetSchema | None:
+        """
+        Return a copy of a memoized toolset if it has not expired.
+
+        Uses the same rule as the on-disk cache in SchemaParser: a toolset is
+        fresh while its expiresAt date is after today. Expired entries are evicted.
+
+        Args:
+            key: (server_name, connection settings, server options, schema_version)
+
+        Returns:
+            Deep copy of the cached ToolsetSchema, or None on miss or expiry
+        """
+        toolset = MCPIntegration._toolset_cache.get(key)
+        if toolset is None:
+            return None
 
         try:
-            # detect running loop
-            try:
-                asyncio.get_running_loop()
-                loop_running = True
-            except RuntimeError:
-                loop_running = False
+            expires_date = datetime.fromisoformat(toolset.expiresAt or "").date()
+        except ValueError:
+            expires_date = None
 
-            if not loop_running:
-                return asyncio.run(_coro())
+        if expires_date is None or expires_date <= datetime.now(UTC).date():
+            del MCPIntegration._toolset_cache[key]
+            return None
 
-            # Run in separate thread if a loop is active
-            def _run_in_thread():
-                return asyncio.run(_coro())
+        # Callers tag and template tools in place, so never hand out the cached instance
+        return toolset.model_copy(deep=True)
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-                return ex.submit(_run_in_thread).result()
+    @staticmethod
+    async def _async_close_all() -> None:
+        """Close all pooled sessions on the background loop."""
+        pooled_sessions = list(MCPIntegration._sessions.values())
+        MCPIntegration._sessions.clear()
+        MCPIntegration._session_locks.clear()
+        await asyncio.gather(*(pooled.close() for pooled in pooled_sessions))
 
-        except Exception as e:
-            # <-- place your error handler HERE
-            raise MCPIntegrationError(
-                f"Failed to fetch from MCP server '{server_name}': {e}"
-            ) from e
+    @staticmethod
+    def _session_key(
+        server_name: str, templated_config: StdioMCPServer | HttpMCPServer
+    ) -> tuple[str, str]:
+        """
+        Build the pool key for a server session.
+
+        The key includes the templated connection settings so that a changed command,
+        URL, header, or env var gets a fresh session instead of a stale one.
+
+        Args:
+            server_name: Name of the MCP server
+            templated_config: Server configuration with templating already applied
+
+        Returns:
+            Tuple of (server_name, serialized connection settings)
+        """
+        return server_name, templated_config.model_dump_json(exclude={"config"})
+
+    @staticmethod
+    async def _get_or_create_session(
+        server_name: str, templated_config: StdioMCPServer | HttpMCPServer
+    ) -> "ClientSession":
+        """
+        Return an open session for the server, connecting only if none is pooled.
+
+        Must run on the background loop. Concurrent callers for the same server wait
+        on a per-key lock so that only one connection is made.
+
+        Args:
+            server_name: Name of the MCP server
+            templated_config: Server configuration with templating already applied
+
+        Returns:
+            Initialized MCP ClientSession
+        """
+        key = MCPIntegration._session_key(server_name, templated_config)
+        lock = MCPIntegration._session_locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            pooled = MCPIntegration._sessions.get(key)
+            if pooled is not None and pooled.session is not None and not pooled.closed:
+                # Mark as most recently used
+                MCPIntegration._sessions[key] = MCPIntegration._sessions.pop(key)
+                return pooled.session
+
+            ClientSession, StdioServerParameters, stdio_client, streamablehttp_client = _load_mcp()
+
+            # Connect to MCP server based on type
+            if isinstance(templated_config, StdioMCPServer):
+                # STDIO server
+                # Merge server env vars with current environment
+                merged_env = os.environ.copy()
+                merged_env.update(templated_config.env)
+
+                params = StdioServerParameters(
+                    command=templated_config.command, args=templated_config.args, env=merged_env
+                )
+                transport_ctx = stdio_client(params)
+            else:
+                # HTTP server
+                transport_ctx = streamablehttp_client(
+                    templated_config.url, headers=templated_config.headers or None
+                )
+
+            pooled = _PooledSession()
+            session = await pooled.open(transport_ctx, ClientSession)
+            MCPIntegration._sessions.pop(key, None)
+            MCPIntegration._sessions[key] = pooled
+
+        await MCPIntegration._evict_sessions()
+        return session
+
+    @staticmethod
+    async def _evict_sessions() -> None:
+        """
+        Close least recently used sessions beyond MAX_POOLED_SESSIONS.
+
+        Each distinct templated config (e.g. a rotated token) gets its own session, so
+        without a bound stale server processes would stay alive until exit. Evicted
+        sessions take their lock and memoized toolsets with them, and locks left
+        behind by failed connections are dropped as well.
+        """
+        evicted: list[_PooledSession] = []
+        while len(MCPIntegration._sessions) > MCPIntegration.MAX_POOLED_SESSIONS:
+            key = next(iter(MCPIntegration._sessions))
+            evicted.append(MCPIntegration._sessions.pop(key))
+            for toolset_key in [k for k in MCPIntegration._toolset_cache if k[:2] == key]:
+                del MCPIntegration._toolset_cache[toolset_key]
+
+        for key, lock in list(MCPIntegration._session_locks.items()):
+            if key not in MCPIntegration._sessions and not lock.locked():
+                del MCPIntegration._session_locks[key]
+
+        await asyncio.gather(*(pooled.close() for pooled in evicted))
+
+    @staticmethod
+    async def _discard_session(
+        server_name: str, templated_config: StdioMCPServer | HttpMCPServer
+    ) -> None:
+        """Close and forget a pooled session, e.g. after a failed request."""
+        key = MCPIntegration._session_key(server_name, templated_config)
+        pooled = MCPIntegration._sessions.pop(key, None)
+        if pooled is not None:
+            await pooled.close()
+
+    @staticmethod
+    def _is_connection_error(error: BaseException) -> bool:
+        """
+        Tell whether a failed session request means the connection itself is unusable.
+
+        Protocol-level McpErrors (unknown tool, invalid arguments, ...) come from a
+        healthy server, so its session can be kept. Closed or broken streams, OS-level
+        I/O errors and the SDK's "Connection closed" error mean it must be replaced.
+
+        Args:
+            error: Exception raised by a ClientSession request
+
+        Returns:
+            True if the pooled session should be discarded
+        """
+        import anyio
+        from mcp.shared.exceptions import McpError
+        from mcp.types import CONNECTION_CLOSED
+
+        if isinstance(error, McpError):
+            return error.error.code == CONNECTION_CLOSED
+        return isinstance(
+            error,
+            (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream, OSError),
+        )
 
     @staticmethod
     async def _async_fetch_and_build_toolset(
@@ -144,112 +443,119 @@ class MCPIntegration:
         """
         Async implementation of fetch_and_build_toolset.
 
-        Connects to MCP server, fetches tools, and builds toolset schema.
+        Gets a pooled session for the MCP server, fetches tools, and builds toolset schema.
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import StdioServerParameters, stdio_client
-        from mcp.client.streamable_http import streamablehttp_client
-
         # Apply templating to server config
         templated_config = MCPIntegration._apply_templating_to_config(
             server_config, env_context, template_engine
         )
 
-        # Connect to MCP server based on type
-        if isinstance(templated_config, StdioMCPServer):
-            # STDIO server
-            import os
-
-            # Merge server env vars with current environment
-            merged_env = os.environ.copy()
-            merged_env.update(templated_config.env)
-
-            params = StdioServerParameters(
-                command=templated_config.command, args=templated_config.args, env=merged_env
-            )
-            transport_ctx = stdio_client(params)
-        else:
-            # HTTP server
-            transport_ctx = streamablehttp_client(
-                templated_config.url, headers=templated_config.headers or None
-            )
+        # Serve from the in-process memo while the previous result is still fresh
+        cache_key = (
+            *MCPIntegration._session_key(server_name, templated_config),
+            templated_config.config.model_dump_json(),
+            schema_version,
+        )
+        cached_toolset = MCPIntegration._get_cached_toolset(cache_key)
+        if cached_toolset is not None:
+            return cached_toolset
 
         # Connect and fetch tools
         try:
-            async with transport_ctx as context_result:
-                read, write = context_result[0], context_result[1]
+            session = await MCPIntegration._get_or_create_session(server_name, templated_config)
 
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
+            # List tools
+            try:
+                tools_response = await session.list_tools()
+            except Exception as e:
+                # Keep the session for protocol errors; replace it if the connection broke
+                if MCPIntegration._is_connection_error(e):
+                    await MCPIntegration._discard_session(server_name, templated_config)
+                raise
+
+            # Build MCI tools from MCP tools
+            mci_tools = [
+                MCPIntegration._convert_mcp_tool(mcp_tool, server_name)
+                for mcp_tool in tools_response.tools
+            ]
+
+            # Calculate expiration date (date only, not datetime)
+            exp_days = templated_config.config.expDays
+            expires_date = datetime.now(UTC).date() + timedelta(days=exp_days)
+
+            # Build toolset schema with proper metadata
+            metadata = Metadata(name=server_name, description=f"MCP server: {server_name}")
+
+            toolset = ToolsetSchema(
+                schemaVersion=schema_version,
+                metadata=metadata,
+                tools=mci_tools,
+                expiresAt=expires_date.isoformat(),  # YYYY-MM-DD format
+            )
 
-                    # List tools
-                    tools_response = await session.list_tools()
-
-                    # Build MCI tools from MCP tools
-                    mci_tools = []
-                    for mcp_tool in tools_response.tools:
-                        # Convert MCP tool to MCI tool format
-                        input_schema = None
-                        if mcp_tool.inputSchema:
-                            # Convert to dict - inputSchema is already a dict
-                            input_schema = mcp_tool.inputSchema
-
-                        # Capture annotations from MCP tool
-                        annotations = Annotations()
-                        if mcp_tool.annotations:
-                            # Copy annotation fields from MCP to MCI
-                            annotations.title = mcp_tool.annotations.title
-                            annotations.readOnlyHint = mcp_tool.annotations.readOnlyHint
-                            annotations.destructiveHint = mcp_tool.annotations.destructiveHint
-                            annotations.idempotentHint = mcp_tool.annotations.idempotentHint
-                            annotations.openWorldHint = mcp_tool.annotations.openWorldHint
-
-                            # Check for audience field (for future compatibility)
-                            # MCP ToolAnnotations doesn't currently have this field,
-                            # but we check dynamically in case it's added
-                            if hasattr(mcp_tool.annotations, "audience"):
-                                audience_value = getattr(mcp_tool.annotations, "audience", None)
-                                if audience_value:
-                                    annotations.audience = audience_value
-
-                        # Convert annotations to tags
-                        tags = MCPIntegration._annotations_to_tags(mcp_tool.annotations)
-
-                        mci_tool = Tool(
-                            name=mcp_tool.name,
-                            description=mcp_tool.description or "",
-                            annotations=annotations,
-                            inputSchema=input_schema,
-                            tags=tags,
-                            execution=MCPExecutionConfig(
-                                type=ExecutionType.MCP,
-                                serverName=server_name,
-                                toolName=mcp_tool.name,
-                            ),
-                        )
-                        mci_tools.append(mci_tool)
-
-                    # Calculate expiration date (date only, not datetime)
-                    exp_days = templated_config.config.expDays
-                    expires_date = (datetime.now(UTC) + timedelta(days=exp_days)).date()
-
-                    # Build toolset schema with proper metadata
-                    metadata = Metadata(name=server_name, description=f"MCP server: {server_name}")
-
-                    toolset = ToolsetSchema(
-                        schemaVersion=schema_version,
-                        metadata=metadata,
-                        tools=mci_tools,
-                        expiresAt=expires_date.isoformat(),  # YYYY-MM-DD format
-                    )
-
-                    return toolset
+            if len(MCPIntegration._toolset_cache) >= MCPIntegration.TOOLSET_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del MCPIntegration._toolset_cache[next(iter(MCPIntegration._toolset_cache))]
+            MCPIntegration._toolset_cache[cache_key] = toolset.model_copy(deep=True)
+            return toolset
 
         except Exception as e:
             raise MCPIntegrationError(
                 f"Failed to connect to MCP server '{server_name}': {e}"
             ) from e
 
+    @staticmethod
+    def _convert_mcp_tool(mcp_tool: Any, server_name: str) -> Tool:
+        """
+        Convert an MCP tool definition to an MCI Tool.
+
+        Args:
+            mcp_tool: Tool object from the MCP server's list_tools response
+            server_name: Name of the MCP server the tool belongs to
+
+        Returns:
+            MCI Tool with MCP execution config, annotations, and derived tags
+        """
+        # Convert MCP tool to MCI tool format
+        input_schema = None
+        if mcp_tool.inputSchema:
+            # Convert to dict - inputSchema is already a dict
+            input_schema = mcp_tool.inputSchema
+
+        # Capture annotations from MCP tool
+        annotations = Annotations()
+        if mcp_tool.annotations:
+            # Copy annotation fields from MCP to MCI
+            annotations.title = mcp_tool.annotations.title
+            annotations.readOnlyHint = mcp_tool.annotations.readOnlyHint
+            annotations.destructiveHint = mcp_tool.annotations.destructiveHint
+            annotations.idempotentHint = mcp_tool.annotations.idempotentHint
+            annotations.openWorldHint = mcp_tool.annotations.openWorldHint
+
+            # Check for audience field (for future compatibility)
+            # MCP ToolAnnotations doesn't currently have this field,
+            # but we check dynamically in case it's added
+            if hasattr(mcp_tool.annotations, "audience"):
+                audience_value = getattr(mcp_tool.annotations, "audience", None)
+                if audience_value:
+                    annotations.audience = audience_value
+
+        # Convert annotations to tags
+        tags = MCPIntegration._annotations_to_tags(mcp_tool.annotations)
+
+        return Tool(
+            name=mcp_tool.name,
+            description=mcp_tool.description or "",
+            annotations=annotations,
+            inputSchema=input_schema,
+            tags=tags,
+            execution=MCPExecutionConfig(
+                type=ExecutionType.MCP,
+                serverName=server_name,
+                toolName=mcp_tool.name,
+            ),
+        )
+
     @staticmethod
     def _apply_templating_to_config(
         server_config: StdioMCPServer | HttpMCPServer,
@@ -299,3 +605,6 @@ class MCPIntegration:
             return HttpMCPServer(
                 url=templated_url, headers=templated_headers, config=server_config.config
             )
+
+
+atexit.register(MCPIntegration.close_all, 5.0)
@@ -10,13 +10,26 @@ providing strong typing, validation, and schema enforcement for:
 - Execution results
 """
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Discriminator, Field, PrivateAttr, Tag, field_validator
 
 from .enums import ExecutionType
 
 
+def _type_tag_route(value: Any) -> str:
+    """
+    Route union input by whether it carries a "type" tag.
+
+    Tagged input is dispatched straight to the matching model; untagged input
+    falls back to Pydantic's smart union matching, which fills in each model's
+    default type (as unions did before they were discriminated).
+    """
+    if isinstance(value, dict):
+        return "tagged" if "type" in value else "untagged"
+    return "tagged" if hasattr(value, "type") else "untagged"
+
+
 class Metadata(BaseModel):
     """
     Optional metadata for an MCI schema.
@@ -35,7 +48,7 @@ class Metadata(BaseModel):
 class ApiKeyAuth(BaseModel):
     """API Key authentication configuration."""
 
-    type: str = Field(default="apiKey")
+    type: Literal["apiKey"] = "apiKey"
     in_: str = Field(alias="in")  # "header" or "query"
     name: str
     value: str
@@ -44,14 +57,14 @@ class ApiKeyAuth(BaseModel):
 class BearerAuth(BaseModel):
     """Bearer token authentication configuration."""
 
-    type: str = Field(default="bearer")
+    type: Literal["bearer"] = "bearer"
     token: str
 
 
 class BasicAuth(BaseModel):
     """Basic authentication configuration."""
 
-    type: str = Field(default="basic")
+    type: Literal["basic"] = "basic"
     username: str
     password: str
 
@@ -59,7 +72,7 @@ class BasicAuth(BaseModel):
 class OAuth2Auth(BaseModel):
     """OAuth2 authentication configuration."""
 
-    type: str = Field(default="oauth2")
+    type: Literal["oauth2"] = "oauth2"
     flow: str  # "clientCredentials", etc.
     tokenUrl: str
     clientId: str
@@ -67,7 +80,17 @@ class OAuth2Auth(BaseModel):
     scopes: list[str] | None = None
 
 
-AuthConfig = ApiKeyAuth | BearerAuth | BasicAuth | OAuth2Auth
+# Tagged on "type" so validation dispatches straight to the matching model;
+# input without a type is matched against each model as before
+AuthConfig = Annotated[
+    Annotated[
+        ApiKeyAuth | BearerAuth | BasicAuth | OAuth2Auth,
+        Field(discriminator="type"),
+        Tag("tagged"),
+    ]
+    | Annotated[ApiKeyAuth | BearerAuth | BasicAuth | OAuth2Auth, Tag("untagged")],
+    Discriminator(_type_tag_route),
+]
 
 
 class RetryConfig(BaseModel):
@@ -103,7 +126,7 @@ class HTTPExecutionConfig(ExecutionConfig):
     authentication, query parameters, body, timeout, and retry logic.
     """
 
-    type: ExecutionType = Field(default=ExecutionType.HTTP)
+    type: Literal[ExecutionType.HTTP] = ExecutionType.HTTP  # pyright: ignore[reportIncompatibleVariableOverride]
     method: str = Field(default="GET")
     url: str
     headers: dict[str, str] | None = None
@@ -129,7 +152,7 @@ class CLIExecutionConfig(ExecutionConfig):
     arguments, flags, working directory, and timeout.
     """
 
-    type: ExecutionType = Field(default=ExecutionType.CLI)
+    type: Literal[ExecutionType.CLI] = ExecutionType.CLI  # pyright: ignore[reportIncompatibleVariableOverride]
     command: str
     args: list[str] | None = None
     flags: dict[str, FlagConfig] | None = None
@@ -145,7 +168,7 @@ class FileExecutionConfig(ExecutionConfig):
     and whether to parse placeholders in the file content.
     """
 
-    type: ExecutionType = Field(default=ExecutionType.FILE)
+    type: Literal[ExecutionType.FILE] = ExecutionType.FILE  # pyright: ignore[reportIncompatibleVariableOverride]
     path: str
     enableTemplating: bool = Field(default=True)
 
@@ -158,7 +181,7 @@ class TextExecutionConfig(ExecutionConfig):
     placeholder substitution and returned as the result.
     """
 
-    type: ExecutionType = Field(default=ExecutionType.TEXT)
+    type: Literal[ExecutionType.TEXT] = ExecutionType.TEXT  # pyright: ignore[reportIncompatibleVariableOverride]
     text: str
 
 
@@ -171,7 +194,7 @@ class MCPExecutionConfig(ExecutionConfig):
     mcp_servers field, and toolName identifies the specific tool to call.
     """
 
-    type: ExecutionType = Field(default=ExecutionType.MCP)
+    type: Literal[ExecutionType.MCP] = ExecutionType.MCP  # pyright: ignore[reportIncompatibleVariableOverride]
     serverName: str
     toolName: str
 
@@ -209,13 +232,26 @@ class Tool(BaseModel):
     annotations: Annotations | None = None
     description: str | None = None
     inputSchema: dict[str, Any] | None = None
-    execution: (
-        HTTPExecutionConfig
-        | CLIExecutionConfig
-        | FileExecutionConfig
-        | TextExecutionConfig
-        | MCPExecutionConfig
-    )
+    execution: Annotated[
+        Annotated[
+            HTTPExecutionConfig
+            | CLIExecutionConfig
+            | FileExecutionConfig
+            | TextExecutionConfig
+            | MCPExecutionConfig,
+            Field(discriminator="type"),
+            Tag("tagged"),
+        ]
+        | Annotated[
+            HTTPExecutionConfig
+            | CLIExecutionConfig
+            | FileExecutionConfig
+            | TextExecutionConfig
+            | MCPExecutionConfig,
+            Tag("untagged"),
+        ],
+        Discriminator(_type_tag_route),
+    ]
     enableAnyPaths: bool = Field(default=False)
     directoryAllowList: list[str] = Field(default_factory=list)
     tags: list[str] = Field(default_factory=list)
@@ -292,6 +328,8 @@ class ToolsetSchema(BaseModel):
     metadata: Metadata | None = None
     tools: list[Tool]
     expiresAt: str | None = None  # ISO 8601 timestamp for MCP toolset expiration
+    # Tool name -> positions in tools, built lazily by the parser for name filters
+    _name_index: dict[str, list[int]] | None = PrivateAttr(default=None)
 
 
 class MCISchema(BaseModel):
@@ -347,7 +385,7 @@ class TextContent(BaseModel):
     Represents textual content in MCP-compatible format.
     """
 
-    type: str = Field(default="text")
+    type: Literal["text"] = "text"
     text: str
 
 
@@ -358,7 +396,7 @@ class ImageContent(BaseModel):
     Represents base64-encoded image data in MCP-compatible format.
     """
 
-    type: str = Field(default="image")
+    type: Literal["image"] = "image"
     data: str
     mimeType: str
 
@@ -370,12 +408,17 @@ class AudioContent(BaseModel):
     Represents base64-encoded audio data in MCP-compatible format.
     """
 
-    type: str = Field(default="audio")
+    type: Literal["audio"] = "audio"
     data: str
     mimeType: str
 
 
-ContentObject = TextContent | ImageContent | AudioContent
+# Tagged on "type" like AuthConfig, with the same fallback for untagged input
+ContentObject = Annotated[
+    Annotated[TextContent | ImageContent | AudioContent, Field(discriminator="type"), Tag("tagged")]
+    | Annotated[TextContent | ImageContent | AudioContent, Tag("untagged")],
+    Discriminator(_type_tag_route),
+]
 
 
 class ExecutionResultContent(BaseModel):
@@ -402,3 +445,44 @@ class ExecutionResult(BaseModel):
     result: ExecutionResultContent
     jsonrpc: str | None = Field(default=None)
     id: int | None = Field(default=None)
+
+
+__all__ = (
+    # Metadata
+    "Metadata",
+    # Authentication
+    "ApiKeyAuth",
+    "BearerAuth",
+    "BasicAuth",
+    "OAuth2Auth",
+    "AuthConfig",
+    # Execution configurations
+    "RetryConfig",
+    "HTTPBodyConfig",
+    "ExecutionConfig",
+    "HTTPExecutionConfig",
+    "FlagConfig",
+    "CLIExecutionConfig",
+    "FileExecutionConfig",
+    "TextExecutionConfig",
+    "MCPExecutionConfig",
+    # Tools and toolsets
+    "Annotations",
+    "Tool",
+    "Toolset",
+    "ToolsetSchema",
+    # MCP servers
+    "MCPServerConfig",
+    "StdioMCPServer",
+    "HttpMCPServer",
+    "MCPServer",
+    # Schema
+    "MCISchema",
+    # Execution results
+    "TextContent",
+    "ImageContent",
+    "AudioContent",
+    "ContentObject",
+    "ExecutionResultContent",
+    "ExecutionResult",
+)
@@ -12,15 +12,36 @@ MCI schema files. It handles:
 - Loading and caching MCP toolsets from MCP servers
 """
 
+import concurrent.futures
+import functools
+import hashlib
+import itertools
 import json
+import mmap
 import os
+import stat
+import tempfile
+from collections.abc import Callable
 from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any
 
+import pydantic
 import yaml
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Prefer the libyaml-backed loader; it accepts the same documents as SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from .enums import ExecutionType
 from .models import (
     CLIExecutionConfig,
@@ -33,7 +54,17 @@ from .models import (
     Tool,
     ToolsetSchema,
 )
-from .schema_config import SUPPORTED_SCHEMA_VERSIONS
+from .schema_config import SUPPORTED_SCHEMA_VERSION_SET, SUPPORTED_SCHEMA_VERSIONS
+
+# Execution type value -> config class, used by _build_execution_config
+_EXECUTION_CONFIG_TYPES: dict[str, type[ExecutionConfig]] = {
+    ExecutionType.HTTP.value: HTTPExecutionConfig,
+    ExecutionType.CLI.value: CLIExecutionConfig,
+    ExecutionType.FILE.value: FileExecutionConfig,
+    ExecutionType.TEXT.value: TextExecutionConfig,
+    ExecutionType.MCP.value: MCPExecutionConfig,
+}
+_VALID_EXECUTION_TYPES = ", ".join(_EXECUTION_CONFIG_TYPES)
 
 
 class SchemaParserError(Exception):
@@ -42,6 +73,107 @@ class SchemaParserError(Exception):
     pass
 
 
+# Suffixes that identify toolset files in a library directory
+_TOOLSET_FILE_SUFFIXES = (".mci.json", ".mci.yaml", ".mci.yml")
+
+# File extensions (lower-cased) that are decoded as YAML
+_YAML_EXTENSIONS = frozenset((".yaml", ".yml"))
+
+# JSON files at least this large are decoded from a read-only mmap when orjson is
+# available, so the raw document is never copied into a Python bytes object
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def _read_json_file(path: Path) -> Any:
+    """
+    Read and decode a JSON file.
+
+    Large files are memory-mapped and handed to orjson as a buffer, which avoids
+    holding a full copy of the file next to the decoded object. Small files, and
+    every file when orjson is not installed, are read into bytes.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+        OSError: If the file cannot be read
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def _package_version() -> str:
+    """Return the installed mci-py version, or "0" when running from a source tree."""
+    try:
+        return version("mci-py")
+    except PackageNotFoundError:
+        return "0"
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_filter_values(filter_value: str) -> frozenset[str]:
+    """
+    Parse a comma-separated filterValue into its set of trimmed, non-empty items.
+
+    Filter strings come from schema files and repeat across loads, so results are
+    memoized.
+
+    Args:
+        filter_value: Comma-separated list of tool names or tags
+
+    Returns:
+        Frozen set of filter items (empty if the value holds no items)
+    """
+    return frozenset(item for item in map(str.strip, filter_value.split(",")) if item)
+
+
+def _filter_only(
+    tools: list[Tool], names: frozenset[str], name_index: dict[str, list[int]] | None = None
+) -> list[Tool]:
+    """Keep tools whose name is in names, in toolset order, using name_index if given."""
+    if name_index is not None:
+        positions = sorted(position for name in names for position in name_index.get(name, ()))
+        return [tools[position] for position in positions]
+    return [tool for tool in tools if tool.name in names]
+
+
+def _filter_except(tools: list[Tool], names: frozenset[str]) -> list[Tool]:
+    """Drop tools whose name is in names."""
+    return [tool for tool in tools if tool.name not in names]
+
+
+def _filter_tags(tools: list[Tool], tags: frozenset[str]) -> list[Tool]:
+    """Keep tools with at least one tag in tags."""
+    return [tool for tool in tools if not tags.isdisjoint(tool.tags)]
+
+
+def _filter_without_tags(tools: list[Tool], tags: frozenset[str]) -> list[Tool]:
+    """Drop tools with any tag in tags."""
+    return [tool for tool in tools if tags.isdisjoint(tool.tags)]
+
+
+# Schema-level toolset filters by filter type. Each takes the toolset's tools and the
+# parsed filter values.
+_TOOLSET_FILTERS: dict[str, Callable[[list[Tool], frozenset[str]], list[Tool]]] = {
+    "only": _filter_only,
+    "except": _filter_except,
+    "tags": _filter_tags,
+    "withoutTags": _filter_without_tags,
+}
+
+
 class SchemaParser:
     """
     Parser for MCI schema files.
@@ -51,9 +183,15 @@ class SchemaParser:
     for strong validation and provides helpful error messages for invalid schemas.
     """
 
+    # Upper bound on threads used to load a schema's toolsets concurrently
+    TOOLSET_LOAD_WORKERS = 8
+
     @staticmethod
     def parse_file(
-        file_path: str, env_vars: dict[str, Any] | None = None, validating: bool = False
+        file_path: str,
+        env_vars: dict[str, Any] | None = None,
+        validating: bool = False,
+        cache_dir: str | None = None,
     ) -> MCISchema:
         """
         Load and validate an MCI schema file (JSON or YAML).
@@ -67,6 +205,11 @@ class SchemaParser:
             env_vars: Optional environment variables for MCP server templating
             validating: If True, perform pure schema validation without loading MCP servers,
                        toolsets, or resolving templates (default: False)
+            cache_dir: Optional directory for caching the validated schema between
+                       processes. The cache is keyed on the file's path, mtime, and size
+                       plus the pydantic and mci-py versions. Toolsets and MCP servers are
+                       still resolved on every call. Entries are stored as JSON and
+                       re-validated on load.
 
         Returns:
             Validated MCISchema object
@@ -79,27 +222,66 @@ class SchemaParser:
         path = Path(file_path)
 
         # Check if file exists
-        if not path.exists():
-            raise SchemaParserError(f"Schema file not found: {file_path}")
+        try:
+            file_stat = path.stat()
+        except FileNotFoundError:
+            raise SchemaParserError(f"Schema file not found: {file_path}") from None
+        except OSError as e:
+            raise SchemaParserError(f"Failed to read file {file_path}: {e}") from e
 
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise SchemaParserError(f"Path is not a file: {file_path}")
 
+        # Serve the validated schema from the cache when the file is unchanged
+        cache_path: Path | None = None
+        schema: MCISchema | None = None
+        if cache_dir is not None:
+            cache_path = SchemaParser._schema_cache_path(path, file_stat, cache_dir)
+            schema = SchemaParser._read_schema_cache(cache_path)
+
+        if schema is None:
+            data = SchemaParser._read_schema_data(path, file_path)
+            schema = SchemaParser._build_schema(data)
+            if cache_path is not None:
+                SchemaParser._write_schema_cache(cache_path, schema)
+
+        # Resolve toolsets and MCP servers, passing the file path for relative paths
+        return SchemaParser._resolve_sources(
+            schema, schema_file_path=file_path, env_vars=env_vars, validating=validating
+        )
+
+    @staticmethod
+    def _read_schema_data(path: Path, file_path: str) -> Any:
+        """
+        Read and decode a schema file based on its extension.
+
+        Args:
+            path: Path object for the schema file
+            file_path: Original path string (used in error messages)
+
+        Returns:
+            Decoded file content
+
+        Raises:
+            SchemaParserError: If the extension is unsupported, the file can't be read,
+                             or it contains invalid JSON/YAML
+        """
         # Determine file type by extension
-        file_extension = path.suffix.lower()
+        # Split the raw string rather than going through Path.suffix
+        file_extension = os.path.splitext(file_path)[1].lower()
 
         # Read and parse file based on extension
         try:
-            with path.open("r", encoding="utf-8") as f:
-                if file_extension == ".json":
-                    data = json.load(f)
-                elif file_extension in (".yaml", ".yml"):
-                    data = yaml.safe_load(f)
-                else:
-                    raise SchemaParserError(
-                        f"Unsupported file extension '{file_extension}'. "
-                        f"Supported extensions: .json, .yaml, .yml"
-                    )
+            if file_extension == ".json":
+                return _read_json_file(path)
+            elif file_extension in _YAML_EXTENSIONS:
+                with path.open("r", encoding="utf-8") as f:
+                    return yaml.load(f, Loader=_YamlLoader)
+            else:
+                raise SchemaParserError(
+                    f"Unsupported file extension '{file_extension}'. "
+                    f"Supported extensions: .json, .yaml, .yml"
+                )
         except json.JSONDecodeError as e:
             raise SchemaParserError(f"Invalid JSON in file {file_path}: {e}") from e
         except yaml.YAMLError as e:
@@ -107,10 +289,78 @@ class SchemaParser:
         except OSError as e:
             raise SchemaParserError(f"Failed to read file {file_path}: {e}") from e
 
-        # Parse the dictionary, passing the file path for toolset resolution
-        return SchemaParser.parse_dict(
-            data, schema_file_path=file_path, env_vars=env_vars, validating=validating
+    @staticmethod
+    def _schema_cache_path(path: Path, file_stat: os.stat_result, cache_dir: str) -> Path:
+        """
+        Build the cache file path for a schema file.
+
+        Args:
+            path: Path to the schema file
+            file_stat: Result of stat() on the schema file
+            cache_dir: Directory holding cache entries
+
+        Returns:
+            Path of the cache entry for this exact file version
+        """
+        key = "\0".join(
+            (
+                str(path.resolve()),
+                str(file_stat.st_mtime_ns),
+                str(file_stat.st_size),
+                pydantic.VERSION,
+                _package_version(),
+            )
         )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return Path(cache_dir) / f"schema_{digest}.json"
+
+    @staticmethod
+    def _read_schema_cache(cache_path: Path) -> MCISchema | None:
+        """
+        Load a cached schema, treating any unreadable or invalid entry as a miss.
+
+        Entries are plain JSON validated by Pydantic's JSON parser, so a tampered
+        entry can at worst yield a miss or a schema that passes MCISchema validation,
+        never run code.
+
+        Args:
+            cache_path: Path of the cache entry
+
+        Returns:
+            Cached MCISchema, or None on a miss
+        """
+        try:
+            return MCISchema.model_validate_json(cache_path.read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+    @staticmethod
+    def _write_schema_cache(cache_path: Path, schema: MCISchema) -> None:
+        """
+        Store a validated schema in the cache; failures are ignored.
+
+        The entry is written to a temporary file and renamed into place so that
+        concurrent readers never see a partial file.
+
+        Args:
+            cache_path: Path of the cache entry
+            schema: Validated schema, before toolsets and MCP servers are merged in
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    # Dump by alias and only explicitly set fields, so the entry
+                    # validates back into an identical schema
+                    f.write(schema.model_dump_json(by_alias=True, exclude_unset=True))
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception:
+            # Caching is best-effort; parsing already succeeded
+            pass
 
     @staticmethod
     def parse_dict(
@@ -140,6 +390,27 @@ class SchemaParser:
             SchemaParserError: If the dictionary structure is invalid,
                              schema version is unsupported, or validation fails
         """
+        schema = SchemaParser._build_schema(data)
+        return SchemaParser._resolve_sources(schema, schema_file_path, env_vars, validating)
+
+    @staticmethod
+    def _build_schema(data: Any) -> MCISchema:
+        """
+        Validate raw schema data and build the MCISchema object.
+
+        Checks required fields, the schema version, and tool definitions before
+        running Pydantic validation. Toolsets and MCP servers are not resolved here.
+
+        Args:
+            data: Decoded schema data
+
+        Returns:
+            Validated MCISchema object
+
+        Raises:
+            SchemaParserError: If the data structure is invalid,
+                             schema version is unsupported, or validation fails
+        """
         if not isinstance(data, dict):
             raise SchemaParserError(f"Expected dictionary, got {type(data).__name__}")
 
@@ -157,20 +428,45 @@ class SchemaParser:
         # Validate schema version
         SchemaParser._validate_schema_version(data["schemaVersion"])
 
-        # Validate tools if present
-        if has_tools:
-            if not isinstance(data["tools"], list):
-                raise SchemaParserError(
-                    f"Field 'tools' must be a list, got {type(data['tools']).__name__}"
-                )
-            SchemaParser._validate_tools(data["tools"])
+        if has_tools and not isinstance(data["tools"], list):
+            raise SchemaParserError(
+                f"Field 'tools' must be a list, got {type(data['tools']).__name__}"
+            )
 
-        # Use Pydantic to validate and build the schema
+        # Use Pydantic to validate and build the schema in a single pass
         try:
-            schema = MCISchema(**data)
+            schema = MCISchema.model_validate(data)
         except ValidationError as e:
+            # Re-walk the tools only on failure, to report the offending tool precisely
+            tools = data.get("tools")
+            if isinstance(tools, list):
+                SchemaParser._validate_tools(tools)
             raise SchemaParserError(f"Schema validation failed: {e}") from e
 
+        return schema
+
+    @staticmethod
+    def _resolve_sources(
+        schema: MCISchema,
+        schema_file_path: str | None,
+        env_vars: dict[str, Any] | None,
+        validating: bool,
+    ) -> MCISchema:
+        """
+        Merge tools from toolsets and MCP servers into a validated schema.
+
+        Args:
+            schema: Validated schema (modified in-place)
+            schema_file_path: Path to the schema file (for resolving relative paths)
+            env_vars: Optional environment variables for MCP server templating
+            validating: If True, only check that toolset files exist and skip MCP servers
+
+        Returns:
+            The schema with toolset and MCP tools merged in
+
+        Raises:
+            SchemaParserError: If toolsets or MCP servers cannot be loaded
+        """
         # Load toolsets if present (skip in validating mode)
         if schema.toolsets:
             if validating:
@@ -226,16 +522,19 @@ class SchemaParser:
         Raises:
             SchemaParserError: If the version is not supported
         """
+        # Common case first: a supported version string is a single hash lookup
+        if isinstance(version, str) and version in SUPPORTED_SCHEMA_VERSION_SET:
+            return
+
         if not isinstance(version, str):
             raise SchemaParserError(
                 f"Schema version must be a string, got {type(version).__name__}"
             )
 
-        if version not in SUPPORTED_SCHEMA_VERSIONS:
-            raise SchemaParserError(
-                f"Unsupported schema version '{version}'. "
-                f"Supported versions: {', '.join(SUPPORTED_SCHEMA_VERSIONS)}"
-            )
+        raise SchemaParserError(
+            f"Unsupported schema version '{version}'. "
+            f"Supported versions: {', '.join(SUPPORTED_SCHEMA_VERSIONS)}"
+        )
 
     @staticmethod
     def _validate_tools(tools: list[Any]) -> None:
@@ -243,6 +542,8 @@ class SchemaParser:
         Validate tool definitions.
 
         Ensures each tool has the required structure and valid execution configuration.
+        Only called after Pydantic rejects a schema, to turn its errors into a message
+        naming the offending tool; valid schemas are validated once by Pydantic alone.
 
         Args:
             tools: List of tool definitions
@@ -286,7 +587,10 @@ class SchemaParser:
         Build the appropriate execution config based on type.
 
         Determines the execution type and creates the corresponding
-        ExecutionConfig subclass (HTTP, CLI, File, Text, or MCP).
+        ExecutionConfig subclass (HTTP, CLI, File, Text, or MCP). Schema parsing
+        does not need this: Tool.execution is a discriminated union, so Pydantic
+        dispatches on "type" itself. It is kept to produce precise error messages
+        once Pydantic has rejected a tool.
 
         Args:
             execution: Dictionary containing execution configuration
@@ -309,31 +613,41 @@ class SchemaParser:
                 f"Execution type must be a string, got {type(exec_type).__name__}"
             )
 
-        # Map execution type to config class
-        type_map = {
-            ExecutionType.HTTP.value: HTTPExecutionConfig,
-            ExecutionType.CLI.value: CLIExecutionConfig,
-            ExecutionType.FILE.value: FileExecutionConfig,
-            ExecutionType.TEXT.value: TextExecutionConfig,
-            ExecutionType.MCP.value: MCPExecutionConfig,
-        }
-
-        # Check if type is valid
-        if exec_type not in type_map:
-            valid_types = ", ".join(type_map.keys())
+        # Look up the config class for this type
+        config_class = _EXECUTION_CONFIG_TYPES.get(exec_type)
+        if config_class is None:
             raise SchemaParserError(
-                f"Invalid execution type '{exec_type}'. Valid types: {valid_types}"
+                f"Invalid execution type '{exec_type}'. Valid types: {_VALID_EXECUTION_TYPES}"
             )
 
         # Build the config using Pydantic validation
-        config_class = type_map[exec_type]
         try:
-            config = config_class(**execution)
+            config = config_class.model_validate(execution)
         except ValidationError as e:
             raise SchemaParserError(f"Invalid {exec_type} execution config: {e}") from e
 
         return config
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _resolve_library_path(library_dir: str, schema_file_path: str | None) -> Path:
+        """
+        Resolve the library directory relative to the main schema file.
+
+        Path objects are immutable, so the resolved path is cached and reused by
+        every load of the same schema instead of re-parsing the schema file path.
+
+        Args:
+            library_dir: Library directory from the main schema
+            schema_file_path: Path to the main schema file, if parsed from a file
+
+        Returns:
+            Library directory path
+        """
+        if schema_file_path:
+            return Path(schema_file_path).parent / library_dir
+        return Path(library_dir)
+
     @staticmethod
     def _validate_toolset_existence(
         toolsets: list[Any], library_dir: str, schema_file_path: str | None
@@ -352,12 +666,7 @@ class SchemaParser:
         Raises:
             SchemaParserError: If toolset files cannot be found
         """
-        # Resolve library directory path
-        if schema_file_path:
-            base_dir = Path(schema_file_path).parent
-            lib_path = base_dir / library_dir
-        else:
-            lib_path = Path(library_dir)
+        lib_path = SchemaParser._resolve_library_path(library_dir, schema_file_path)
 
         # Check if library directory exists
         if not lib_path.exists():
@@ -366,42 +675,33 @@ class SchemaParser:
         if not lib_path.is_dir():
             raise SchemaParserError(f"Library path is not a directory: {lib_path}")
 
+        # List the library directory once; toolset lookups then probe it in memory
+        with os.scandir(lib_path) as it:
+            lib_entries = {entry.name: entry for entry in it}
+
         # Validate each toolset exists
         for toolset in toolsets:
             name = toolset.name
             # Try as directory first
-            dir_path = lib_path / name
-            if dir_path.is_dir():
-                # Check that directory has at least one .mci.json file
-                toolset_files = (
-                    list(dir_path.glob("*.mci.json"))
-                    + list(dir_path.glob("*.mci.yaml"))
-                    + list(dir_path.glob("*.mci.yml"))
-                )
-                if not toolset_files:
+            if SchemaParser._library_entry_kind(lib_path, name, lib_entries) == "dir":
+                # Check that directory has at least one toolset file, stopping at the first
+                dir_path = lib_path / name
+                with os.scandir(dir_path) as entries:
+                    has_toolset_file = any(
+                        entry.name.endswith(_TOOLSET_FILE_SUFFIXES) and entry.is_file()
+                        for entry in entries
+                    )
+                if not has_toolset_file:
                     raise SchemaParserError(
                         f"No .mci.json, .mci.yaml, or .mci.yml files found in toolset directory: {dir_path}"
                     )
                 continue
 
-            # Try as direct file
-            file_path = lib_path / name
-            if file_path.is_file():
-                continue
-
-            # Try with .mci.json extension
-            file_with_ext = lib_path / f"{name}.mci.json"
-            if file_with_ext.is_file():
-                continue
-
-            # Try with .mci.yaml extension
-            file_with_yaml = lib_path / f"{name}.mci.yaml"
-            if file_with_yaml.is_file():
-                continue
-
-            # Try with .mci.yml extension
-            file_with_yml = lib_path / f"{name}.mci.yml"
-            if file_with_yml.is_file():
+            # Try as direct file, then with each supported extension added
+            if any(
+                SchemaParser._library_entry_kind(lib_path, f"{name}{suffix}", lib_entries) == "file"
+                for suffix in ("", *_TOOLSET_FILE_SUFFIXES)
+            ):
                 continue
 
             # Toolset not found
@@ -432,12 +732,7 @@ class SchemaParser:
         """
         all_tools: list[Tool] = []
 
-        # Resolve library directory path
-        if schema_file_path:
-            base_dir = Path(schema_file_path).parent
-            lib_path = base_dir / library_dir
-        else:
-            lib_path = Path(library_dir)
+        lib_path = SchemaParser._resolve_library_path(library_dir, schema_file_path)
 
         # Check if library directory exists
         if not lib_path.exists():
@@ -446,19 +741,41 @@ class SchemaParser:
         if not lib_path.is_dir():
             raise SchemaParserError(f"Library path is not a directory: {lib_path}")
 
-        # Process each toolset
-        for toolset in toolsets:
-            # Load toolset schema
-            toolset_schema = SchemaParser._load_toolset_file(toolset.name, lib_path)
+        # List the library directory once; toolset lookups then probe it in memory
+        with os.scandir(lib_path) as it:
+            lib_entries = {entry.name: entry for entry in it}
+
+        # Load toolset files concurrently; discovery and parsing are independent per
+        # toolset and mostly I/O bound. map() yields results (and re-raises the first
+        # error) in the original order, so tool ordering stays deterministic.
+        if len(toolsets) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(SchemaParser.TOOLSET_LOAD_WORKERS, len(toolsets))
+            ) as executor:
+                load = functools.partial(
+                    SchemaParser._load_toolset_file, lib_path=lib_path, lib_entries=lib_entries
+                )
+                toolset_schemas = list(executor.map(load, [toolset.name for toolset in toolsets]))
+        else:
+            toolset_schemas = [
+                SchemaParser._load_toolset_file(toolset.name, lib_path, lib_entries)
+                for toolset in toolsets
+            ]
 
-            # Apply schema-level filter
-            filtered_tools = SchemaParser._apply_toolset_filter(
-                toolset_schema.tools, toolset.filter, toolset.filterValue
+        # Process each toolset
+        for toolset, toolset_schema in zip(toolsets, toolset_schemas, strict=True):
+            # Apply schema-level filter before copying, so tools that are filtered
+            # out are never copied out of the parse cache. Each copy is tagged with
+            # its toolset source as it is made.
+            name_index = (
+                SchemaParser._tool_name_index(toolset_schema) if toolset.filter == "only" else None
             )
-
-            # Tag each tool with its toolset source
-            for tool in filtered_tools:
-                tool.toolset_source = toolset.name
+            filtered_tools = [
+                tool.model_copy(update={"toolset_source": toolset.name}, deep=True)
+                for tool in SchemaParser._apply_toolset_filter(
+                    toolset_schema.tools, toolset.filter, toolset.filterValue, name_index
+                )
+            ]
 
             # Add to all tools
             all_tools.extend(filtered_tools)
@@ -466,7 +783,9 @@ class SchemaParser:
         return all_tools
 
     @staticmethod
-    def _load_toolset_file(name: str, lib_path: Path) -> ToolsetSchema:
+    def _load_toolset_file(
+        name: str, lib_path: Path, lib_entries: dict[str, os.DirEntry[str]] | None = None
+    ) -> ToolsetSchema:
         """
         Load a toolset file from the library directory.
 
@@ -478,70 +797,189 @@ class SchemaParser:
         Args:
             name: Name of the toolset (directory, file, or bare prefix)
             lib_path: Path to the library directory
+            lib_entries: Optional os.scandir() listing of lib_path keyed by entry name;
+                when given, candidates are looked up in it instead of stat'ed one by one
 
         Returns:
-            Parsed ToolsetSchema
+            Parsed ToolsetSchema whose tools are shared with the parse cache; callers
+            must copy any tool before mutating it
 
         Raises:
             SchemaParserError: If toolset file cannot be found or loaded
         """
         # Try as directory first
         dir_path = lib_path / name
-        if dir_path.is_dir():
-            # Load all .mci.json files in directory
-            toolset_files = list(dir_path.glob("*.mci.json"))
+        if SchemaParser._library_entry_kind(lib_path, name, lib_entries) == "dir":
+            # Load all .mci.json files in directory. A single scandir pass avoids a
+            # Path per entry and lets each file's stat feed the parse cache key.
+            with os.scandir(dir_path) as entries:
+                toolset_files = [
+                    (Path(entry.path), entry.stat())
+                    for entry in entries
+                    if entry.name.endswith(".mci.json") and entry.is_file()
+                ]
             if not toolset_files:
                 raise SchemaParserError(
                     f"No .mci.json files found in toolset directory: {dir_path}"
                 )
-            # Merge tools from all files. Metadata is not merged (documentation only). Schema version validated for compatibility.
-            all_tools: list[Tool] = []
-            schema_version = None
-            for toolset_file in toolset_files:
-                schema = SchemaParser._parse_toolset_file(toolset_file)
-                all_tools.extend(schema.tools)
-                # Validate schema version consistency across all files in directory
-                if schema_version is None:
-                    schema_version = schema.schemaVersion
-                elif schema.schemaVersion != schema_version:
-                    raise SchemaParserError(
-                        f"Schema version mismatch in toolset directory '{dir_path}': "
-                        f"File '{toolset_file.name}' has schemaVersion '{schema.schemaVersion}', "
-                        f"but expected '{schema_version}' (from first file in directory). "
-                        f"All files in a toolset directory must use the same schema version."
-                    )
-
-            # Return combined schema with only tools (no metadata from toolset files)
-            return ToolsetSchema(
-                schemaVersion=schema_version or "1.0",
-                metadata=None,  # Don't merge metadata from toolset files
-                tools=all_tools,
+            # Merge tools from all files; the merged schema is cached per set of
+            # file versions, so an unchanged directory is assembled only once
+            return SchemaParser._merge_toolset_directory(
+                str(dir_path),
+                tuple(
+                    (os.path.abspath(toolset_file), file_stat.st_mtime_ns, file_stat.st_size)
+                    for toolset_file, file_stat in toolset_files
+                ),
             )
 
-        # Try as direct file
-        file_path = lib_path / name
-        if file_path.is_file():
-            return SchemaParser._parse_toolset_file(file_path)
+        # Try as direct file, then with each supported extension added
+        for candidate in (name, *(f"{name}{suffix}" for suffix in _TOOLSET_FILE_SUFFIXES)):
+            if SchemaParser._library_entry_kind(lib_path, candidate, lib_entries) == "file":
+                return SchemaParser._parse_toolset_file_shared(lib_path / candidate)
 
-        # Try with .mci.json extension
-        file_with_ext = lib_path / f"{name}.mci.json"
-        if file_with_ext.is_file():
-            return SchemaParser._parse_toolset_file(file_with_ext)
+        raise SchemaParserError(
+            f"Toolset not found: {name}. Looked for directory, file, or file with .mci.json/.mci.yaml/.mci.yml extension in {lib_path}"
+        )
 
-        # Try with .mci.yaml extension
-        file_with_yaml = lib_path / f"{name}.mci.yaml"
-        if file_with_yaml.is_file():
-            return SchemaParser._parse_toolset_file(file_with_yaml)
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _merge_toolset_directory(
+        dir_path: str, file_versions: tuple[tuple[str, int, int], ...]
+    ) -> ToolsetSchema:
+        """
+        Merge the toolset files of a directory into one schema; memoized per file versions.
 
-        # Try with .mci.yml extension
-        file_with_yml = lib_path / f"{name}.mci.yml"
-        if file_with_yml.is_file():
-            return SchemaParser._parse_toolset_file(file_with_yml)
+        Metadata is not merged (documentation only). Schema versions must agree
+        across all files. The result is shared and must not be mutated.
 
-        raise SchemaParserError(
-            f"Toolset not found: {name}. Looked for directory, file, or file with .mci.json/.mci.yaml/.mci.yml extension in {lib_path}"
+        Args:
+            dir_path: Toolset directory (used in error messages)
+            file_versions: (absolute path, mtime_ns, size) for each toolset file
+
+        Returns:
+            Shared ToolsetSchema holding the tools of every file
+
+        Raises:
+            SchemaParserError: If a file cannot be parsed or schema versions differ
+        """
+        per_file_tools: list[list[Tool]] = []
+        schema_version = None
+        for path_str, mtime_ns, size in file_versions:
+            schema = SchemaParser._parse_toolset_file_version(path_str, mtime_ns, size)
+            per_file_tools.append(schema.tools)
+            # Validate schema version consistency across all files in directory
+            if schema_version is None:
+                schema_version = schema.schemaVersion
+            elif schema.schemaVersion != schema_version:
+                raise SchemaParserError(
+                    f"Schema version mismatch in toolset directory '{dir_path}': "
+                    f"File '{os.path.basename(path_str)}' has schemaVersion '{schema.schemaVersion}', "
+                    f"but expected '{schema_version}' (from first file in directory). "
+                    f"All files in a toolset directory must use the same schema version."
+                )
+
+        # Return combined schema with only tools (no metadata from toolset files).
+        # Every tool was already validated by _parse_toolset_file, so skip validation.
+        return ToolsetSchema.model_construct(
+            schemaVersion=schema_version or "1.0",
+            metadata=None,  # Don't merge metadata from toolset files
+            tools=list(itertools.chain.from_iterable(per_file_tools)),
         )
 
+    @staticmethod
+    def _library_entry_kind(
+        lib_path: Path, candidate: str, lib_entries: dict[str, os.DirEntry[str]] | None
+    ) -> str | None:
+        """
+        Report whether lib_path/candidate is a directory, a file, or missing.
+
+        Uses the scandir listing when one is given and candidate is a plain entry
+        name; nested names (containing a path separator) and "."/".." fall back to
+        stat'ing the path. The listing is keyed by exact name, so a name that only
+        matches an entry case-insensitively is also stat'ed, leaving the filesystem
+        to decide (macOS and Windows match such names by default).
+
+        Args:
+            lib_path: Path to the library directory
+            candidate: Entry name (or relative path) to look up
+            lib_entries: Optional os.scandir() listing of lib_path keyed by entry name
+
+        Returns:
+            "dir", "file", or None if the entry does not exist or is neither
+        """
+        if (
+            lib_entries is not None
+            and os.sep not in candidate
+            and not (os.altsep and os.altsep in candidate)
+            and candidate not in (os.curdir, os.pardir)
+        ):
+            entry = lib_entries.get(candidate)
+            if entry is not None:
+                if entry.is_dir():
+                    return "dir"
+                return "file" if entry.is_file() else None
+            folded = candidate.casefold()
+            if not any(entry_name.casefold() == folded for entry_name in lib_entries):
+                return None
+
+        path = lib_path / candidate
+        if path.is_dir():
+            return "dir"
+        return "file" if path.is_file() else None
+
+    @staticmethod
+    def _parse_toolset_file_shared(
+        file_path: Path, file_stat: os.stat_result | None = None
+    ) -> ToolsetSchema:
+        """
+        Return the process-wide cached parse of a toolset file without copying it.
+
+        The returned schema and its tools are shared between callers and must not be
+        mutated; copy the tools that are kept before tagging or executing them.
+
+        Args:
+            file_path: Path to the toolset file
+            file_stat: Optional stat() result for the file, to avoid a second stat
+
+        Returns:
+            Shared, read-only ToolsetSchema
+
+        Raises:
+            SchemaParserError: If file cannot be parsed or is invalid
+        """
+        if file_stat is None:
+            try:
+                file_stat = file_path.stat()
+            except OSError as e:
+                raise SchemaParserError(f"Failed to read toolset file {file_path}: {e}") from e
+
+        return SchemaParser._parse_toolset_file_version(
+            os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_toolset_file_version(
+        path_str: str,
+        mtime_ns: int,  # pyright: ignore[reportUnusedParameter]
+        size: int,  # pyright: ignore[reportUnusedParameter]
+    ) -> ToolsetSchema:
+        """
+        Parse one version of a toolset file; results are memoized per (path, mtime, size).
+
+        The cached instance is shared and must never be mutated; callers copy the
+        tools they keep (see _parse_toolset_file_shared).
+
+        Args:
+            path_str: Absolute path to the toolset file
+            mtime_ns: File modification time in nanoseconds (cache key only)
+            size: File size in bytes (cache key only)
+
+        Returns:
+            Parsed ToolsetSchema
+        """
+        return SchemaParser._parse_toolset_file(Path(path_str))
+
     @staticmethod
     def _parse_toolset_file(file_path: Path) -> ToolsetSchema:
         """
@@ -561,16 +999,16 @@ class SchemaParser:
 
         # Read and parse file
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                if file_extension == ".json":
-                    data = json.load(f)
-                elif file_extension in (".yaml", ".yml"):
-                    data = yaml.safe_load(f)
-                else:
-                    raise SchemaParserError(
-                        f"Unsupported toolset file extension '{file_extension}'. "
-                        f"Supported extensions: .json, .yaml, .yml"
-                    )
+            if file_extension == ".json":
+                data = _read_json_file(file_path)
+            elif file_extension in _YAML_EXTENSIONS:
+                with file_path.open("r", encoding="utf-8") as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
+            else:
+                raise SchemaParserError(
+                    f"Unsupported toolset file extension '{file_extension}'. "
+                    f"Supported extensions: .json, .yaml, .yml"
+                )
         except json.JSONDecodeError as e:
             raise SchemaParserError(f"Invalid JSON in toolset file {file_path}: {e}") from e
         except yaml.YAMLError as e:
@@ -600,19 +1038,46 @@ class SchemaParser:
             raise SchemaParserError(
                 f"Toolset file {file_path} field 'tools' must be a list, got {type(data['tools']).__name__}"
             )
-        SchemaParser._validate_tools(data["tools"])
 
-        # Parse with Pydantic
+        # Parse with Pydantic in a single pass
         try:
-            schema = ToolsetSchema(**data)
+            schema = ToolsetSchema.model_validate(data)
         except ValidationError as e:
+            # Re-walk the tools only on failure, to report the offending tool precisely
+            SchemaParser._validate_tools(data["tools"])
             raise SchemaParserError(f"Toolset file {file_path} validation failed: {e}") from e
 
         return schema
 
+    @staticmethod
+    def _tool_name_index(toolset_schema: ToolsetSchema) -> dict[str, list[int]]:
+        """
+        Return the tool name -> positions index of a toolset, building it on first use.
+
+        The index is stored on the schema, so toolsets served from the parse cache
+        build it once for every later load. Concurrent first builds are harmless:
+        each produces the same index and the last assignment wins.
+
+        Args:
+            toolset_schema: Toolset whose tools list is not mutated after parsing
+
+        Returns:
+            Mapping of tool name to its positions in toolset_schema.tools
+        """
+        index = toolset_schema._name_index  # pyright: ignore[reportPrivateUsage]
+        if index is None:
+            index = {}
+            for position, tool in enumerate(toolset_schema.tools):
+                index.setdefault(tool.name, []).append(position)
+            toolset_schema._name_index = index  # pyright: ignore[reportPrivateUsage]
+        return index
+
     @staticmethod
     def _apply_toolset_filter(
-        tools: list[Tool], filter_type: str | None, filter_value: str | None
+        tools: list[Tool],
+        filter_type: str | None,
+        filter_value: str | None,
+        name_index: dict[str, list[int]] | None = None,
     ) -> list[Tool]:
         """
         Apply schema-level filtering to toolset tools.
@@ -621,6 +1086,8 @@ class SchemaParser:
             tools: List of tools from the toolset
             filter_type: Type of filter ("only", "except", "tags", "withoutTags", or None)
             filter_value: Comma-separated list of tool names or tags
+            name_index: Optional tool name -> positions index for tools (see
+                _tool_name_index), letting "only" pick its tools without a full scan
 
         Returns:
             Filtered list of Tool objects
@@ -638,38 +1105,22 @@ class SchemaParser:
                 f"Filter type '{filter_type}' specified but filterValue is missing"
             )
 
-        # Parse filter value (comma-separated, trim whitespace)
-        filter_items = [item.strip() for item in filter_value.split(",") if item.strip()]
+        filter_items = _parse_filter_values(filter_value)
 
         if not filter_items:
             raise SchemaParserError(f"Filter value cannot be empty for filter type '{filter_type}'")
 
-        # Apply filter based on type
-        if filter_type == "only":
-            # Include only tools with names in filter_items
-            filter_set = set(filter_items)
-            return [tool for tool in tools if tool.name in filter_set]
-
-        elif filter_type == "except":
-            # Exclude tools with names in filter_items
-            filter_set = set(filter_items)
-            return [tool for tool in tools if tool.name not in filter_set]
-
-        elif filter_type == "tags":
-            # Include only tools with at least one matching tag
-            filter_set = set(filter_items)
-            return [tool for tool in tools if any(tag in filter_set for tag in tool.tags)]
-
-        elif filter_type == "withoutTags":
-            # Exclude tools with any matching tag
-            filter_set = set(filter_items)
-            return [tool for tool in tools if not any(tag in filter_set for tag in tool.tags)]
-
-        else:
+        filter_func = _TOOLSET_FILTERS.get(filter_type)
+        if filter_func is None:
             raise SchemaParserError(
                 f"Invalid filter type '{filter_type}'. Valid types: only, except, tags, withoutTags"
             )
 
+        if filter_func is _filter_only and name_index is not None:
+            filter_func = functools.partial(_filter_only, name_index=name_index)
+
+        return filter_func(tools, filter_items)
+
     @staticmethod
     def _load_mcp_servers(
         mcp_servers: dict[str, Any],
@@ -702,12 +1153,7 @@ class SchemaParser:
 
         all_tools: list[Tool] = []
 
-        # Resolve library directory path
-        if schema_file_path:
-            base_dir = Path(schema_file_path).parent
-            lib_path = base_dir / library_dir
-        else:
-            lib_path = Path(library_dir)
+        lib_path = SchemaParser._resolve_library_path(library_dir, schema_file_path)
 
         # Create mcp subdirectory if it doesn't exist
         mcp_dir = lib_path / "mcp"
@@ -722,7 +1168,7 @@ class SchemaParser:
             should_fetch = True
             if toolset_path.exists():
                 try:
-                    toolset_schema = SchemaParser._parse_toolset_file(toolset_path)
+                    toolset_schema = SchemaParser._parse_toolset_file_shared(toolset_path)
                     # Check expiration (compare dates, not datetimes)
                     if toolset_schema.expiresAt:
                         try:
@@ -731,16 +1177,18 @@ class SchemaParser:
                             today = datetime.now(UTC).date()
                             if expires_date > today:
                                 should_fetch = False
-                                # Use cached toolset
-                                filtered_tools = SchemaParser._apply_toolset_filter(
-                                    toolset_schema.tools,
-                                    server_config.config.filter,
-                                    server_config.config.filterValue,
+                                # Use cached toolset: copy and tag only the tools
+                                # that pass the filter, in a single pass
+                                all_tools.extend(
+                                    tool.model_copy(
+                                        update={"toolset_source": server_name}, deep=True
+                                    )
+                                    for tool in SchemaParser._apply_toolset_filter(
+                                        toolset_schema.tools,
+                                        server_config.config.filter,
+                                        server_config.config.filterValue,
+                                    )
                                 )
-                                # Tag each tool with its MCP server source
-                                for tool in filtered_tools:
-                                    tool.toolset_source = server_name
-                                all_tools.extend(filtered_tools)
                             else:
                                 # Cache is expired, will fetch from server
                                 should_fetch = True
@@ -770,19 +1218,17 @@ class SchemaParser:
                     with toolset_path.open("w", encoding="utf-8") as f:
                         json.dump(toolset_schema.model_dump(exclude_none=True), f, indent=2)
 
-                    # Apply filtering
-                    filtered_tools = SchemaParser._apply_toolset_filter(
-                        toolset_schema.tools,
-                        server_config.config.filter,
-                        server_config.config.filterValue,
+                    # Filter and tag with the MCP server source in a single pass; the
+                    # fetched toolset is already a private copy, so a shallow copy will do
+                    all_tools.extend(
+                        tool.model_copy(update={"toolset_source": server_name})
+                        for tool in SchemaParser._apply_toolset_filter(
+                            toolset_schema.tools,
+                            server_config.config.filter,
+                            server_config.config.filterValue,
+                        )
                     )
 
-                    # Tag each tool with its MCP server source
-                    for tool in filtered_tools:
-                        tool.toolset_source = server_name
-
-                    all_tools.extend(filtered_tools)
-
                 except Exception as e:
                     raise SchemaParserError(
                         f"Failed to fetch tools from MCP server '{server_name}': {e}"
@@ -9,5 +9,8 @@ different parser implementations can be used per schema version.
 # Supported schema versions
 SUPPORTED_SCHEMA_VERSIONS = ["1.0"]
 
+# Hash-set view of SUPPORTED_SCHEMA_VERSIONS for constant-time membership checks
+SUPPORTED_SCHEMA_VERSION_SET = frozenset(SUPPORTED_SCHEMA_VERSIONS)
+
 # Default schema version
 DEFAULT_SCHEMA_VERSION = "1.0"
@@ -10,6 +10,44 @@ advanced templating with @for, @foreach, and @if control structures.
 import re
 from typing import Any
 
+# Openers of basic ({{...}}) and JSON-native ({!!...!!}) placeholders
+_PLACEHOLDER_OPEN = "{{"
+_JSON_NATIVE_OPEN = "{!!"
+
+# Template patterns, compiled once at import rather than looked up on every render
+# {{path.to.value}} or {{path.to.value | fallback | ...}}
+_PLACEHOLDER_RE = re.compile(r"\{\{([^}]+)\}\}")
+# Exactly {!!path!!} with optional whitespace and nothing before or after
+_JSON_NATIVE_RE = re.compile(r"^\{!!\s*([^}]+?)\s*!!\}$")
+# @for(var in range(start, end)) ... @endfor
+_FOR_RE = re.compile(
+    r"@for\s*\(\s*(\w+)\s+in\s+range\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)\s*\)(.*?)@endfor", re.DOTALL
+)
+# @foreach(var in path.to.array) ... @endforeach
+_FOREACH_RE = re.compile(r"@foreach\s*\(\s*(\w+)\s+in\s+([\w.]+)\s*\)(.*?)@endforeach", re.DOTALL)
+# @if ... @endif with optional @elseif and @else
+_CONTROL_BLOCK_RE = re.compile(
+    r"@if\s*\((.*?)\)(.*?)(?:@elseif\s*\((.*?)\)(.*?))*(?:@else(.*?))?@endif", re.DOTALL
+)
+_IF_HEAD_RE = re.compile(r"@if\s*\((.*?)\)(.*)", re.DOTALL)
+_ELSEIF_HEAD_RE = re.compile(r"\s*\((.*?)\)(.*)", re.DOTALL)
+
+
+def needs_templating(value: str) -> bool:
+    """
+    Check whether a string contains any placeholder syntax.
+
+    A plain substring test, much cheaper than running the template regexes.
+    Callers can use it to skip templating (and the write-back) for literal strings.
+
+    Args:
+        value: String to check
+
+    Returns:
+        True if the string contains a {{ or {!! placeholder opener, False otherwise
+    """
+    return _PLACEHOLDER_OPEN in value or _JSON_NATIVE_OPEN in value
+
 
 class TemplateError(Exception):
     """Exception raised when template processing fails."""
@@ -31,7 +69,7 @@ class TemplateEngine:
     """
 
     # Pattern for JSON-native placeholders: {!!path!!} with optional whitespace
-    _JSON_NATIVE_PATTERN = r"^\{!!\s*([^}]+?)\s*!!\}$"
+    _JSON_NATIVE_PATTERN = _JSON_NATIVE_RE.pattern
 
     def is_json_native_placeholder(self, value: str) -> bool:
         """
@@ -50,7 +88,7 @@ class TemplateEngine:
             return False
 
         # Pattern: exactly {!! ... !!} with nothing before or after
-        return bool(re.match(self._JSON_NATIVE_PATTERN, value))
+        return _JSON_NATIVE_RE.match(value) is not None
 
     def resolve_json_native(self, placeholder: str, context: dict[str, Any]) -> Any:
         """
@@ -78,7 +116,7 @@ class TemplateEngine:
             )
 
         # Extract the path from {!! ... !!}
-        match = re.match(self._JSON_NATIVE_PATTERN, placeholder)
+        match = _JSON_NATIVE_RE.match(placeholder)
         if not match:
             raise TemplateError(f"Failed to extract path from placeholder: '{placeholder}'")
 
@@ -113,8 +151,9 @@ class TemplateEngine:
         Raises:
             TemplateError: If a placeholder cannot be resolved and no fallback is provided
         """
-        # Pattern to match {{path.to.value}} or {{path.to.value | fallback | ...}}
-        pattern = r"\{\{([^}]+)\}\}"
+        # Most config strings are literals; skip the regex scan when there is nothing to replace
+        if _PLACEHOLDER_OPEN not in template:
+            return template
 
         def replace_placeholder(match: re.Match[str]) -> str:
             full_path = match.group(1).strip()
@@ -128,7 +167,7 @@ class TemplateEngine:
                     f"Failed to resolve placeholder '{placeholder_str}': {e}"
                 ) from e
 
-        return re.sub(pattern, replace_placeholder, template)
+        return _PLACEHOLDER_RE.sub(replace_placeholder, template)
 
     def render_advanced(self, template: str, context: dict[str, Any]) -> str:
         """
@@ -269,8 +308,6 @@ class TemplateEngine:
         Returns:
             Content with @for loops expanded
         """
-        # Pattern to match @for(var in range(start, end)) ... @endfor
-        pattern = r"@for\s*\(\s*(\w+)\s+in\s+range\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)\s*\)(.*?)@endfor"
 
         def replace_for_loop(match: re.Match[str]) -> str:
             var_name = match.group(1)
@@ -296,7 +333,7 @@ class TemplateEngine:
 
             return "".join(result)
 
-        return re.sub(pattern, replace_for_loop, content, flags=re.DOTALL)
+        return _FOR_RE.sub(replace_for_loop, content)
 
     def _parse_foreach_loop(self, content: str, context: dict[str, Any]) -> str:
         """
@@ -312,8 +349,6 @@ class TemplateEngine:
         Returns:
             Content with @foreach loops expanded
         """
-        # Pattern to match @foreach(var in path.to.array) ... @endforeach
-        pattern = r"@foreach\s*\(\s*(\w+)\s+in\s+([\w.]+)\s*\)(.*?)@endforeach"
 
         def replace_foreach_loop(match: re.Match[str]) -> str:
             var_name = match.group(1)
@@ -374,7 +409,7 @@ class TemplateEngine:
 
             return "".join(result)
 
-        return re.sub(pattern, replace_foreach_loop, content, flags=re.DOTALL)
+        return _FOREACH_RE.sub(replace_foreach_loop, content)
 
     def _parse_control_blocks(self, content: str, context: dict[str, Any]) -> str:
         """
@@ -397,8 +432,6 @@ class TemplateEngine:
         Returns:
             Content with control blocks evaluated
         """
-        # Pattern to match @if ... @endif with optional @elseif and @else
-        pattern = r"@if\s*\((.*?)\)(.*?)(?:@elseif\s*\((.*?)\)(.*?))*(?:@else(.*?))?@endif"
 
         def replace_control_block(match: re.Match[str]) -> str:
             # This is a simplified version - for a full implementation,
@@ -411,7 +444,7 @@ class TemplateEngine:
             if_part = parts[0]
 
             # Extract @if condition and body
-            if_match = re.match(r"@if\s*\((.*?)\)(.*)", if_part, re.DOTALL)
+            if_match = _IF_HEAD_RE.match(if_part)
             if not if_match:
                 return full_match
 
@@ -432,7 +465,7 @@ class TemplateEngine:
             elif len(parts) > 1:
                 # Handle elseif cases
                 for elseif_part in parts[1:]:
-                    elseif_match = re.match(r"\s*\((.*?)\)(.*)", elseif_part, re.DOTALL)
+                    elseif_match = _ELSEIF_HEAD_RE.match(elseif_part)
                     if elseif_match:
                         elseif_condition = elseif_match.group(1).strip()
                         elseif_remaining = elseif_match.group(2)
@@ -451,7 +484,7 @@ class TemplateEngine:
             else:
                 return else_body
 
-        return re.sub(pattern, replace_control_block, content, flags=re.DOTALL)
+        return _CONTROL_BLOCK_RE.sub(replace_control_block, content)
 
     def _evaluate_condition(self, condition: str, context: dict[str, Any]) -> bool:
         """
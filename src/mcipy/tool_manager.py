@@ -8,8 +8,11 @@ from an MCISchema, including retrieval, filtering, and execution.
 from pathlib import Path
 from typing import Any
 
+from .enums import ExecutionType
 from .executors import ExecutorFactory
+from .executors.base import BaseExecutor
 from .models import ExecutionResult, MCISchema, Tool
+from .path_validator import PathValidator
 
 
 class ToolManagerError(Exception):
@@ -27,23 +30,82 @@ class ToolManager:
     appropriate executor based on tool configuration.
     """
 
-    def __init__(self, schema: MCISchema, schema_file_path: str | None = None):
+    __slots__ = (
+        "schema",
+        "_enabled_tools",
+        "_enabled_tool_names",
+        "_enabled_names",
+        "_enabled_tag_sets",
+        "_tag_positions",
+        "_toolset_positions",
+        "_tool_map",
+        "_required",
+        "_schema_file_path",
+        "_context_dir",
+        "_path_validators",
+        "_path_contexts",
+        "_executors",
+    )
+
+    def __init__(
+        self,
+        schema: MCISchema,
+        schema_file_path: str | None = None,
+        context_dir: Path | None = None,
+    ):
         """
         Initialize the ToolManager with an MCISchema.
 
         Args:
             schema: MCISchema containing tool definitions
             schema_file_path: Path to the schema file (for path validation context)
+            context_dir: Path validation context directory to use when schema_file_path
+                        is not given (default: None, no path validation)
         """
         self.schema = schema
-        # Create a mapping for fast tool lookup by name (excluding disabled tools)
+        # Enabled tools in schema order, computed once; every listing and filter
+        # method starts from this instead of re-checking disabled on each call.
         # Handle case where tools might be None (when only toolsets are used)
         tools_list = schema.tools if schema.tools is not None else []
-        self._tool_map: dict[str, Tool] = {
-            tool.name: tool for tool in tools_list if not tool.disabled
+        self._enabled_tools: tuple[Tool, ...] = tuple(
+            tool for tool in tools_list if not tool.disabled
+        )
+        # Enabled tool names in schema order, for name listings and membership tests
+        self._enabled_tool_names: tuple[str, ...] = tuple(tool.name for tool in self._enabled_tools)
+        self._enabled_names: frozenset[str] = frozenset(self._enabled_tool_names)
+        # Each enabled tool paired with its tags as a frozenset, for tag filtering
+        self._enabled_tag_sets: tuple[tuple[Tool, frozenset[str]], ...] = tuple(
+            (tool, frozenset(tool.tags)) for tool in self._enabled_tools
+        )
+        # Inverted index: tag -> positions in _enabled_tools of the tools carrying it
+        self._tag_positions: dict[str, list[int]] = {}
+        for position, tool in enumerate(self._enabled_tools):
+            for tag in dict.fromkeys(tool.tags):
+                self._tag_positions.setdefault(tag, []).append(position)
+        # Inverse index: toolset source -> positions in _enabled_tools of its tools
+        self._toolset_positions: dict[str, list[int]] = {}
+        for position, tool in enumerate(self._enabled_tools):
+            if tool.toolset_source is not None:
+                self._toolset_positions.setdefault(tool.toolset_source, []).append(position)
+        # Create a mapping for fast tool lookup by name (excluding disabled tools)
+        self._tool_map: dict[str, Tool] = {tool.name: tool for tool in self._enabled_tools}
+        # Required input property names per enabled tool, precomputed for execute()
+        self._required: dict[str, frozenset[str]] = {
+            name: frozenset(tool.inputSchema.get("required", ()))
+            for name, tool in self._tool_map.items()
+            if tool.inputSchema
         }
         # Store schema file path for path validation
         self._schema_file_path = schema_file_path
+        # Context directory for path validation: the directory containing the schema file
+        self._context_dir = Path(schema_file_path).parent if schema_file_path else context_dir
+        # Path validators per tool name, built on a tool's first execution, and the
+        # read-only path_validation context entries that wrap them
+        self._path_validators: dict[str, PathValidator] = {}
+        self._path_contexts: dict[str, dict[str, Any]] = {}
+        # Executors per execution type, resolved on first use; MCP executors are bound
+        # to this schema's mcp_servers, so one instance serves every MCP tool here
+        self._executors: dict[ExecutionType, BaseExecutor] = {}
 
     def get_tool(self, name: str) -> Tool | None:
         """
@@ -64,8 +126,16 @@ class ToolManager:
         Returns:
             List of all enabled Tool objects in the schema
         """
-        tools_list = self.schema.tools if self.schema.tools is not None else []
-        return [tool for tool in tools_list if not tool.disabled]
+        return list(self._enabled_tools)
+
+    def list_tool_names(self) -> list[str]:
+        """
+        List the names of all available tools (excluding disabled tools).
+
+        Returns:
+            List of enabled tool names in schema order
+        """
+        return list(self._enabled_tool_names)
 
     def filter_tools(
         self, only: list[str] | None = None, without: list[str] | None = None
@@ -84,21 +154,26 @@ class ToolManager:
         Returns:
             Filtered list of Tool objects
         """
-        # Start with only enabled tools
-        tools_list = self.schema.tools if self.schema.tools is not None else []
-        tools = [tool for tool in tools_list if not tool.disabled]
-
-        # If 'only' is specified, filter to only those tools
-        if only is not None:
-            only_set = set(only)
-            tools = [tool for tool in tools if tool.name in only_set]
-
-        # If 'without' is specified, exclude those tools
-        if without is not None:
-            without_set = set(without)
-            tools = [tool for tool in tools if tool.name not in without_set]
+        if only is None:
+            # No filters: hand back a fresh copy of the enabled tools
+            if without is None:
+                return list(self._enabled_tools)
+            without_set = frozenset(without)
+            return [tool for tool in self._enabled_tools if tool.name not in without_set]
+
+        only_set = self._enabled_names.intersection(only)
+        if not only_set:
+            return []
+        if without is None:
+            return [tool for tool in self._enabled_tools if tool.name in only_set]
 
-        return tools
+        # Both filters given: apply them in a single pass
+        without_set = frozenset(without)
+        return [
+            tool
+            for tool in self._enabled_tools
+            if tool.name in only_set and tool.name not in without_set
+        ]
 
     def tags(self, tags: list[str]) -> list[Tool]:
         """
@@ -114,19 +189,21 @@ class ToolManager:
         Returns:
             Filtered list of Tool objects that have at least one matching tag
         """
-        # Start with only enabled tools
-        tools_list = self.schema.tools if self.schema.tools is not None else []
-        tools = [tool for tool in tools_list if not tool.disabled]
-
         # Filter to tools that have at least one matching tag
         # Empty tag list should return no tools
         if not tags:
             return []
 
-        tags_set = set(tags)
-        tools = [tool for tool in tools if any(tag in tags_set for tag in tool.tags)]
+        # A single bucket is already unique and in schema order
+        if len(tags) == 1:
+            bucket = self._tag_positions.get(tags[0], ())
+            return [self._enabled_tools[position] for position in bucket]
 
-        return tools
+        # Union the index buckets of the requested tags, keeping schema order
+        positions: set[int] = set()
+        for tag in set(tags):
+            positions.update(self._tag_positions.get(tag, ()))
+        return [self._enabled_tools[position] for position in sorted(positions)]
 
     def withoutTags(self, tags: list[str]) -> list[Tool]:
         """
@@ -142,19 +219,15 @@ class ToolManager:
         Returns:
             Filtered list of Tool objects that do not have any of the specified tags
         """
-        # Start with only enabled tools
-        tools_list = self.schema.tools if self.schema.tools is not None else []
-        tools = [tool for tool in tools_list if not tool.disabled]
-
         # Filter to tools that don't have any matching tags
-        # Empty tag list should return all tools
+        # Empty tag list should return all enabled tools
         if not tags:
-            return tools
+            return list(self._enabled_tools)
 
         tags_set = set(tags)
-        tools = [tool for tool in tools if not any(tag in tags_set for tag in tool.tags)]
-
-        return tools
+        return [
+            tool for tool, tool_tags in self._enabled_tag_sets if tags_set.isdisjoint(tool_tags)
+        ]
 
     def toolsets(self, toolset_names: list[str]) -> list[Tool]:
         """
@@ -170,23 +243,17 @@ class ToolManager:
         Returns:
             Filtered list of Tool objects from the specified toolsets
         """
-        # Start with only enabled tools
-        tools_list = self.schema.tools if self.schema.tools is not None else []
-        tools = [tool for tool in tools_list if not tool.disabled]
-
         # Filter to tools from specified toolsets
         # Empty toolset list should return no tools
         if not toolset_names:
             return []
 
-        toolset_set = set(toolset_names)
-        tools = [
-            tool
-            for tool in tools
-            if tool.toolset_source is not None and tool.toolset_source in toolset_set
-        ]
-
-        return tools
+        # Union the index buckets of the requested toolsets, keeping schema order
+        positions: list[int] = []
+        for toolset_name in set(toolset_names):
+            positions.extend(self._toolset_positions.get(toolset_name, ()))
+        positions.sort()
+        return [self._enabled_tools[position] for position in positions]
 
     def execute(
         self,
@@ -234,50 +301,64 @@ class ToolManager:
             resolved_properties = properties
 
         # Build context for execution
-        context: dict[str, Any] = {
-            "props": resolved_properties,
-            "env": env_vars,
-            "input": resolved_properties,  # Alias for backward compatibility
-        }
+        context = BaseExecutor._build_context(resolved_properties, env_vars)
 
         # Build path validation context
         path_context: dict[str, Any] | None = None
-        if self._schema_file_path:
-            from .path_validator import PathValidator
-
-            # Get context directory from schema file path
-            context_dir = Path(self._schema_file_path).parent
-
-            # Merge schema and tool settings (tool takes precedence)
-            enable_any_paths, directory_allow_list = PathValidator.merge_settings(
-                schema_enable_any_paths=self.schema.enableAnyPaths,
-                schema_directory_allow_list=self.schema.directoryAllowList,
-                tool_enable_any_paths=tool.enableAnyPaths,
-                tool_directory_allow_list=tool.directoryAllowList,
-            )
-
-            # Create path validator
-            path_context = {
-                "validator": PathValidator(
-                    context_dir=context_dir,
-                    enable_any_paths=enable_any_paths,
-                    directory_allow_list=directory_allow_list,
-                )
-            }
+        if self._context_dir is not None:
+            path_context = self._path_contexts.get(tool.name)
+            if path_context is None:
+                path_context = {"validator": self._get_path_validator(tool, self._context_dir)}
+                self._path_contexts[tool.name] = path_context
 
         # Add path context to execution context
         context["path_validation"] = path_context
 
         # Get the appropriate executor based on execution type
-        executor = ExecutorFactory.get_executor(
-            tool.execution.type, mcp_servers=self.schema.mcp_servers
-        )
+        execution_type = tool.execution.type
+        executor = self._executors.get(execution_type)
+        if executor is None:
+            executor = ExecutorFactory.get_executor(
+                execution_type, mcp_servers=self.schema.mcp_servers
+            )
+            self._executors[execution_type] = executor
 
         # Execute the tool
         result = executor.execute(tool.execution, context)
 
         return result
 
+    def _get_path_validator(self, tool: Tool, context_dir: Path) -> PathValidator:
+        """
+        Return the path validator for a tool, creating and caching it on first use.
+
+        Schema and tool path settings do not change after initialization, so each
+        tool's merged settings and resolved allow-list are computed only once.
+
+        Args:
+            tool: Tool being executed (must be enabled in this manager)
+            context_dir: Directory containing the schema file
+
+        Returns:
+            PathValidator rooted at the schema file's directory
+        """
+        validator = self._path_validators.get(tool.name)
+        if validator is None:
+            # Merge schema and tool settings (tool takes precedence)
+            enable_any_paths, directory_allow_list = PathValidator.merge_settings(
+                schema_enable_any_paths=self.schema.enableAnyPaths,
+                schema_directory_allow_list=self.schema.directoryAllowList,
+                tool_enable_any_paths=tool.enableAnyPaths,
+                tool_directory_allow_list=tool.directoryAllowList,
+            )
+            validator = PathValidator(
+                context_dir=context_dir,
+                enable_any_paths=enable_any_paths,
+                directory_allow_list=directory_allow_list,
+            )
+            self._path_validators[tool.name] = validator
+        return validator
+
     def _validate_input_properties(self, tool: Tool, properties: dict[str, Any]) -> None:
         """
         Validate properties against the tool's input schema.
@@ -295,7 +376,14 @@ class ToolManager:
         if not input_schema:
             return
 
-        # Check for required properties
+        # Fast path: the precomputed required set is covered by the given properties
+        if self._tool_map.get(tool.name) is tool:
+            if self._required[tool.name].issubset(properties):
+                return
+        elif frozenset(input_schema.get("required", ())).issubset(properties):
+            return
+
+        # Report missing properties in the order the schema lists them
         required = input_schema.get("required", [])
         if required:
             missing_props = [prop for prop in required if prop not in properties]
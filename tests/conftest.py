@@ -1,13 +1,56 @@
 """
 Pytest configuration for tests.
 
-Configure anyio to use only asyncio backend (not trio).
+Configure anyio to use only asyncio backend (not trio), and provide shared helpers
+for writing schema fixtures.
 """
 
+import json
+from pathlib import Path
+from typing import Any
+
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 @pytest.fixture(scope="session")
 def anyio_backend():
     """Configure anyio to use only asyncio backend."""
     return "asyncio"
+
+
+def _dump_json(data: Any) -> bytes:
+    """Encode data as JSON bytes, using orjson when the speedups extra is installed."""
+    if orjson is None:
+        return json.dumps(data).encode()
+    return orjson.dumps(data)
+
+
+@pytest.fixture(scope="session")
+def write_json():
+    """Fixture for a helper that writes data to a path as JSON bytes."""
+
+    def write(path: Path, data: Any) -> None:
+        path.write_bytes(_dump_json(data))
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def write_json_files():
+    """Fixture for a helper that writes {relative path: data} JSON files under a root dir."""
+
+    def write(root: Path, files: dict[str, Any]) -> None:
+        created: set[Path] = set()
+        for rel_path, data in files.items():
+            path = root / rel_path
+            if path.parent not in created:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created.add(path.parent)
+            path.write_bytes(_dump_json(data))
+
+    return write
@@ -11,6 +11,14 @@ import pytest
 from mcipy import MCIClient, MCIClientError
 
 
+@pytest.fixture(scope="module")
+def example_client():
+    """Fixture for one MCIClient over example.mci.json, shared by tests that only read it."""
+    if not Path("example.mci.json").exists():
+        pytest.skip("example.mci.json not found")
+    return MCIClient(json_file_path="example.mci.json")
+
+
 class TestMCIClientFeatures:
     """Feature tests for MCIClient with realistic usage scenarios."""
 
@@ -93,13 +101,9 @@ class TestMCIClientFeatures:
         # Test 3: Multiple clients are independent
         assert len(client1.list_tools()) == len(client2.list_tools())
 
-    def test_filtering_combinations(self):
+    def test_filtering_combinations(self, example_client):
         """Test various filtering combinations."""
-        schema_path = "example.mci.json"
-        if not Path(schema_path).exists():
-            pytest.skip("example.mci.json not found")
-
-        client = MCIClient(json_file_path=schema_path)
+        client = example_client
 
         # Test empty filter lists
         assert len(client.only([])) == 0
@@ -117,13 +121,9 @@ class TestMCIClientFeatures:
         result = client.without(all_names)
         assert len(result) == 0
 
-    def test_execute_with_property_validation(self):
+    def test_execute_with_property_validation(self, example_client):
         """Test execution with property validation."""
-        schema_path = "example.mci.json"
-        if not Path(schema_path).exists():
-            pytest.skip("example.mci.json not found")
-
-        client = MCIClient(json_file_path=schema_path)
+        client = example_client
 
         # Test executing with required properties missing
         with pytest.raises(MCIClientError) as exc_info:
@@ -137,13 +137,9 @@ class TestMCIClientFeatures:
         result = client.execute("generate_message", properties={"username": "ValidUser"})
         assert result is not None
 
-    def test_get_tool_schema_for_all_tools(self):
+    def test_get_tool_schema_for_all_tools(self, example_client):
         """Test getting schema for all tools in the example file."""
-        schema_path = "example.mci.json"
-        if not Path(schema_path).exists():
-            pytest.skip("example.mci.json not found")
-
-        client = MCIClient(json_file_path=schema_path)
+        client = example_client
 
         # Get schema for each tool
         for tool_name in client.list_tools():
@@ -151,19 +147,15 @@ class TestMCIClientFeatures:
             assert isinstance(schema, dict)
             # Schema can be empty dict or have properties
 
-    def test_error_handling_comprehensive(self):
+    def test_error_handling_comprehensive(self, example_client):
         """Test comprehensive error handling."""
-        schema_path = "example.mci.json"
-        if not Path(schema_path).exists():
-            pytest.skip("example.mci.json not found")
-
         # Test 1: Nonexistent schema file
         with pytest.raises(MCIClientError) as exc_info:
             MCIClient(json_file_path="/nonexistent/path/schema.json")
         assert "Failed to load schema" in str(exc_info.value)
 
         # Test 2: Valid client, but nonexistent tool
-        client = MCIClient(json_file_path=schema_path)
+        client = example_client
 
         with pytest.raises(MCIClientError) as exc_info:
             client.execute("nonexistent_tool")
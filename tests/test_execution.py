@@ -6,8 +6,6 @@ ExecutorFactory to execution and result handling, covering all executor
 types with appropriate mocking.
 """
 
-import tempfile
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -159,16 +157,13 @@ class TestFileExecutionE2E:
         }
 
     @pytest.fixture
-    def temp_file(self):
+    def temp_file(self, tmp_path):
         """Fixture for a temporary file with template content."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            f.write("User: {{props.username}}\nRole: {{props.role}}\nCompany: {{env.COMPANY}}")
-            temp_path = f.name
-
-        yield temp_path
-
-        # Cleanup
-        Path(temp_path).unlink()
+        temp_path = tmp_path / "template.txt"
+        temp_path.write_text(
+            "User: {{props.username}}\nRole: {{props.role}}\nCompany: {{env.COMPANY}}"
+        )
+        return str(temp_path)
 
     def test_file_execution_with_templating(self, temp_file, context):
         """Test file reading with templating enabled."""
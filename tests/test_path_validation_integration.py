@@ -1,21 +1,28 @@
 """Integration tests for path validation in tool execution."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from mcipy import MCIClient
+from mcipy.executors.file_executor import FileExecutor
+from mcipy.models import FileExecutionConfig
+from mcipy.path_validator import PathValidator
+
+pytestmark = pytest.mark.security
 
 
 class TestFileExecutorPathValidation:
     """Integration tests for file executor path validation."""
 
     @pytest.fixture
-    def temp_schema_dir(self):
+    def temp_schema_dir(self, tmp_path):
         """Fixture for a temporary directory with schema file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        return schema_dir
 
     @pytest.fixture
     def schema_with_file_tool(self, temp_schema_dir):
@@ -49,9 +56,8 @@ class TestFileExecutorPathValidation:
     def schema_with_file_tool_outside_context(self, temp_schema_dir):
         """Fixture for a schema file with file execution tool referencing outside path."""
         # Create a test file OUTSIDE the schema directory
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            f.write("Outside content")
-            outside_file = Path(f.name)
+        outside_file = temp_schema_dir.parent / "outside.txt"
+        outside_file.write_text("Outside content")
 
         # Create schema
         schema = {
@@ -72,11 +78,7 @@ class TestFileExecutorPathValidation:
         import json
 
         schema_file.write_text(json.dumps(schema))
-
-        yield schema_file, outside_file
-
-        # Cleanup
-        outside_file.unlink(missing_ok=True)
+        return schema_file, outside_file
 
     def test_file_executor_allows_context_dir(self, schema_with_file_tool):
         """Test that file executor allows access to files in context directory."""
@@ -195,10 +197,11 @@ class TestCLIExecutorPathValidation:
     """Integration tests for CLI executor path validation."""
 
     @pytest.fixture
-    def temp_schema_dir(self):
+    def temp_schema_dir(self, tmp_path):
         """Fixture for a temporary directory with schema file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        return schema_dir
 
     def test_cli_executor_allows_context_dir_cwd(self, temp_schema_dir):
         """Test that CLI executor allows cwd in context directory."""
@@ -341,3 +344,184 @@ class TestCLIExecutorPathValidation:
         # Should succeed - no path validation needed
         assert result.result.isError is False
         assert result.result.content[0].text is not None and "hello" in result.result.content[0].text
+
+
+# Relative paths from safe/ that all resolve into the sibling sensitive/ directory
+DOT_SEGMENT_VARIATIONS = [
+    "../sensitive/secret.txt",
+    "./../sensitive/secret.txt",
+    "..//sensitive/secret.txt",
+    "subdir/../../sensitive/secret.txt",
+    "subdir/./../../sensitive/secret.txt",
+    "../safe/../sensitive/secret.txt",
+    "subdir/../../" + "x/../" * 3 + "sensitive/secret.txt",
+]
+
+# Case variants of a traversal; blocked on case-sensitive and case-insensitive filesystems
+CASE_VARIATIONS = [
+    "../SENSITIVE/secret.txt",
+    "../Sensitive/secret.txt",
+    "../sensitive/SECRET.TXT",
+    "../../SAFE/../sensitive/secret.txt",
+]
+
+
+# Validated once; tests copy it with their own path instead of re-validating a new config
+FILE_CONFIG_TEMPLATE = FileExecutionConfig(path="{{props.file}}", enableTemplating=False)
+
+# Shared by every traversal context; the executor and template engine only read env
+EMPTY_ENV: dict[str, str] = {}
+
+
+def _can_symlink() -> bool:
+    """Probe once whether this platform and user can create symlinks."""
+    if not hasattr(os, "symlink"):
+        return False
+    with tempfile.TemporaryDirectory() as probe_dir:
+        try:
+            os.symlink(probe_dir, Path(probe_dir) / "link")
+        except (OSError, NotImplementedError):
+            return False
+    return True
+
+
+HAS_SYMLINK = _can_symlink()
+
+# Special filesystems probed once at import so skips are decided at collection time
+HAS_DEV_NULL = os.path.exists("/dev/null")
+HAS_PROC_VERSION = os.path.exists("/proc/version")
+
+# A single path component far beyond NAME_MAX on common filesystems
+LONG_NAME = "a" * 1000 + ".txt"
+
+# Enough ../ segments to climb from any temporary directory to the filesystem root
+TO_ROOT = "../" * 32
+
+# Every payload that must be rejected as outside the context directory, in one table
+TRAVERSAL_PAYLOADS = [
+    pytest.param("../sensitive/secret.txt", id="parent"),
+    *(pytest.param(v, id=f"dot-segment-{i}") for i, v in enumerate(DOT_SEGMENT_VARIATIONS)),
+    *(pytest.param(v, id=f"case-{i}") for i, v in enumerate(CASE_VARIATIONS)),
+    pytest.param(
+        TO_ROOT + "dev/null",
+        id="device-file",
+        marks=pytest.mark.skipif(not HAS_DEV_NULL, reason="no /dev/null on this platform"),
+    ),
+    pytest.param(
+        TO_ROOT + "proc/version",
+        id="proc-filesystem",
+        marks=pytest.mark.skipif(not HAS_PROC_VERSION, reason="no /proc filesystem here"),
+    ),
+]
+
+
+def _layout(root: Path, safe_dir: Path, sensitive_dir: Path) -> dict:
+    """Describe a traversal layout, formatting the templated path under safe_dir once."""
+    return {
+        "root": root,
+        "safe": safe_dir,
+        "sensitive": sensitive_dir,
+        "template": f"{safe_dir}/{{{{props.file}}}}",
+    }
+
+
+@pytest.fixture(scope="module")
+def traversal_dirs(tmp_path_factory):
+    """Fixture for a read-only safe/sensitive directory layout shared by the module."""
+    root = tmp_path_factory.mktemp("pathtrav")
+    safe_dir = root / "safe"
+    (safe_dir / "subdir").mkdir(parents=True)
+    sensitive_dir = root / "sensitive"
+    sensitive_dir.mkdir()
+    (safe_dir / "data.txt").write_text("safe data", encoding="ascii")
+    (safe_dir / "subdir" / "nested.txt").write_text("nested data", encoding="ascii")
+    (sensitive_dir / "secret.txt").write_text("top secret", encoding="ascii")
+    return _layout(root, safe_dir, sensitive_dir)
+
+
+@pytest.fixture(scope="module")
+def file_executor():
+    """Fixture for one FileExecutor shared by the module; its caches key on path, mtime and size."""
+    return FileExecutor()
+
+
+class TestPathTraversalSecurity:
+    """Tests that templated file paths cannot escape the context directory."""
+
+    @pytest.fixture
+    def private_dirs(self, tmp_path):
+        """Fixture for a safe/sensitive layout owned by one test, for tests that add entries."""
+        safe_dir = tmp_path / "safe"
+        safe_dir.mkdir()
+        sensitive_dir = tmp_path / "sensitive"
+        sensitive_dir.mkdir()
+        (sensitive_dir / "secret.txt").write_text("top secret", encoding="ascii")
+        return _layout(tmp_path, safe_dir, sensitive_dir)
+
+    @staticmethod
+    def _read(executor: FileExecutor, dirs: dict, file_prop: str):
+        """Read {{props.file}} under the layout's safe dir with path validation enabled."""
+        config = FILE_CONFIG_TEMPLATE.model_copy(update={"path": dirs["template"]})
+        props = {"file": file_prop}
+        context = {
+            "props": props,
+            "env": EMPTY_ENV,
+            "input": props,
+            "path_validation": {"validator": PathValidator(context_dir=dirs["safe"])},
+        }
+        return executor.execute(config, context)
+
+    def test_file_in_safe_dir_allowed(self, traversal_dirs, file_executor):
+        """Test that a file inside the context directory is read."""
+        result = self._read(file_executor, traversal_dirs, "data.txt")
+
+        assert result.result.isError is False
+        assert result.result.content[0].text == "safe data"
+
+    def test_nested_file_allowed(self, traversal_dirs, file_executor):
+        """Test that a file in a subdirectory of the context directory is read."""
+        result = self._read(file_executor, traversal_dirs, "subdir/nested.txt")
+
+        assert result.result.isError is False
+        assert result.result.content[0].text == "nested data"
+
+    @pytest.mark.parametrize("payload", TRAVERSAL_PAYLOADS)
+    def test_traversal_payload_blocked(self, traversal_dirs, file_executor, payload):
+        """Test that each traversal payload is rejected before the file is read."""
+        result = self._read(file_executor, traversal_dirs, payload)
+
+        assert result.result.isError is True
+        assert "outside context directory" in result.result.content[0].text
+
+    def test_traversal_back_into_safe_dir_allowed(self, traversal_dirs, file_executor):
+        """Test that ../ segments resolving back inside the context directory are allowed."""
+        result = self._read(file_executor, traversal_dirs, "subdir/../data.txt")
+
+        assert result.result.isError is False
+        assert result.result.content[0].text == "safe data"
+
+    @pytest.mark.skipif(not HAS_SYMLINK, reason="symlinks are not supported here")
+    def test_symlink_traversal(self, private_dirs, file_executor):
+        """Test that a symlink inside the context directory cannot point outside it."""
+        (private_dirs["safe"] / "link.txt").symlink_to(private_dirs["sensitive"] / "secret.txt")
+
+        result = self._read(file_executor, private_dirs, "link.txt")
+
+        assert result.result.isError is True
+        assert "outside context directory" in result.result.content[0].text
+
+    def test_path_with_spaces_and_special_chars(self, private_dirs, file_executor):
+        """Test that a legitimate file name with spaces and punctuation is read."""
+        (private_dirs["safe"] / "my file (1) & co.txt").write_text("special", encoding="ascii")
+
+        result = self._read(file_executor, private_dirs, "my file (1) & co.txt")
+
+        assert result.result.isError is False
+        assert result.result.content[0].text == "special"
+
+    def test_very_long_path(self, traversal_dirs, file_executor):
+        """Test that an overlong file name inside the context directory fails as a read error."""
+        result = self._read(file_executor, traversal_dirs, LONG_NAME)
+
+        assert result.result.isError is True
+        assert "outside context directory" not in result.result.content[0].text
@@ -24,14 +24,15 @@ class ConcreteExecutor(BaseExecutor):
         )
 
 
+@pytest.fixture(scope="module")
+def executor():
+    """Fixture for one concrete executor shared by the module; its helpers keep no state."""
+    return ConcreteExecutor()
+
+
 class TestBaseExecutor:
     """Tests for BaseExecutor abstract class."""
 
-    @pytest.fixture
-    def executor(self):
-        """Fixture for a concrete executor instance."""
-        return ConcreteExecutor()
-
     def test_cannot_instantiate_base_executor(self):
         """Test that BaseExecutor cannot be instantiated directly."""
         with pytest.raises(TypeError, match="abstract"):
@@ -71,69 +72,61 @@ class TestBaseExecutor:
 
         assert context["input"] is context["props"]
 
-    def test_handle_timeout_default(self, executor):
-        """Test timeout handling with 0 or negative values."""
-        assert executor._handle_timeout(0) == 30
-        assert executor._handle_timeout(-100) == 30
-
-    def test_handle_timeout_conversion(self, executor):
-        """Test timeout conversion from milliseconds to seconds."""
-        # 1000ms = 1s
-        assert executor._handle_timeout(1000) == 1
-
-        # 5000ms = 5s
-        assert executor._handle_timeout(5000) == 5
-
-        # 30000ms = 30s
-        assert executor._handle_timeout(30000) == 30
-
-    def test_handle_timeout_rounding(self, executor):
-        """Test timeout rounding up."""
-        # 1ms should round up to 1s
-        assert executor._handle_timeout(1) == 1
-
-        # 500ms should round up to 1s
-        assert executor._handle_timeout(500) == 1
-
-        # 999ms should round up to 1s
-        assert executor._handle_timeout(999) == 1
-
-        # 1001ms should round up to 2s
-        assert executor._handle_timeout(1001) == 2
+    @pytest.mark.parametrize(
+        ("timeout_ms", "expected_s"),
+        [
+            pytest.param(0, 30, id="zero-uses-default"),
+            pytest.param(-100, 30, id="negative-uses-default"),
+            pytest.param(1000, 1, id="1s"),
+            pytest.param(5000, 5, id="5s"),
+            pytest.param(30000, 30, id="30s"),
+            pytest.param(1, 1, id="1ms-rounds-up"),
+            pytest.param(500, 1, id="500ms-rounds-up"),
+            pytest.param(999, 1, id="999ms-rounds-up"),
+            pytest.param(1001, 2, id="1001ms-rounds-up"),
+            pytest.param(1500, 2, id="1500ms-rounds-up"),
+        ],
+    )
+    def test_handle_timeout(self, executor, timeout_ms, expected_s):
+        """Test timeout conversion from milliseconds to whole seconds, rounding up."""
+        assert executor._handle_timeout(timeout_ms) == expected_s
+
+    def test_text_result_matches_validated_model(self, executor):
+        """Test that _text_result builds the same result as validated construction."""
+        from mcipy.models import ExecutionResultContent, TextContent
 
-        # 1500ms should round up to 2s
-        assert executor._handle_timeout(1500) == 2
+        result = executor._text_result("hello", metadata={"exit_code": 0})
+        expected = ExecutionResult(
+            result=ExecutionResultContent(
+                isError=False,
+                content=[TextContent(text="hello")],
+                metadata={"exit_code": 0},
+            )
+        )
 
-    def test_format_error_basic(self, executor):
-        """Test error formatting with a basic exception."""
-        error = Exception("Something went wrong")
+        assert isinstance(result, ExecutionResult)
+        assert result.model_dump() == expected.model_dump()
+        assert result.model_dump_json() == expected.model_dump_json()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            Exception("Something went wrong"),
+            ValueError("Invalid value"),
+            TypeError("Wrong type"),
+            RuntimeError("Runtime issue"),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    def test_format_error(self, executor, error):
+        """Test error formatting for different exception types."""
         result = executor._format_error(error)
 
         assert isinstance(result, ExecutionResult)
         assert result.result.isError is True
-        assert result.result.content[0].text == "Something went wrong"
+        assert result.result.content[0].text == str(error)
         assert result.result.content[0].type == "text"
 
-    def test_format_error_different_types(self, executor):
-        """Test error formatting with different exception types."""
-        # ValueError
-        error1 = ValueError("Invalid value")
-        result1 = executor._format_error(error1)
-        assert result1.result.isError is True
-        assert result1.result.content[0].text == "Invalid value"
-
-        # TypeError
-        error2 = TypeError("Wrong type")
-        result2 = executor._format_error(error2)
-        assert result2.result.isError is True
-        assert result2.result.content[0].text == "Wrong type"
-
-        # RuntimeError
-        error3 = RuntimeError("Runtime issue")
-        result3 = executor._format_error(error3)
-        assert result3.result.isError is True
-        assert result3.result.content[0].text == "Runtime issue"
-
     def test_execute_returns_result(self, executor):
         """Test that execute method returns ExecutionResult."""
         config = ExecutionConfig(type=ExecutionType.TEXT)
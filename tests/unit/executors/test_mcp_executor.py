@@ -0,0 +1,266 @@
+"""Unit tests for MCPExecutor class."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, ErrorData
+
+from mcipy.executors.mcp_executor import MCPExecutor
+from mcipy.mcp_integration import MCPIntegration
+from mcipy.models import HttpMCPServer, MCPExecutionConfig, StdioMCPServer, TextExecutionConfig
+
+
+class _FakeSession:
+    """Stand-in for mcp.ClientSession that records lifecycle and tool calls."""
+
+    instances: list["_FakeSession"] = []
+
+    def __init__(self, read, write):
+        self.initialize = AsyncMock()
+        self.call_tool = AsyncMock(
+            return_value=SimpleNamespace(
+                content=[SimpleNamespace(type="text", text="pong")], isError=False
+            )
+        )
+        self.exited = False
+        _FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.exited = True
+
+
+@pytest.fixture
+def fake_mcp():
+    """Patch the MCP SDK loader with fakes and reset the session pool around each test."""
+    _FakeSession.instances = []
+    transports_opened: list[str] = []
+
+    @asynccontextmanager
+    async def fake_transport(target, **_kwargs):
+        transports_opened.append(str(target))
+        yield MagicMock(), MagicMock(), None
+
+    with patch(
+        "mcipy.mcp_integration._load_mcp",
+        return_value=(_FakeSession, MagicMock(), fake_transport, fake_transport),
+    ):
+        yield transports_opened
+    MCPIntegration.close_all()
+
+
+def _context(**props):
+    return {"props": props, "env": {}, "input": props}
+
+
+class TestMCPExecutor:
+    """Tests for MCPExecutor class."""
+
+    @pytest.fixture
+    def executor(self):
+        """Fixture for an MCPExecutor with one HTTP and one STDIO server."""
+        return MCPExecutor(
+            {
+                "web": HttpMCPServer(url="http://localhost:9999/mcp"),
+                "local": StdioMCPServer(command="fake-server"),
+            }
+        )
+
+    def test_execute_server_not_registered(self, executor):
+        """Test that calling an unknown server returns an error result."""
+        config = MCPExecutionConfig(serverName="missing", toolName="ping")
+
+        result = executor.execute(config, _context())
+
+        assert result.result.isError is True
+        assert "not registered" in result.result.content[0].text
+
+    def test_execute_invalid_config_type(self, executor):
+        """Test that a non-MCP config returns an error result."""
+        result = executor.execute(TextExecutionConfig(text="hi"), _context())
+
+        assert result.result.isError is True
+        assert "Invalid config type" in result.result.content[0].text
+
+    def test_execute_returns_tool_content(self, executor, fake_mcp):
+        """Test that the tool result is converted to MCI content with MCP metadata."""
+        config = MCPExecutionConfig(serverName="web", toolName="ping")
+
+        result = executor.execute(config, _context(message="hi"))
+
+        assert result.result.isError is False
+        assert result.result.content[0].text == "pong"
+        assert result.result.metadata == {"mcp_server": "web", "mcp_tool": "ping"}
+        _FakeSession.instances[0].call_tool.assert_awaited_once_with(
+            "ping", arguments={"message": "hi"}
+        )
+
+    def test_repeated_execute_reuses_session(self, executor, fake_mcp):
+        """Test that executing twice on one server connects and initializes once."""
+        config = MCPExecutionConfig(serverName="local", toolName="ping")
+
+        executor.execute(config, _context())
+        executor.execute(config, _context())
+
+        assert len(fake_mcp) == 1
+        assert len(_FakeSession.instances) == 1
+        session = _FakeSession.instances[0]
+        session.initialize.assert_awaited_once()
+        assert session.call_tool.await_count == 2
+
+    def test_broken_connection_discards_session(self, executor, fake_mcp):
+        """Test that a session whose connection breaks during a call is closed and not reused."""
+        config = MCPExecutionConfig(serverName="web", toolName="ping")
+        executor.execute(config, _context())
+        _FakeSession.instances[0].call_tool.side_effect = BrokenPipeError("broken pipe")
+
+        result = executor.execute(config, _context())
+
+        assert result.result.isError is True
+        assert "broken pipe" in result.result.content[0].text
+        assert _FakeSession.instances[0].exited is True
+        executor.execute(config, _context())
+        assert len(_FakeSession.instances) == 2
+
+    def test_closed_connection_mcp_error_discards_session(self, executor, fake_mcp):
+        """Test that the SDK's "Connection closed" McpError also replaces the session."""
+        config = MCPExecutionConfig(serverName="web", toolName="ping")
+        executor.execute(config, _context())
+        _FakeSession.instances[0].call_tool.side_effect = McpError(
+            ErrorData(code=CONNECTION_CLOSED, message="Connection closed")
+        )
+
+        executor.execute(config, _context())
+
+        assert _FakeSession.instances[0].exited is True
+
+    def test_protocol_error_keeps_session(self, executor, fake_mcp):
+        """Test that a protocol-level McpError is reported without respawning the server."""
+        config = MCPExecutionConfig(serverName="web", toolName="ping")
+        executor.execute(config, _context())
+        session = _FakeSession.instances[0]
+        session.call_tool.side_effect = McpError(
+            ErrorData(code=INVALID_PARAMS, message="Unknown tool: ping")
+        )
+
+        result = executor.execute(config, _context())
+
+        assert result.result.isError is True
+        assert "Unknown tool" in result.result.content[0].text
+        assert session.exited is False
+        session.call_tool.side_effect = None
+        executor.execute(config, _context())
+        assert len(_FakeSession.instances) == 1
+
+    def test_concurrent_execute_from_threads_shares_one_session(self, executor, fake_mcp):
+        """Test that executes issued from many threads share one session on the shared loop."""
+        config = MCPExecutionConfig(serverName="web", toolName="ping")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: executor.execute(config, _context(i=i)), range(8)))
+
+        assert all(result.result.isError is False for result in results)
+        assert len(fake_mcp) == 1
+        assert len(_FakeSession.instances) == 1
+        session = _FakeSession.instances[0]
+        session.initialize.assert_awaited_once()
+        assert session.call_tool.await_count == 8
+
+    @pytest.mark.anyio
+    async def test_execute_async_uses_pooled_session(self, executor, fake_mcp):
+        """Test that the async variant shares the pool with the sync variant."""
+        config = MCPExecutionConfig(serverName="web", toolName="ping")
+        executor.execute(config, _context())
+
+        result = await executor.execute_async(config, _context())
+
+        assert result.result.content[0].text == "pong"
+        assert len(_FakeSession.instances) == 1
+        assert _FakeSession.instances[0].call_tool.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_execute_async_server_not_registered(self, executor):
+        """Test that the async variant reports unknown servers as an error result."""
+        config = MCPExecutionConfig(serverName="missing", toolName="ping")
+
+        result = await executor.execute_async(config, _context())
+
+        assert result.result.isError is True
+        assert "not registered" in result.result.content[0].text
+
+
+class TestMCPExecutorConnectAll:
+    """Tests for warming up all MCP server sessions concurrently."""
+
+    @pytest.fixture
+    def slow_fake_mcp(self):
+        """Patch the MCP SDK with transports that take 50 ms to connect and track overlap."""
+        _FakeSession.instances = []
+        stats = {"active": 0, "max_active": 0, "opened": 0}
+
+        @asynccontextmanager
+        async def slow_transport(target, **_kwargs):
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            await asyncio.sleep(0.05)
+            stats["active"] -= 1
+            stats["opened"] += 1
+            yield MagicMock(), MagicMock(), None
+
+        with patch(
+            "mcipy.mcp_integration._load_mcp",
+            return_value=(_FakeSession, MagicMock(), slow_transport, slow_transport),
+        ):
+            yield stats
+        MCPIntegration.close_all()
+
+    def test_connect_all_opens_servers_concurrently(self, slow_fake_mcp):
+        """Test that all servers connect in parallel and their sessions are pooled."""
+        executor = MCPExecutor(
+            {
+                "web": HttpMCPServer(url="http://localhost:9999/mcp"),
+                "local": StdioMCPServer(command="fake-server"),
+            }
+        )
+
+        failures = executor.connect_all()
+
+        assert failures == {}
+        assert slow_fake_mcp["max_active"] == 2
+        assert len(_FakeSession.instances) == 2
+
+        # Later executions reuse the warmed-up session
+        executor.execute(MCPExecutionConfig(serverName="web", toolName="ping"), _context())
+        assert slow_fake_mcp["opened"] == 2
+
+    def test_connect_all_reports_failures_without_aborting(self, slow_fake_mcp):
+        """Test that a server that cannot be set up is reported while others connect."""
+        executor = MCPExecutor(
+            {
+                "broken": HttpMCPServer(url="{{env.MISSING_URL}}"),
+                "local": StdioMCPServer(command="fake-server"),
+            }
+        )
+
+        failures = executor.connect_all()
+
+        assert list(failures) == ["broken"]
+        assert "MISSING_URL" in str(failures["broken"])
+        assert len(_FakeSession.instances) == 1
+
+    @pytest.mark.anyio
+    async def test_connect_all_async(self, slow_fake_mcp):
+        """Test that the async variant connects on the shared loop without blocking it."""
+        executor = MCPExecutor({"web": HttpMCPServer(url="http://localhost:9999/mcp")})
+
+        failures = await executor.connect_all_async()
+
+        assert failures == {}
+        assert len(_FakeSession.instances) == 1
@@ -106,10 +106,10 @@ def temp_schema_file(sample_schema_dict):
 
 
 @pytest.fixture
-def client(temp_schema_file):
-    """Create an MCIClient instance for testing."""
-    return MCIClient(
-        json_file_path=temp_schema_file, env_vars={"API_KEY": "test-key", "USER": "testuser"}
+def client(sample_schema_dict):
+    """Create an MCIClient instance for testing, without a round trip through a file."""
+    return MCIClient.from_dict(
+        sample_schema_dict, env_vars={"API_KEY": "test-key", "USER": "testuser"}
     )
 
 
@@ -178,6 +178,60 @@ class TestMCIClientInit:
         finally:
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_from_dict_matches_file_client(self, sample_schema_dict, temp_schema_file):
+        """Test that a client built from a dict exposes the same tools as one built from a file."""
+        from_file = MCIClient(schema_file_path=temp_schema_file)
+        from_dict = MCIClient.from_dict(sample_schema_dict)
+
+        assert from_dict.list_tools() == from_file.list_tools()
+        result = from_dict.execute("generate_text", properties={"name": "World"})
+        assert result.result.content[0].text == "Hello World!"
+
+    def test_from_dict_with_invalid_schema(self):
+        """Test that from_dict reports an invalid schema as MCIClientError."""
+        with pytest.raises(MCIClientError, match="Failed to load schema"):
+            MCIClient.from_dict({"schemaVersion": "1.0"})
+
+    def test_from_dict_resolves_paths_against_schema_file_path(self, tmp_path):
+        """Test that from_dict applies path validation relative to schema_file_path."""
+        outside_file = tmp_path / "outside.txt"
+        outside_file.write_text("outside")
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        schema = {
+            "schemaVersion": "1.0",
+            "tools": [{"name": "read", "execution": {"type": "file", "path": str(outside_file)}}],
+        }
+
+        client = MCIClient.from_dict(schema, schema_file_path=str(schema_dir / "s.json"))
+        result = client.execute("read")
+
+        assert result.result.isError is True
+        assert "outside context directory" in result.result.content[0].text
+
+    def test_from_dict_without_path_validates_against_cwd(self, tmp_path, monkeypatch):
+        """Test that from_dict without schema_file_path restricts paths to the working directory."""
+        outside_file = tmp_path / "outside.txt"
+        outside_file.write_text("outside")
+        inside_file = tmp_path / "work" / "inside.txt"
+        inside_file.parent.mkdir()
+        inside_file.write_text("inside")
+        monkeypatch.chdir(inside_file.parent)
+        schema = {
+            "schemaVersion": "1.0",
+            "tools": [
+                {"name": "outside", "execution": {"type": "file", "path": str(outside_file)}},
+                {"name": "inside", "execution": {"type": "file", "path": "inside.txt"}},
+            ],
+        }
+
+        client = MCIClient.from_dict(schema)
+
+        outside = client.execute("outside")
+        assert outside.result.isError is True
+        assert "outside context directory" in outside.result.content[0].text
+        assert client.execute("inside").result.content[0].text == "inside"
+
 
 class TestTools:
     """Tests for tools() method."""
@@ -0,0 +1,228 @@
+"""Unit tests for MCP session pooling and toolset memoization in MCPIntegration."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import METHOD_NOT_FOUND, ErrorData
+
+from mcipy.mcp_integration import MCPIntegration, MCPIntegrationError
+from mcipy.models import HttpMCPServer, StdioMCPServer
+from mcipy.templating import TemplateEngine
+
+
+class _FakeSession:
+    """Stand-in for mcp.ClientSession that records lifecycle calls."""
+
+    instances: list["_FakeSession"] = []
+
+    def __init__(self, read, write):
+        self.initialize = AsyncMock()
+        self.list_tools = AsyncMock(
+            return_value=SimpleNamespace(
+                tools=[
+                    SimpleNamespace(
+                        name="echo", description="Echo", inputSchema=None, annotations=None
+                    )
+                ]
+            )
+        )
+        self.exited = False
+        _FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.exited = True
+
+
+@pytest.fixture
+def fake_mcp():
+    """Patch the MCP SDK loader with fakes and reset the session pool around each test."""
+    _FakeSession.instances = []
+    MCPIntegration.clear_toolset_cache()
+    transports_opened: list[str] = []
+
+    @asynccontextmanager
+    async def fake_transport(target, **_kwargs):
+        transports_opened.append(str(target))
+        yield MagicMock(), MagicMock(), None
+
+    with patch(
+        "mcipy.mcp_integration._load_mcp",
+        return_value=(_FakeSession, MagicMock(), fake_transport, fake_transport),
+    ):
+        yield transports_opened
+    MCPIntegration.close_all()
+    MCPIntegration.clear_toolset_cache()
+
+
+def _fetch(server_name: str, server_config: StdioMCPServer | HttpMCPServer):
+    return MCPIntegration.fetch_and_build_toolset(
+        server_name, server_config, "1.0", {"env": {}}, TemplateEngine()
+    )
+
+
+class TestMCPSessionPool:
+    """Tests for reusing MCP server sessions across toolset fetches."""
+
+    def test_repeated_fetch_reuses_session(self, fake_mcp):
+        """Test that fetching the same server twice connects and initializes once."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+
+        first = _fetch("srv", config)
+        MCPIntegration.clear_toolset_cache()
+        second = _fetch("srv", config)
+
+        assert [t.name for t in first.tools] == ["echo"]
+        assert [t.name for t in second.tools] == ["echo"]
+        assert len(fake_mcp) == 1
+        assert len(_FakeSession.instances) == 1
+        session = _FakeSession.instances[0]
+        session.initialize.assert_awaited_once()
+        assert session.list_tools.await_count == 2
+
+    def test_changed_settings_open_new_session(self, fake_mcp):
+        """Test that a different URL for the same server name gets its own session."""
+        _fetch("srv", HttpMCPServer(url="http://localhost:1/mcp"))
+        _fetch("srv", HttpMCPServer(url="http://localhost:2/mcp"))
+
+        assert len(_FakeSession.instances) == 2
+
+    def test_close_all_exits_sessions(self, fake_mcp):
+        """Test that close_all exits pooled sessions and later fetches reconnect."""
+        config = StdioMCPServer(command="fake-server")
+        _fetch("srv", config)
+
+        MCPIntegration.close_all()
+        MCPIntegration.clear_toolset_cache()
+
+        assert _FakeSession.instances[0].exited is True
+        _fetch("srv", config)
+        assert len(_FakeSession.instances) == 2
+
+    def test_failed_list_tools_discards_session(self, fake_mcp):
+        """Test that a session whose connection breaks is not reused."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+        _fetch("srv", config)
+        MCPIntegration.clear_toolset_cache()
+        _FakeSession.instances[0].list_tools.side_effect = BrokenPipeError("broken pipe")
+
+        with pytest.raises(MCPIntegrationError, match="broken pipe"):
+            _fetch("srv", config)
+
+        assert _FakeSession.instances[0].exited is True
+        _fetch("srv", config)
+        assert len(_FakeSession.instances) == 2
+
+    def test_list_tools_protocol_error_keeps_session(self, fake_mcp):
+        """Test that a protocol-level McpError is reported without replacing the session."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+        _fetch("srv", config)
+        MCPIntegration.clear_toolset_cache()
+        session = _FakeSession.instances[0]
+        session.list_tools.side_effect = McpError(
+            ErrorData(code=METHOD_NOT_FOUND, message="Method not found")
+        )
+
+        with pytest.raises(MCPIntegrationError, match="Method not found"):
+            _fetch("srv", config)
+
+        assert session.exited is False
+        session.list_tools.side_effect = None
+        _fetch("srv", config)
+        assert len(_FakeSession.instances) == 1
+
+    @pytest.mark.anyio
+    async def test_async_fetch_uses_pool(self, fake_mcp):
+        """Test that the async variant shares the pool with the sync variant."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+        _fetch("srv", config)
+        MCPIntegration.clear_toolset_cache()
+
+        toolset = await MCPIntegration.fetch_and_build_toolset_async(
+            "srv", config, "1.0", {"env": {}}, TemplateEngine()
+        )
+
+        assert [t.name for t in toolset.tools] == ["echo"]
+        assert len(_FakeSession.instances) == 1
+
+
+class TestMCPToolsetMemo:
+    """Tests for memoizing built toolsets until they expire."""
+
+    def test_fresh_toolset_is_served_from_memo(self, fake_mcp):
+        """Test that a second fetch within expDays does not query the server."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+
+        _fetch("srv", config)
+        toolset = _fetch("srv", config)
+
+        assert [t.name for t in toolset.tools] == ["echo"]
+        assert _FakeSession.instances[0].list_tools.await_count == 1
+
+    def test_memo_returns_independent_copies(self, fake_mcp):
+        """Test that mutating a returned toolset does not affect later fetches."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+
+        first = _fetch("srv", config)
+        first.tools[0].toolset_source = "srv"
+        first.tools.clear()
+        second = _fetch("srv", config)
+
+        assert [t.name for t in second.tools] == ["echo"]
+        assert second.tools[0].toolset_source is None
+
+    def test_expired_toolset_is_refetched(self, fake_mcp):
+        """Test that an entry whose expiresAt has passed is evicted and refetched."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+        _fetch("srv", config)
+        for toolset in MCPIntegration._toolset_cache.values():
+            toolset.expiresAt = "2000-01-01"
+
+        _fetch("srv", config)
+
+        assert _FakeSession.instances[0].list_tools.await_count == 2
+
+    def test_schema_version_is_part_of_key(self, fake_mcp):
+        """Test that a different schema version is not served from another version's entry."""
+        config = HttpMCPServer(url="http://localhost:9999/mcp")
+
+        _fetch("srv", config)
+        toolset = MCPIntegration.fetch_and_build_toolset(
+            "srv", config, "1.1", {"env": {}}, TemplateEngine()
+        )
+
+        assert toolset.schemaVersion == "1.1"
+        assert _FakeSession.instances[0].list_tools.await_count == 2
+
+
+class TestMCPSessionPoolBound:
+    """Tests for the LRU bound on pooled MCP sessions."""
+
+    def test_least_recently_used_session_is_closed(self, fake_mcp):
+        """Test that opening more sessions than the cap closes the least recently used one."""
+        with patch.object(MCPIntegration, "MAX_POOLED_SESSIONS", 2):
+            _fetch("a", HttpMCPServer(url="http://localhost:1/mcp"))
+            _fetch("b", HttpMCPServer(url="http://localhost:2/mcp"))
+            MCPIntegration.clear_toolset_cache()
+            _fetch("a", HttpMCPServer(url="http://localhost:1/mcp"))
+            _fetch("c", HttpMCPServer(url="http://localhost:3/mcp"))
+
+        first, second, third = _FakeSession.instances
+        assert first.exited is False
+        assert second.exited is True
+        assert third.exited is False
+        assert {key[0] for key in MCPIntegration._sessions} == {"a", "c"}
+        assert {key[0] for key in MCPIntegration._session_locks} == {"a", "c"}
+
+    def test_eviction_drops_memoized_toolsets(self, fake_mcp):
+        """Test that an evicted session's memoized toolsets are dropped with it."""
+        with patch.object(MCPIntegration, "MAX_POOLED_SESSIONS", 1):
+            _fetch("a", HttpMCPServer(url="http://localhost:1/mcp"))
+            _fetch("b", HttpMCPServer(url="http://localhost:2/mcp"))
+
+        assert {key[0] for key in MCPIntegration._toolset_cache} == {"b"}
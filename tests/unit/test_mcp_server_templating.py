@@ -1,35 +1,55 @@
 """Unit tests for MCP server templating with fallback syntax."""
 
+import json
+
 import pytest
 
 from mcipy import MCIClient
 from mcipy.client import MCIClientError
 
+HTTP_SCHEMA_JSON = json.dumps(
+    {
+        "schemaVersion": "1.0",
+        "libraryDir": "./mci",
+        "mcp_servers": {
+            "test_http": {
+                "type": "http",
+                "url": "https://api.example.com/mcp",
+                "headers": {"Authorization": "Bearer {{env.API_TOKEN | 'default-token'}}"},
+                "config": {"expDays": 1},
+            }
+        },
+        "tools": [],
+    }
+)
+
+
+def _stdio_schema_json(templated_arg: str) -> str:
+    """Build a schema with one npx-launched MCP server whose last argument is templated."""
+    return json.dumps(
+        {
+            "schemaVersion": "1.0",
+            "libraryDir": "./mci",
+            "mcp_servers": {
+                "test_server": {
+                    "command": "npx",
+                    "args": ["-y", "test-server", templated_arg],
+                    "config": {"expDays": 1},
+                }
+            },
+            "tools": [],
+        }
+    )
+
 
 class TestMCPServerTemplating:
     """Tests for MCP server configuration templating with fallback syntax."""
 
+    @pytest.mark.slow
     def test_mcp_server_with_env_var_fallback_to_literal(self, tmp_path):
         """Test MCP server config with env var fallback to string literal."""
         schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(
-            """
-{
-  "schemaVersion": "1.0",
-  "libraryDir": "./mci",
-  "mcp_servers": {
-    "test_server": {
-      "command": "npx",
-      "args": ["-y", "test-server", "{{env.TMP_DIR | '/tmp'}}"],
-      "config": {
-        "expDays": 1
-      }
-    }
-  },
-  "tools": []
-}
-"""
-        )
+        schema_file.write_text(_stdio_schema_json("{{env.TMP_DIR | '/tmp'}}"))
 
         # Create client without TMP_DIR env var - should use fallback
         try:
@@ -41,27 +61,11 @@ class TestMCPServerTemplating:
             assert "Failed to resolve placeholder" not in str(e)
             # Other errors are acceptable (e.g., MCP server not available)
 
+    @pytest.mark.slow
     def test_mcp_server_with_env_var_fallback_to_another_var(self, tmp_path):
         """Test MCP server config with env var fallback to another env var."""
         schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(
-            """
-{
-  "schemaVersion": "1.0",
-  "libraryDir": "./mci",
-  "mcp_servers": {
-    "test_server": {
-      "command": "npx",
-      "args": ["-y", "test-server", "{{env.MISSING | env.ROOT_DIR}}"],
-      "config": {
-        "expDays": 1
-      }
-    }
-  },
-  "tools": []
-}
-"""
-        )
+        schema_file.write_text(_stdio_schema_json("{{env.MISSING | env.ROOT_DIR}}"))
 
         # Create client with ROOT_DIR but not MISSING - should use ROOT_DIR
         try:
@@ -74,27 +78,11 @@ class TestMCPServerTemplating:
             assert "Failed to resolve placeholder" not in str(e)
             assert "MISSING" not in str(e)
 
+    @pytest.mark.slow
     def test_mcp_server_with_chained_fallbacks(self, tmp_path):
         """Test MCP server config with chained fallback values."""
         schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(
-            """
-{
-  "schemaVersion": "1.0",
-  "libraryDir": "./mci",
-  "mcp_servers": {
-    "test_server": {
-      "command": "npx",
-      "args": ["-y", "test-server", "{{env.TMP_DIR | env.ROOT_DIR | '/tmp'}}"],
-      "config": {
-        "expDays": 1
-      }
-    }
-  },
-  "tools": []
-}
-"""
-        )
+        schema_file.write_text(_stdio_schema_json("{{env.TMP_DIR | env.ROOT_DIR | '/tmp'}}"))
 
         # Create client without either env var - should use string literal fallback
         try:
@@ -107,27 +95,7 @@ class TestMCPServerTemplating:
     def test_mcp_server_env_var_in_headers(self, tmp_path):
         """Test MCP server HTTP config with env var in headers."""
         schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(
-            """
-{
-  "schemaVersion": "1.0",
-  "libraryDir": "./mci",
-  "mcp_servers": {
-    "test_http": {
-      "type": "http",
-      "url": "https://api.example.com/mcp",
-      "headers": {
-        "Authorization": "Bearer {{env.API_TOKEN | 'default-token'}}"
-      },
-      "config": {
-        "expDays": 1
-      }
-    }
-  },
-  "tools": []
-}
-"""
-        )
+        schema_file.write_text(HTTP_SCHEMA_JSON)
 
         # Create client without API_TOKEN - should use fallback
         try:
@@ -112,6 +112,35 @@ class TestAuthConfigs:
         )
         assert auth.scopes == ["read:data", "write:data"]
 
+    def test_auth_dispatched_by_type(self):
+        """Test that auth dicts are validated as the model named by their type."""
+        config = HTTPExecutionConfig(
+            url="https://api.example.com",
+            auth={"type": "basic", "username": "user", "password": "pass"},
+        )
+        assert isinstance(config.auth, BasicAuth)
+
+    @pytest.mark.parametrize(
+        ("auth", "expected"),
+        [
+            ({"in": "header", "name": "X-API-Key", "value": "k"}, ApiKeyAuth),
+            ({"token": "abc"}, BearerAuth),
+            ({"username": "user", "password": "pass"}, BasicAuth),
+        ],
+    )
+    def test_auth_without_type_matched_by_fields(self, auth, expected):
+        """Test that auth dicts without a type are still matched to a model by their fields."""
+        config = HTTPExecutionConfig(url="https://api.example.com", auth=auth)
+        assert isinstance(config.auth, expected)
+
+    def test_auth_unknown_type_rejected(self):
+        """Test that an auth dict with an unknown type is rejected."""
+        with pytest.raises(ValidationError):
+            HTTPExecutionConfig(
+                url="https://api.example.com",
+                auth={"type": "digest", "token": "abc"},
+            )
+
 
 class TestRetryConfig:
     """Tests for retry configuration."""
@@ -425,6 +454,42 @@ class TestTool:
         assert tool.tags == ["API", "api", "Api"]
         assert len(tool.tags) == 3
 
+    def test_tool_execution_dispatched_by_type(self):
+        """Test that execution dicts are validated as the config named by their type."""
+        tool = Tool.model_validate(
+            {"name": "echo", "execution": {"type": "cli", "command": "echo"}}
+        )
+        assert isinstance(tool.execution, CLIExecutionConfig)
+        assert tool.execution.type == ExecutionType.CLI
+
+    @pytest.mark.parametrize(
+        ("execution", "expected"),
+        [
+            ({"text": "hello"}, TextExecutionConfig),
+            ({"command": "echo"}, CLIExecutionConfig),
+            ({"path": "/tmp/file.txt"}, FileExecutionConfig),
+            ({"url": "https://api.example.com", "auth": {"token": "abc"}}, HTTPExecutionConfig),
+        ],
+    )
+    def test_tool_execution_without_type_matched_by_fields(self, execution, expected):
+        """Test that execution dicts without a type are still matched to a config by their fields."""
+        tool = Tool.model_validate({"name": "echo", "execution": execution})
+        assert isinstance(tool.execution, expected)
+
+    def test_tool_execution_without_type_or_match_rejected(self):
+        """Test that an execution dict without a type that fits no config is rejected."""
+        with pytest.raises(ValidationError):
+            Tool.model_validate({"name": "echo", "execution": {"unknown": "field"}})
+
+    def test_tool_execution_unknown_type_single_error(self):
+        """Test that an unknown execution type yields one tag error, not one per config."""
+        with pytest.raises(ValidationError) as exc_info:
+            Tool.model_validate({"name": "echo", "execution": {"type": "ftp"}})
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["type"] == "union_tag_invalid"
+
 
 class TestAnnotations:
     """Tests for Annotations model."""
@@ -541,6 +606,15 @@ class TestExecutionResult:
         assert len(result.result.content) == 1
         assert result.result.content[0].text == "Connection timeout"
 
+    def test_execution_result_content_without_type(self):
+        """Test that content dicts without a type are still matched to a content model."""
+        from mcipy import ExecutionResultContent, TextContent
+
+        content = ExecutionResultContent.model_validate(
+            {"isError": False, "content": [{"text": "plain"}]}
+        )
+        assert isinstance(content.content[0], TextContent)
+
     def test_execution_result_various_content_types(self):
         """Test execution result with various content types."""
         from mcipy import AudioContent, ExecutionResultContent, ImageContent, TextContent
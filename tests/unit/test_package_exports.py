@@ -0,0 +1,56 @@
+"""Unit tests for the lazily resolved top-level mcipy exports."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mcipy
+
+
+class TestPackageExports:
+    """Tests for PEP 562 lazy attribute resolution in mcipy/__init__.py."""
+
+    def test_all_exports_resolve(self):
+        """Test that every name in __all__ can be resolved from the package."""
+        for name in mcipy.__all__:
+            assert getattr(mcipy, name) is not None
+
+    def test_lazy_export_matches_submodule(self):
+        """Test that lazily resolved names are the same objects as in their submodules."""
+        from mcipy.client import MCIClient
+        from mcipy.models import Tool
+
+        assert mcipy.MCIClient is MCIClient
+        assert mcipy.Tool is Tool
+
+    def test_lazy_models_are_public_in_models_module(self):
+        """Test that every name lazily exported from models is listed in models.__all__."""
+        from mcipy import models
+
+        lazy_model_names = {
+            name for name, module in mcipy._LAZY_IMPORTS.items() if module == "models"
+        }
+        assert lazy_model_names <= set(models.__all__)
+        assert all(hasattr(models, name) for name in models.__all__)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'DoesNotExist'"):
+            _ = mcipy.DoesNotExist  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Test that importing mcipy does not eagerly import the client, models, or MCP SDK."""
+        code = (
+            "import sys, mcipy; "
+            "print(','.join(m for m in ('mcipy.client', 'mcipy.models', 'mcp') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.stdout.strip() == ""
@@ -1,6 +1,7 @@
 """Unit tests for SchemaParser."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -72,6 +73,130 @@ class TestSchemaParserParseFile:
         with pytest.raises(SchemaParserError, match="Invalid JSON"):
             SchemaParser.parse_file(str(schema_file))
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parse_file_json_decoders_agree(self, tmp_path, use_orjson):
+        """Test that JSON files parse the same with and without orjson installed."""
+        import mcipy.parser as parser_module
+
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(
+            json.dumps(
+                {
+                    "schemaVersion": "1.0",
+                    "tools": [{"name": "caf\u00e9", "execution": {"type": "text", "text": "x"}}],
+                }
+            )
+        )
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("{ invalid json }")
+
+        orjson_module = parser_module.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson is not installed")
+
+        with patch.object(parser_module, "orjson", orjson_module):
+            schema = SchemaParser.parse_file(str(schema_file))
+            with pytest.raises(SchemaParserError, match="Invalid JSON"):
+                SchemaParser.parse_file(str(bad_file))
+
+        assert schema.tools[0].name == "caf\u00e9"
+
+    def test_parse_file_large_json_is_memory_mapped(self, tmp_path):
+        """Test that JSON files over the mmap threshold decode from a mapped buffer."""
+        import mcipy.parser as parser_module
+
+        if parser_module.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(
+            json.dumps(
+                {
+                    "schemaVersion": "1.0",
+                    "tools": [{"name": "big", "execution": {"type": "text", "text": "x"}}],
+                }
+            )
+        )
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("{ invalid json }")
+
+        with (
+            patch.object(parser_module, "_MMAP_MIN_BYTES", 1),
+            patch.object(parser_module.mmap, "mmap", wraps=parser_module.mmap.mmap) as mapped,
+        ):
+            schema = SchemaParser.parse_file(str(schema_file))
+            with pytest.raises(SchemaParserError, match="Invalid JSON"):
+                SchemaParser.parse_file(str(bad_file))
+
+        assert mapped.call_count == 2
+        assert schema.tools is not None
+        assert schema.tools[0].name == "big"
+
+
+class TestSchemaParserCache:
+    """Tests for the optional cross-process schema cache in parse_file."""
+
+    @pytest.fixture
+    def schema_file(self, tmp_path):
+        """Fixture for a minimal schema file."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(
+            json.dumps(
+                {
+                    "schemaVersion": "1.0",
+                    "tools": [{"name": "greet", "execution": {"type": "text", "text": "Hi"}}],
+                }
+            )
+        )
+        return schema_file
+
+    def test_cache_entry_written_and_reused(self, schema_file, tmp_path):
+        """Test that a second parse of an unchanged file is served from the cache."""
+        cache_dir = tmp_path / "cache"
+
+        first = SchemaParser.parse_file(str(schema_file), cache_dir=str(cache_dir))
+        entries = list(cache_dir.glob("schema_*.json"))
+        assert len(entries) == 1
+        assert json.loads(entries[0].read_text())["tools"][0]["name"] == "greet"
+
+        with patch.object(SchemaParser, "_build_schema", side_effect=AssertionError("not cached")):
+            second = SchemaParser.parse_file(str(schema_file), cache_dir=str(cache_dir))
+
+        assert second == first
+        assert second is not first
+
+    def test_modified_file_misses_cache(self, schema_file, tmp_path):
+        """Test that changing the schema file produces a fresh parse."""
+        cache_dir = tmp_path / "cache"
+        SchemaParser.parse_file(str(schema_file), cache_dir=str(cache_dir))
+
+        schema_file.write_text(
+            json.dumps(
+                {
+                    "schemaVersion": "1.0",
+                    "tools": [{"name": "bye", "execution": {"type": "text", "text": "Bye"}}],
+                }
+            )
+        )
+
+        schema = SchemaParser.parse_file(str(schema_file), cache_dir=str(cache_dir))
+        assert [tool.name for tool in schema.tools] == ["bye"]
+
+    def test_corrupt_cache_entry_is_ignored(self, schema_file, tmp_path):
+        """Test that an unreadable cache entry falls back to parsing the file."""
+        cache_dir = tmp_path / "cache"
+        SchemaParser.parse_file(str(schema_file), cache_dir=str(cache_dir))
+        for entry in cache_dir.glob("schema_*.json"):
+            entry.write_bytes(b"not json")
+
+        schema = SchemaParser.parse_file(str(schema_file), cache_dir=str(cache_dir))
+        assert [tool.name for tool in schema.tools] == ["greet"]
+
+    def test_no_cache_dir_writes_nothing(self, schema_file, tmp_path):
+        """Test that caching is off unless a cache directory is given."""
+        SchemaParser.parse_file(str(schema_file))
+        assert not list(tmp_path.rglob("schema_*.json"))
+
 
 class TestSchemaParserParseDict:
     """Tests for SchemaParser.parse_dict method."""
@@ -183,6 +308,11 @@ class TestSchemaParserValidateSchemaVersion:
         with pytest.raises(SchemaParserError, match="Schema version must be a string"):
             SchemaParser._validate_schema_version(None)  # pyright: ignore[reportArgumentType]
 
+    def test_validate_version_unhashable(self):
+        """Test that an unhashable version reports a type error instead of crashing."""
+        with pytest.raises(SchemaParserError, match="Schema version must be a string, got list"):
+            SchemaParser._validate_schema_version(["1.0"])  # pyright: ignore[reportArgumentType]
+
 
 class TestSchemaParserValidateTools:
     """Tests for SchemaParser._validate_tools method."""
@@ -463,6 +593,19 @@ class TestSchemaParserIntegration:
         ):
             SchemaParser.parse_dict(data)
 
+    def test_parse_valid_schema_validates_tools_once(self):
+        """Test that a valid schema is validated by Pydantic alone, without the manual walk."""
+        data = {
+            "schemaVersion": "1.0",
+            "tools": [{"name": "tool1", "execution": {"type": "text", "text": "Hi"}}],
+        }
+
+        with patch.object(SchemaParser, "_validate_tools") as validate_tools:
+            schema = SchemaParser.parse_dict(data)
+
+        validate_tools.assert_not_called()
+        assert isinstance(schema.tools[0].execution, TextExecutionConfig)
+
 
 class TestSchemaParserYAMLSupport:
     """Tests for YAML file parsing support."""
@@ -1,10 +1,11 @@
 """Unit tests for templating engine."""
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from mcipy.templating import TemplateEngine, TemplateError
+from mcipy.templating import TemplateEngine, TemplateError, needs_templating
 
 
 @pytest.fixture
@@ -135,6 +136,45 @@ class TestRenderBasic:
         result = engine.render_basic(template, context)
         assert result == "Key: secret123"
 
+    def test_literal_string_returned_unchanged(self, engine):
+        """Test that a string without placeholders is returned as-is without resolving."""
+        template = "--verbose {single braces} {!!not basic!!}"
+        result = engine.render_basic(template, {})
+        assert result is template
+
+    def test_templating_regex_is_compiled_once(self, engine, context):
+        """Test that rendering uses the precompiled patterns instead of the re module."""
+        template = "@if(props.age > 18){{props.name}}@else minor@endif {{env.USER}}"
+
+        with patch("mcipy.templating.re") as re_module:
+            basic = engine.render_basic("Hello {{props.name}}", context)
+            advanced = engine.render_advanced(template, context)
+            native = engine.resolve_json_native("{!!props.age!!}", context)
+
+        assert basic == "Hello Alice"
+        assert advanced == "Alice testuser"
+        assert native == 30
+        assert not re_module.compile.called
+        assert not re_module.match.called
+        assert not re_module.sub.called
+
+
+class TestNeedsTemplating:
+    """Tests for the needs_templating helper."""
+
+    def test_detects_basic_placeholder(self):
+        """Test that {{...}} placeholders are detected."""
+        assert needs_templating("Hello {{props.name}}") is True
+
+    def test_detects_json_native_placeholder(self):
+        """Test that {!!...!!} placeholders are detected."""
+        assert needs_templating("{!!props.count!!}") is True
+
+    def test_literal_string(self):
+        """Test that strings without placeholder openers are reported as literal."""
+        assert needs_templating("https://api.example.com/{id}") is False
+        assert needs_templating("") is False
+
 
 class TestResolvePlaceholder:
     """Tests for _resolve_placeholder method."""
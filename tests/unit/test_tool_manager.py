@@ -4,6 +4,8 @@ Unit tests for ToolManager class.
 Tests the tool retrieval, filtering, and execution functionality of the ToolManager.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from mcipy import (
@@ -18,6 +20,7 @@ from mcipy import (
     ToolManager,
     ToolManagerError,
 )
+from mcipy.executors import ExecutorFactory
 
 
 @pytest.fixture
@@ -154,6 +157,14 @@ class TestToolManagerInit:
         assert manager.get_tool("get_weather") is not None
         assert manager.get_tool("create_report") is not None
 
+    def test_manager_has_no_instance_dict(self, sample_schema):
+        """Test that ToolManager stores its state in slots."""
+        manager = ToolManager(sample_schema)
+
+        assert not hasattr(manager, "__dict__")
+        with pytest.raises(AttributeError):
+            manager.unexpected = True  # pyright: ignore[reportAttributeAccessIssue]
+
     def test_init_creates_tool_map(self, sample_schema):
         """Test that initialization creates a tool mapping.
 
@@ -217,6 +228,21 @@ class TestListTools:
         # Should return the same list if no tools are disabled
         assert len(tools) == len(tool_manager.schema.tools)
 
+    def test_list_tools_returns_fresh_list(self, tool_manager):
+        """Test that mutating a returned list does not affect later calls."""
+        tools = tool_manager.list_tools()
+        tools.clear()
+
+        assert len(tool_manager.list_tools()) == len(tool_manager.schema.tools)
+
+    def test_list_tool_names_in_schema_order(self, tool_manager):
+        """Test that list_tool_names matches list_tools and returns a fresh list."""
+        names = tool_manager.list_tool_names()
+
+        assert names == [tool.name for tool in tool_manager.list_tools()]
+        names.clear()
+        assert tool_manager.list_tool_names() != []
+
     def test_list_tools_empty_schema(self):
         """Test listing tools from an empty schema."""
         empty_schema = MCISchema(schemaVersion="1.0", tools=[])
@@ -440,6 +466,109 @@ class TestValidateInputProperties:
         with pytest.raises(ToolManagerError, match="requires properties.*Missing"):
             tool_manager._validate_input_properties(tool, {})
 
+    def test_validate_uses_precomputed_required_set(self, tool_manager):
+        """Test that managed tools are checked against the set built at init."""
+        tool = tool_manager.get_tool("get_weather")
+        assert tool_manager._required["get_weather"] == frozenset({"location"})
+
+        tool_manager._required["get_weather"] = frozenset()
+        # The precomputed set now reports nothing required, so this passes
+        tool_manager._validate_input_properties(tool, {})
+
+    def test_validate_tool_not_owned_by_manager(self, tool_manager):
+        """Test that a tool outside the manager is validated from its own schema."""
+        tool = tool_manager.get_tool("get_weather").model_copy(deep=True)
+        with pytest.raises(ToolManagerError, match="Missing: location"):
+            tool_manager._validate_input_properties(tool, {})
+
+
+class TestPathValidatorCache:
+    """Tests for reusing path validators across executions."""
+
+    def test_validator_built_once_per_tool(self, tmp_path):
+        """Test that repeated executions share one validator per tool."""
+        schema = MCISchema(
+            schemaVersion="1.0",
+            tools=[
+                Tool(name="greet", execution=TextExecutionConfig(text="Hi")),
+                Tool(
+                    name="scoped",
+                    execution=TextExecutionConfig(text="Hi"),
+                    directoryAllowList=["data"],
+                ),
+            ],
+        )
+        manager = ToolManager(schema, str(tmp_path / "schema.mci.json"))
+
+        manager.execute("greet")
+        validator = manager._path_validators["greet"]
+        manager.execute("greet")
+        manager.execute("scoped")
+
+        assert manager._path_validators["greet"] is validator
+        assert manager._path_contexts["greet"] == {"validator": validator}
+        assert validator.context_dir == tmp_path.resolve()
+        assert (tmp_path / "data").resolve() in manager._path_validators["scoped"].allowed_dirs
+
+    def test_no_validator_without_schema_file(self):
+        """Test that managers without a schema file path skip path validation."""
+        schema = MCISchema(
+            schemaVersion="1.0",
+            tools=[Tool(name="greet", execution=TextExecutionConfig(text="Hi"))],
+        )
+        manager = ToolManager(schema)
+
+        manager.execute("greet")
+
+        assert manager._path_validators == {}
+
+
+class TestToolsetsIndex:
+    """Tests for answering toolsets() from the toolset index."""
+
+    def test_toolsets_keeps_schema_order_and_skips_disabled(self):
+        """Test that matching tools come back once, in schema order, without disabled ones."""
+        tools = [
+            Tool(name="a", execution=TextExecutionConfig(text="a"), toolset_source="x"),
+            Tool(name="b", execution=TextExecutionConfig(text="b"), toolset_source="y"),
+            Tool(name="c", execution=TextExecutionConfig(text="c")),
+            Tool(name="d", execution=TextExecutionConfig(text="d"), toolset_source="x"),
+            Tool(
+                name="e",
+                execution=TextExecutionConfig(text="e"),
+                toolset_source="y",
+                disabled=True,
+            ),
+        ]
+        manager = ToolManager(MCISchema(schemaVersion="1.0", tools=tools))
+
+        result = manager.toolsets(["y", "x", "y", "missing"])
+
+        assert [tool.name for tool in result] == ["a", "b", "d"]
+
+class TestExecutorCache:
+    """Tests for resolving executors once per execution type."""
+
+    def test_executor_resolved_once_per_type(self):
+        """Test that repeated executions do not go back to the executor factory."""
+        schema = MCISchema(
+            schemaVersion="1.0",
+            tools=[
+                Tool(name="greet", execution=TextExecutionConfig(text="Hi")),
+                Tool(name="bye", execution=TextExecutionConfig(text="Bye")),
+            ],
+        )
+        manager = ToolManager(schema)
+
+        with patch.object(
+            ExecutorFactory, "get_executor", wraps=ExecutorFactory.get_executor
+        ) as get_executor:
+            manager.execute("greet")
+            manager.execute("bye")
+            manager.execute("greet")
+
+        assert get_executor.call_count == 1
+
 
 class TestEdgeCases:
     """Tests for edge cases and integration scenarios."""
@@ -550,6 +679,22 @@ class TestDisabledToolFiltering:
         assert "disabled_tool_1" not in tool_names
         assert "disabled_tool_2" not in tool_names
 
+    def test_filter_tools_only_and_without_combined(self, tool_manager_with_disabled):
+        """Test that filter_tools applies 'only' and 'without' together in schema order."""
+        tools = tool_manager_with_disabled.filter_tools(
+            only=["enabled_tool_3", "enabled_tool_1", "disabled_tool_1"],
+            without=["enabled_tool_3"],
+        )
+
+        assert [tool.name for tool in tools] == ["enabled_tool_1"]
+
+    def test_filter_tools_no_filters_returns_fresh_list(self, tool_manager_with_disabled):
+        """Test that filter_tools without filters returns a list callers may mutate."""
+        tools = tool_manager_with_disabled.filter_tools()
+        tools.clear()
+
+        assert len(tool_manager_with_disabled.filter_tools()) == 3
+
     def test_execute_disabled_tool_raises_error(self, tool_manager_with_disabled):
         """Test that executing a disabled tool raises an error."""
         # Executing an enabled tool should work (we'll test it doesn't raise here)
@@ -669,6 +814,26 @@ class TestTagFiltering:
         assert "api_tool_2" in tool_names
         assert "cli_tool_1" in tool_names
 
+    def test_tags_filter_preserves_schema_order_without_duplicates(self, schema_with_tags):
+        """Test that tools matching several requested tags appear once, in schema order."""
+        manager = ToolManager(schema_with_tags)
+        tools = manager.tags(["internal", "data", "api"])
+
+        assert [tool.name for tool in tools] == ["api_tool_1", "api_tool_2", "data_tool"]
+
+    def test_tags_filter_single_tag_repeated_on_tool(self):
+        """Test that a tool listing the requested tag twice is returned once."""
+        schema = MCISchema(
+            schemaVersion="1.0",
+            tools=[
+                Tool(name="first", tags=["api", "api"], execution=TextExecutionConfig(text="1")),
+                Tool(name="second", tags=["api"], execution=TextExecutionConfig(text="2")),
+            ],
+        )
+        manager = ToolManager(schema)
+
+        assert [tool.name for tool in manager.tags(["api"])] == ["first", "second"]
+
     def test_tags_filter_no_matches(self, schema_with_tags):
         """Test filtering with tags that don't match any tools."""
         manager = ToolManager(schema_with_tags)
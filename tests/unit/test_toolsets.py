@@ -10,12 +10,23 @@ Tests the new toolsets feature including:
 """
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from mcipy.client import MCIClient, MCIClientError
-from mcipy.models import MCISchema, Toolset
+from mcipy.mcp_integration import MCPIntegration
+from mcipy.models import (
+    HttpMCPServer,
+    MCISchema,
+    MCPExecutionConfig,
+    MCPServerConfig,
+    Tool,
+    Toolset,
+    ToolsetSchema,
+)
 from mcipy.parser import SchemaParser, SchemaParserError
 
 
@@ -105,6 +116,24 @@ class TestToolsetLoading:
         # All tools should have same toolset source
         assert all(tool.toolset_source == "github" for tool in schema.tools)
 
+    def test_load_toolset_directory_skips_non_toolset_entries(self, tmp_path):
+        """Test that directory discovery ignores other files and subdirectories."""
+        toolset_dir = tmp_path / "mci" / "github"
+        (toolset_dir / "nested.mci.json").mkdir(parents=True)
+        (toolset_dir / "README.md").write_text("docs")
+        (toolset_dir / "prs.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [{"name": "list_prs", "execution": {"type": "text", "text": "PRs"}}]
+        }))
+
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({"schemaVersion": "1.0", "toolsets": ["github"]}))
+
+        schema = SchemaParser.parse_file(str(main_schema))
+
+        assert schema.tools is not None
+        assert [tool.name for tool in schema.tools] == ["list_prs"]
+
     def test_load_multiple_toolsets(self, tmp_path):
         """Test loading multiple toolsets."""
         # Create library directory with multiple toolsets
@@ -283,6 +312,37 @@ class TestSchemaLevelFiltering:
         tool_names = {tool.name for tool in schema.tools}
         assert tool_names == {"tool1", "tool3"}
 
+    def test_filter_only_uses_name_index_in_toolset_order(self, tmp_path):
+        """Test that 'only' keeps toolset order and builds the name index once per file."""
+        lib_dir = tmp_path / "mci"
+        lib_dir.mkdir()
+        (lib_dir / "tools.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [
+                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
+                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
+                {"name": "tool3", "execution": {"type": "text", "text": "Tool 3"}}
+            ]
+        }))
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "toolsets": [{"name": "tools", "filter": "only", "filterValue": "tool3, tool1, nope"}]
+        }))
+
+        first = SchemaParser.parse_file(str(main_schema))
+        with patch.object(
+            SchemaParser, "_tool_name_index", wraps=SchemaParser._tool_name_index
+        ) as name_index:
+            second = SchemaParser.parse_file(str(main_schema))
+
+        assert first.tools is not None and second.tools is not None
+        assert [t.name for t in first.tools] == ["tool1", "tool3"]
+        assert [t.name for t in second.tools] == ["tool1", "tool3"]
+        cached = SchemaParser._load_toolset_file("tools", lib_dir)
+        assert name_index.call_count == 1
+        assert cached._name_index == {"tool1": [0], "tool2": [1], "tool3": [2]}
+
     def test_filter_except(self, tmp_path):
         """Test 'except' filter at schema level."""
         # Create toolset with multiple tools
@@ -1087,3 +1147,280 @@ class TestStringToolsets:
         assert schema.toolsets[1].name == "github"
         assert schema.toolsets[1].filter is None
         assert schema.toolsets[1].filterValue is None
+
+
+class TestToolsetFileCache:
+    """Test reuse of parsed toolset files across parse_file calls."""
+
+    @pytest.fixture
+    def main_schema(self, tmp_path):
+        """Fixture for a main schema referencing a single toolset file."""
+        lib_dir = tmp_path / "mci"
+        lib_dir.mkdir()
+        (lib_dir / "weather.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [{"name": "get_weather", "execution": {"type": "text", "text": "Sunny"}}]
+        }))
+
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({"schemaVersion": "1.0", "toolsets": ["weather"]}))
+        return main_schema
+
+    def test_unchanged_toolset_not_reparsed(self, main_schema):
+        """Test that a second load of an unchanged toolset file skips parsing."""
+        SchemaParser.parse_file(str(main_schema))
+
+        with patch.object(
+            SchemaParser, "_parse_toolset_file", side_effect=AssertionError("not cached")
+        ):
+            schema = SchemaParser.parse_file(str(main_schema))
+
+        assert schema.tools is not None
+        assert [t.name for t in schema.tools] == ["get_weather"]
+
+    def test_modified_toolset_is_reparsed(self, main_schema):
+        """Test that editing a toolset file invalidates the cached parse."""
+        SchemaParser.parse_file(str(main_schema))
+
+        toolset_file = main_schema.parent / "mci" / "weather.mci.json"
+        toolset_file.write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [{"name": "get_forecast", "execution": {"type": "text", "text": "Rain"}}]
+        }))
+        file_stat = toolset_file.stat()
+        os.utime(toolset_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000))
+
+        schema = SchemaParser.parse_file(str(main_schema))
+
+        assert schema.tools is not None
+        assert [t.name for t in schema.tools] == ["get_forecast"]
+
+    def test_cached_toolset_not_shared(self, main_schema):
+        """Test that mutating loaded tools does not leak into later loads."""
+        first = SchemaParser.parse_file(str(main_schema))
+        assert first.tools is not None
+        first.tools[0].execution.text = "Mutated"  # pyright: ignore[reportAttributeAccessIssue]
+
+        second = SchemaParser.parse_file(str(main_schema))
+
+        assert second.tools is not None
+        assert second.tools[0].execution.text == "Sunny"  # pyright: ignore[reportAttributeAccessIssue]
+        assert second.tools[0].toolset_source == "weather"
+
+    def test_unchanged_directory_merged_once(self, tmp_path):
+        """Test that an unchanged toolset directory reuses its merged schema."""
+        toolset_dir = tmp_path / "mci" / "github"
+        toolset_dir.mkdir(parents=True)
+        for name in ("prs", "issues"):
+            (toolset_dir / f"{name}.mci.json").write_text(json.dumps({
+                "schemaVersion": "1.0",
+                "tools": [{"name": f"list_{name}", "execution": {"type": "text", "text": name}}]
+            }))
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "toolsets": [{"name": "github", "filter": "only", "filterValue": "list_prs"}]
+        }))
+
+        SchemaParser.parse_file(str(main_schema))
+        merged = SchemaParser._load_toolset_file("github", tmp_path / "mci")
+        schema = SchemaParser.parse_file(str(main_schema))
+
+        assert SchemaParser._load_toolset_file("github", tmp_path / "mci") is merged
+        assert merged._name_index is not None
+        assert schema.tools is not None
+        assert [t.name for t in schema.tools] == ["list_prs"]
+
+    def test_filtered_out_tools_not_copied(self, tmp_path):
+        """Test that only the tools kept by a name filter are copied from the cache."""
+        lib_dir = tmp_path / "mci"
+        lib_dir.mkdir()
+        (lib_dir / "github.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [
+                {"name": f"tool_{i}", "execution": {"type": "text", "text": "x"}}
+                for i in range(5)
+            ]
+        }))
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "toolsets": [{"name": "github", "filter": "only", "filterValue": "tool_3"}]
+        }))
+
+        with patch.object(
+            Tool, "model_copy", autospec=True, side_effect=Tool.model_copy
+        ) as model_copy:
+            schema = SchemaParser.parse_file(str(main_schema))
+
+        assert schema.tools is not None
+        assert [t.name for t in schema.tools] == ["tool_3"]
+        assert model_copy.call_count == 1
+
+    def test_cached_mcp_toolset_copies_only_filtered_tools(self, tmp_path):
+        """Test that a fresh cached MCP toolset is filtered before its tools are copied."""
+        mcp_dir = tmp_path / "mci" / "mcp"
+        mcp_dir.mkdir(parents=True)
+        (mcp_dir / "srv.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "expiresAt": "2999-01-01",
+            "tools": [
+                {
+                    "name": name,
+                    "execution": {"type": "mcp", "serverName": "srv", "toolName": name},
+                }
+                for name in ("read", "write")
+            ]
+        }))
+        servers = {
+            "srv": HttpMCPServer(
+                url="http://localhost:9999/mcp",
+                config=MCPServerConfig(filter="only", filterValue="write"),
+            )
+        }
+        schema_path = str(tmp_path / "main.mci.json")
+
+        tools = SchemaParser._load_mcp_servers(servers, "./mci", schema_path, "1.0")
+        shared = SchemaParser._parse_toolset_file_shared(mcp_dir / "srv.mci.json")
+
+        assert [(t.name, t.toolset_source) for t in tools] == [("write", "srv")]
+        assert all(t.toolset_source is None for t in shared.tools)
+
+    def test_fetched_mcp_toolset_tags_only_filtered_tools(self, tmp_path):
+        """Test that a freshly fetched MCP toolset is filtered and tagged without mutation."""
+        fetched = ToolsetSchema(
+            schemaVersion="1.0",
+            expiresAt="2999-01-01",
+            tools=[
+                Tool(
+                    name=name,
+                    execution=MCPExecutionConfig(serverName="srv", toolName=name),
+                )
+                for name in ("read", "write")
+            ],
+        )
+        servers = {
+            "srv": HttpMCPServer(
+                url="http://localhost:9999/mcp",
+                config=MCPServerConfig(filter="only", filterValue="write"),
+            )
+        }
+        (tmp_path / "mci" / "mcp").mkdir(parents=True)
+        schema_path = str(tmp_path / "main.mci.json")
+
+        with patch.object(MCPIntegration, "fetch_and_build_toolset", return_value=fetched):
+            tools = SchemaParser._load_mcp_servers(servers, "./mci", schema_path, "1.0")
+
+        assert [(t.name, t.toolset_source) for t in tools] == [("write", "srv")]
+        assert all(t.toolset_source is None for t in fetched.tools)
+
+
+class TestConcurrentToolsetLoading:
+    """Test loading several toolsets in parallel."""
+
+    def test_concurrent_load_preserves_toolset_order(self, tmp_path):
+        """Test that toolsets loaded in parallel keep the declared toolset order."""
+        lib_dir = tmp_path / "mci"
+        lib_dir.mkdir()
+        names = [f"set_{i}" for i in range(10)]
+        for name in names:
+            (lib_dir / f"{name}.mci.json").write_text(json.dumps({
+                "schemaVersion": "1.0",
+                "tools": [{"name": f"{name}_tool", "execution": {"type": "text", "text": "x"}}]
+            }))
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({"schemaVersion": "1.0", "toolsets": names[::-1]}))
+
+        schema = SchemaParser.parse_file(str(main_schema))
+
+        assert schema.tools is not None
+        assert [t.toolset_source for t in schema.tools] == names[::-1]
+        assert [t.name for t in schema.tools] == [f"{name}_tool" for name in names[::-1]]
+
+    def test_concurrent_load_reports_first_missing_toolset(self, tmp_path):
+        """Test that the first failing toolset in declared order is the one reported."""
+        lib_dir = tmp_path / "mci"
+        lib_dir.mkdir()
+        (lib_dir / "present.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [{"name": "ok", "execution": {"type": "text", "text": "x"}}]
+        }))
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "toolsets": ["present", "missing_a", "missing_b"]
+        }))
+
+        with pytest.raises(SchemaParserError, match="Toolset not found: missing_a"):
+            SchemaParser.parse_file(str(main_schema))
+
+
+class TestToolsetDiscovery:
+    """Test resolving toolset names against the library directory."""
+
+    def test_plain_names_resolved_from_directory_listing(self, tmp_path):
+        """Test that plain toolset names are looked up without stat'ing each candidate."""
+        lib_dir = tmp_path / "mci"
+        lib_dir.mkdir()
+        (lib_dir / "weather.mci.yml").write_text(
+            "schemaVersion: '1.0'\n"
+            "tools:\n"
+            "  - name: get_weather\n"
+            "    execution: {type: text, text: Sunny}\n"
+        )
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({"schemaVersion": "1.0", "toolsets": ["weather"]}))
+
+        with patch.object(Path, "is_file", side_effect=AssertionError("probed on disk")):
+            schema = SchemaParser._load_toolsets(
+                [Toolset(name="weather")], "mci", str(main_schema)
+            )
+
+        assert [t.name for t in schema] == ["get_weather"]
+
+    def test_case_variant_in_listing_is_resolved_on_disk(self, tmp_path):
+        """Test that a name matching a listed entry only case-insensitively is stat'ed."""
+        entries = {"Weather.mci.json": object()}
+
+        with patch.object(Path, "is_dir", return_value=False), patch.object(
+            Path, "is_file", return_value=True
+        ) as is_file:
+            assert SchemaParser._library_entry_kind(tmp_path, "weather.mci.json", entries) == "file"
+            assert SchemaParser._library_entry_kind(tmp_path, "other.mci.json", entries) is None
+
+        assert is_file.call_count == 1
+
+    def test_nested_toolset_name_resolved_outside_listing(self, tmp_path):
+        """Test that a toolset name with a path separator is still found on disk."""
+        nested_dir = tmp_path / "mci" / "team"
+        nested_dir.mkdir(parents=True)
+        (nested_dir / "github.mci.yaml").write_text(
+            "schemaVersion: '1.0'\n"
+            "tools:\n"
+            "  - name: list_prs\n"
+            "    execution: {type: text, text: PRs}\n"
+        )
+        (tmp_path / "mci" / "weather.mci.json").write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "tools": [{"name": "get_weather", "execution": {"type": "text", "text": "x"}}]
+        }))
+        main_schema = tmp_path / "main.mci.json"
+        main_schema.write_text(json.dumps({
+            "schemaVersion": "1.0",
+            "toolsets": ["team/github", "weather"]
+        }))
+
+        schema = SchemaParser.parse_file(str(main_schema))
+
+        assert schema.tools is not None
+        assert [t.name for t in schema.tools] == ["list_prs", "get_weather"]
+
+    def test_library_path_resolved_relative_to_schema_file(self, tmp_path):
+        """Test that the library path is resolved against the schema directory and reused."""
+        schema_path = str(tmp_path / "main.mci.json")
+
+        lib_path = SchemaParser._resolve_library_path("./mci", schema_path)
+
+        assert lib_path == tmp_path / "mci"
+        assert SchemaParser._resolve_library_path("./mci", schema_path) is lib_path
+        assert SchemaParser._resolve_library_path("mci", None) == Path("mci")
@@ -6,43 +6,112 @@ toolsets, or resolving templates, and without any side effects.
 """
 
 import json
+import re
 
 import pytest
 
 from mcipy import MCIClient, MCIClientError
 
+# Case-insensitive error message checks, compiled once instead of lowercasing each message
+VALIDATING_MODE_RE = re.compile(r"validating mode", re.IGNORECASE)
+DISABLED_RE = re.compile(r"disabled", re.IGNORECASE)
+SCHEMA_VERSION_RE = re.compile(r"schemaversion", re.IGNORECASE)
+EXECUTION_RE = re.compile(r"execution", re.IGNORECASE)
+
+# One inline text tool; shared by tests that only need a minimal valid schema
+SIMPLE_SCHEMA = {
+    "schemaVersion": "1.0",
+    "tools": [{"name": "test_tool", "execution": {"type": "text", "text": "Hello World"}}],
+}
+
+# Two inline text tools; shared by the read-only filtering tests and as toolset contents
+TWO_TOOL_SCHEMA = {
+    "schemaVersion": "1.0",
+    "tools": [
+        {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
+        {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
+    ],
+}
+
+# Main schema pulling in the "my_toolset" toolset from ./mci
+MY_TOOLSET_SCHEMA = {
+    "schemaVersion": "1.0",
+    "libraryDir": "./mci",
+    "toolsets": ["my_toolset"],
+    "tools": [],
+}
+
+# Toolset file contents whose tool names mark them as coming from the toolset
+PREFIXED_TOOLSET_SCHEMA = {
+    "schemaVersion": "1.0",
+    "tools": [
+        {"name": "toolset_tool1", "execution": {"type": "text", "text": "Tool 1"}},
+        {"name": "toolset_tool2", "execution": {"type": "text", "text": "Tool 2"}},
+    ],
+}
+
+# STDIO MCP server without templated args
+STDIO_SERVER_SCHEMA = {
+    "schemaVersion": "1.0",
+    "libraryDir": "./mci",
+    "mcp_servers": {
+        "test_server": {
+            "command": "npx",
+            "args": ["-y", "test-server"],
+            "config": {"expDays": 1},
+        }
+    },
+    "tools": [],
+}
+
+# STDIO MCP server whose args need an env var that the tests never provide
+STDIO_ENV_SERVER_SCHEMA = {
+    "schemaVersion": "1.0",
+    "libraryDir": "./mci",
+    "mcp_servers": {
+        "test_server": {
+            "command": "npx",
+            "args": ["-y", "test-server", "{{env.REQUIRED_VAR}}"],
+            "config": {"expDays": 1},
+        }
+    },
+    "tools": [],
+}
+
+
+@pytest.fixture(scope="module")
+def validating_client():
+    """
+    Fixture for a factory returning validating-mode clients, built once per distinct schema.
+
+    Validating-mode clients cannot execute tools, so tests that only inspect them can share
+    one client per schema instead of parsing the same schema again.
+    """
+    clients: dict[str, MCIClient] = {}
+
+    def get(schema: dict) -> MCIClient:
+        key = json.dumps(schema, sort_keys=True)
+        if key not in clients:
+            clients[key] = MCIClient.from_dict(schema, validating=True)
+        return clients[key]
+
+    return get
+
 
 class TestValidatingModeBasics:
     """Tests for basic validating mode functionality."""
 
-    def test_validating_mode_with_simple_schema(self, tmp_path):
+    def test_validating_mode_with_simple_schema(self, validating_client):
         """Test validating mode with simple schema containing only inline tools."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "test_tool", "execution": {"type": "text", "text": "Hello World"}}
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
         # Should load successfully in validating mode
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(SIMPLE_SCHEMA)
         assert client is not None
         assert len(client.list_tools()) == 1
 
-    def test_validating_mode_default_false(self, tmp_path):
+    def test_validating_mode_default_false(self, tmp_path, write_json):
         """Test that validating mode defaults to False."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "test_tool", "execution": {"type": "text", "text": "Hello World"}}
-            ],
-        }
-
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
+        write_json(schema_file, SIMPLE_SCHEMA)
 
         # Default should be validating=False
         client = MCIClient(schema_file_path=str(schema_file))
@@ -50,20 +119,10 @@ class TestValidatingModeBasics:
         result = client.execute("test_tool", {})
         assert result.result.isError is False
 
-    def test_validating_mode_explicit_false(self, tmp_path):
+    def test_validating_mode_explicit_false(self):
         """Test validating mode with explicit validating=False."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "test_tool", "execution": {"type": "text", "text": "Hello World"}}
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
         # Explicit validating=False should work like normal mode
-        client = MCIClient(schema_file_path=str(schema_file), validating=False)
+        client = MCIClient.from_dict(SIMPLE_SCHEMA, validating=False)
         result = client.execute("test_tool", {})
         assert result.result.isError is False
 
@@ -73,47 +132,27 @@ class TestValidatingModeWithMCPServers:
 
     def test_mcp_server_without_env_vars_validating_mode(self, tmp_path):
         """Test that MCP server with unresolved env vars works in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "mcp_servers": {
-                "test_server": {
-                    "command": "npx",
-                    "args": ["-y", "test-server", "{{env.REQUIRED_VAR}}"],
-                    "config": {"expDays": 1},
-                }
-            },
-            "tools": [],
-        }
-
+        # Anchors libraryDir under tmp_path; the file itself is never written
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should work in validating mode without env vars
-        client = MCIClient(schema_file_path=str(schema_file), env_vars={}, validating=True)
+        client = MCIClient.from_dict(
+            STDIO_ENV_SERVER_SCHEMA, schema_file_path=str(schema_file), env_vars={}, validating=True
+        )
         assert client is not None
 
     def test_mcp_server_without_env_vars_normal_mode_fails(self, tmp_path):
         """Test that MCP server with unresolved env vars fails in normal mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "mcp_servers": {
-                "test_server": {
-                    "command": "npx",
-                    "args": ["-y", "test-server", "{{env.REQUIRED_VAR}}"],
-                    "config": {"expDays": 1},
-                }
-            },
-            "tools": [],
-        }
-
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should fail in normal mode without env vars
         with pytest.raises(MCIClientError) as exc_info:
-            MCIClient(schema_file_path=str(schema_file), env_vars={}, validating=False)
+            MCIClient.from_dict(
+                STDIO_ENV_SERVER_SCHEMA,
+                schema_file_path=str(schema_file),
+                env_vars={},
+                validating=False,
+            )
         assert "Failed to resolve placeholder" in str(exc_info.value)
 
     def test_mcp_server_http_without_env_vars(self, tmp_path):
@@ -133,10 +172,11 @@ class TestValidatingModeWithMCPServers:
         }
 
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should work in validating mode
-        client = MCIClient(schema_file_path=str(schema_file), env_vars={}, validating=True)
+        client = MCIClient.from_dict(
+            schema, schema_file_path=str(schema_file), env_vars={}, validating=True
+        )
         assert client is not None
 
     def test_multiple_mcp_servers_validating_mode(self, tmp_path):
@@ -161,43 +201,24 @@ class TestValidatingModeWithMCPServers:
         }
 
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should work with all servers in validating mode
-        client = MCIClient(schema_file_path=str(schema_file), env_vars={}, validating=True)
+        client = MCIClient.from_dict(
+            schema, schema_file_path=str(schema_file), env_vars={}, validating=True
+        )
         assert client is not None
 
 
 class TestValidatingModeWithToolsets:
     """Tests for validating mode with toolsets."""
 
-    def test_toolset_validating_mode(self, tmp_path):
+    def test_toolset_validating_mode(self, tmp_path, write_json_files):
         """Test that toolsets are validated but not loaded in validating mode."""
-        # Create a toolset file
-        toolset_dir = tmp_path / "mci"
-        toolset_dir.mkdir()
-
-        toolset_schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "toolset_tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "toolset_tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
-        toolset_file = toolset_dir / "my_toolset.mci.json"
-        toolset_file.write_text(json.dumps(toolset_schema))
-
-        # Create main schema
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "toolsets": ["my_toolset"],
-            "tools": [],
-        }
-
+        write_json_files(
+            tmp_path,
+            {"mci/my_toolset.mci.json": PREFIXED_TOOLSET_SCHEMA, "schema.json": MY_TOOLSET_SCHEMA},
+        )
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should validate but not load tools in validating mode
         client = MCIClient(schema_file_path=str(schema_file), validating=True)
@@ -205,39 +226,19 @@ class TestValidatingModeWithToolsets:
         # In validating mode, toolset tools are not loaded
         assert len(client.list_tools()) == 0
 
-    def test_toolset_normal_mode_loads_tools(self, tmp_path):
+    def test_toolset_normal_mode_loads_tools(self, tmp_path, write_json_files):
         """Test that toolsets are loaded in normal mode."""
-        # Create a toolset file
-        toolset_dir = tmp_path / "mci"
-        toolset_dir.mkdir()
-
-        toolset_schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "toolset_tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "toolset_tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
-        toolset_file = toolset_dir / "my_toolset.mci.json"
-        toolset_file.write_text(json.dumps(toolset_schema))
-
-        # Create main schema
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "toolsets": ["my_toolset"],
-            "tools": [],
-        }
-
+        write_json_files(
+            tmp_path,
+            {"mci/my_toolset.mci.json": PREFIXED_TOOLSET_SCHEMA, "schema.json": MY_TOOLSET_SCHEMA},
+        )
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should load tools in normal mode
         client = MCIClient(schema_file_path=str(schema_file), validating=False)
         assert len(client.list_tools()) == 2
 
-    def test_nonexistent_toolset_fails_validating_mode(self, tmp_path):
+    def test_nonexistent_toolset_fails_validating_mode(self, tmp_path, write_json):
         """Test that non-existent toolset raises error even in validating mode."""
         toolset_dir = tmp_path / "mci"
         toolset_dir.mkdir()
@@ -250,19 +251,15 @@ class TestValidatingModeWithToolsets:
         }
 
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
+        write_json(schema_file, schema)
 
         # Should fail in validating mode
         with pytest.raises(MCIClientError) as exc_info:
             MCIClient(schema_file_path=str(schema_file), validating=True)
         assert "Toolset not found" in str(exc_info.value)
 
-    def test_toolset_directory_validating_mode(self, tmp_path):
+    def test_toolset_directory_validating_mode(self, tmp_path, write_json_files):
         """Test validating mode with toolset directory."""
-        # Create a toolset directory with multiple files
-        toolset_dir = tmp_path / "mci" / "my_toolset"
-        toolset_dir.mkdir(parents=True)
-
         toolset1 = {
             "schemaVersion": "1.0",
             "tools": [{"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}}],
@@ -272,42 +269,51 @@ class TestValidatingModeWithToolsets:
             "tools": [{"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}}],
         }
 
-        (toolset_dir / "part1.mci.json").write_text(json.dumps(toolset1))
-        (toolset_dir / "part2.mci.json").write_text(json.dumps(toolset2))
+        # A toolset directory with multiple files, plus the main schema
+        write_json_files(
+            tmp_path,
+            {
+                "mci/my_toolset/part1.mci.json": toolset1,
+                "mci/my_toolset/part2.mci.json": toolset2,
+                "schema.json": MY_TOOLSET_SCHEMA,
+            },
+        )
+        schema_file = tmp_path / "schema.json"
 
-        # Create main schema
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "toolsets": ["my_toolset"],
-            "tools": [],
-        }
+        # Should validate successfully
+        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        assert client is not None
+
+    def test_toolset_directory_with_only_yaml_validating_mode(self, tmp_path, write_json):
+        """Test that a directory holding only a .mci.yml toolset passes validation."""
+        toolset_dir = tmp_path / "mci" / "my_toolset"
+        toolset_dir.mkdir(parents=True)
+        (toolset_dir / "README.md").write_text("notes")
+        (toolset_dir / "part.mci.yml").write_text("schemaVersion: '1.0'\ntools: []\n")
 
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
+        write_json(schema_file, MY_TOOLSET_SCHEMA)
 
-        # Should validate successfully
         client = MCIClient(schema_file_path=str(schema_file), validating=True)
         assert client is not None
 
-    def test_toolset_with_filters_validating_mode(self, tmp_path):
-        """Test that toolset filters are validated but not applied in validating mode."""
-        # Create a toolset file
-        toolset_dir = tmp_path / "mci"
-        toolset_dir.mkdir()
+    def test_toolset_directory_without_toolset_files_fails_validating_mode(
+        self, tmp_path, write_json
+    ):
+        """Test that a toolset directory with no toolset files fails validation."""
+        toolset_dir = tmp_path / "mci" / "my_toolset"
+        (toolset_dir / "nested.mci.json").mkdir(parents=True)
+        (toolset_dir / "README.md").write_text("notes")
 
-        toolset_schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
+        schema_file = tmp_path / "schema.json"
+        write_json(schema_file, MY_TOOLSET_SCHEMA)
 
-        toolset_file = toolset_dir / "my_toolset.mci.json"
-        toolset_file.write_text(json.dumps(toolset_schema))
+        with pytest.raises(MCIClientError, match="No .mci.json, .mci.yaml, or .mci.yml files"):
+            MCIClient(schema_file_path=str(schema_file), validating=True)
 
-        # Create main schema with filter
+    def test_toolset_with_filters_validating_mode(self, tmp_path, write_json_files):
+        """Test that toolset filters are validated but not applied in validating mode."""
+        # Main schema with filter
         schema = {
             "schemaVersion": "1.0",
             "libraryDir": "./mci",
@@ -315,8 +321,10 @@ class TestValidatingModeWithToolsets:
             "tools": [],
         }
 
+        write_json_files(
+            tmp_path, {"mci/my_toolset.mci.json": TWO_TOOL_SCHEMA, "schema.json": schema}
+        )
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
 
         # Should validate successfully in validating mode
         client = MCIClient(schema_file_path=str(schema_file), validating=True)
@@ -326,40 +334,20 @@ class TestValidatingModeWithToolsets:
 class TestValidatingModeExecutionBlocked:
     """Tests that tool execution is blocked in validating mode."""
 
-    def test_execute_blocked_in_validating_mode(self, tmp_path):
+    def test_execute_blocked_in_validating_mode(self, validating_client):
         """Test that execute() raises error in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "test_tool", "execution": {"type": "text", "text": "Hello World"}}
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(SIMPLE_SCHEMA)
 
         # Should raise error
         with pytest.raises(MCIClientError) as exc_info:
             client.execute("test_tool", {})
 
-        assert "validating mode" in str(exc_info.value).lower()
-        assert "disabled" in str(exc_info.value).lower()
+        assert VALIDATING_MODE_RE.search(str(exc_info.value))
+        assert DISABLED_RE.search(str(exc_info.value))
 
-    def test_execute_error_message_helpful(self, tmp_path):
+    def test_execute_error_message_helpful(self, validating_client):
         """Test that execution error message is helpful."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "test_tool", "execution": {"type": "text", "text": "Hello World"}}
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(SIMPLE_SCHEMA)
 
         with pytest.raises(MCIClientError) as exc_info:
             client.execute("test_tool", {})
@@ -371,23 +359,10 @@ class TestValidatingModeExecutionBlocked:
 class TestValidatingModeNoSideEffects:
     """Tests that validating mode has no side effects."""
 
-    def test_no_mcp_cache_directory_created(self, tmp_path):
+    def test_no_mcp_cache_directory_created(self, tmp_path, write_json):
         """Test that MCP cache directory is not created in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "mcp_servers": {
-                "test_server": {
-                    "command": "npx",
-                    "args": ["-y", "test-server"],
-                    "config": {"expDays": 1},
-                }
-            },
-            "tools": [],
-        }
-
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
+        write_json(schema_file, STDIO_SERVER_SCHEMA)
 
         # Load in validating mode
         MCIClient(schema_file_path=str(schema_file), validating=True)
@@ -396,23 +371,10 @@ class TestValidatingModeNoSideEffects:
         mcp_dir = tmp_path / "mci" / "mcp"
         assert not mcp_dir.exists()
 
-    def test_no_files_written_validating_mode(self, tmp_path):
+    def test_no_files_written_validating_mode(self, tmp_path, write_json):
         """Test that no files are written in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "libraryDir": "./mci",
-            "mcp_servers": {
-                "test_server": {
-                    "command": "npx",
-                    "args": ["-y", "test-server"],
-                    "config": {"expDays": 1},
-                }
-            },
-            "tools": [],
-        }
-
         schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
+        write_json(schema_file, STDIO_SERVER_SCHEMA)
 
         # Get initial file list
         initial_files = set(tmp_path.rglob("*"))
@@ -430,73 +392,53 @@ class TestValidatingModeNoSideEffects:
 class TestValidatingModeSchemaValidation:
     """Tests that schema validation still works in validating mode."""
 
-    def test_invalid_schema_version_fails(self, tmp_path):
+    def test_invalid_schema_version_fails(self):
         """Test that invalid schema version fails in validating mode."""
         schema = {"schemaVersion": "999.0", "tools": []}
 
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
         with pytest.raises(MCIClientError) as exc_info:
-            MCIClient(schema_file_path=str(schema_file), validating=True)
+            MCIClient.from_dict(schema, validating=True)
         assert "Unsupported schema version" in str(exc_info.value)
 
-    def test_missing_required_fields_fails(self, tmp_path):
+    def test_missing_required_fields_fails(self):
         """Test that missing required fields fail in validating mode."""
         schema = {"tools": []}  # Missing schemaVersion
 
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
         with pytest.raises(MCIClientError) as exc_info:
-            MCIClient(schema_file_path=str(schema_file), validating=True)
+            MCIClient.from_dict(schema, validating=True)
         # Check for the field name in the error (case-insensitive)
-        assert "schemaversion" in str(exc_info.value).lower()
+        assert SCHEMA_VERSION_RE.search(str(exc_info.value))
 
-    def test_invalid_tool_structure_fails(self, tmp_path):
+    def test_invalid_tool_structure_fails(self):
         """Test that invalid tool structure fails in validating mode."""
         schema = {
             "schemaVersion": "1.0",
             "tools": [{"name": "test_tool"}],  # Missing execution
         }
 
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
         with pytest.raises(MCIClientError) as exc_info:
-            MCIClient(schema_file_path=str(schema_file), validating=True)
-        assert "execution" in str(exc_info.value).lower()
+            MCIClient.from_dict(schema, validating=True)
+        assert EXECUTION_RE.search(str(exc_info.value))
 
-    def test_invalid_execution_type_fails(self, tmp_path):
+    def test_invalid_execution_type_fails(self):
         """Test that invalid execution type fails in validating mode."""
         schema = {
             "schemaVersion": "1.0",
             "tools": [{"name": "test_tool", "execution": {"type": "invalid_type"}}],
         }
 
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
         with pytest.raises(MCIClientError) as exc_info:
-            MCIClient(schema_file_path=str(schema_file), validating=True)
+            MCIClient.from_dict(schema, validating=True)
         assert "Invalid execution type" in str(exc_info.value)
 
 
 class TestValidatingModeToolsetFile:
     """Tests for validating mode when loading a toolset file directly."""
 
-    def test_validate_toolset_file_directly(self, tmp_path):
+    def test_validate_toolset_file_directly(self, tmp_path, write_json):
         """Test validating a toolset file directly."""
-        toolset_schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
         toolset_file = tmp_path / "my_toolset.mci.json"
-        toolset_file.write_text(json.dumps(toolset_schema))
+        write_json(toolset_file, TWO_TOOL_SCHEMA)
 
         # Should load successfully in validating mode
         client = MCIClient(schema_file_path=str(toolset_file), validating=True)
@@ -504,7 +446,7 @@ class TestValidatingModeToolsetFile:
         # Toolset file is loaded even in validating mode (it's the main schema)
         assert len(client.list_tools()) == 2
 
-    def test_validate_toolset_file_with_invalid_structure(self, tmp_path):
+    def test_validate_toolset_file_with_invalid_structure(self, tmp_path, write_json):
         """Test that invalid toolset file fails validation."""
         toolset_schema = {
             "schemaVersion": "1.0",
@@ -514,89 +456,45 @@ class TestValidatingModeToolsetFile:
         }
 
         toolset_file = tmp_path / "my_toolset.mci.json"
-        toolset_file.write_text(json.dumps(toolset_schema))
+        write_json(toolset_file, toolset_schema)
 
         with pytest.raises(MCIClientError) as exc_info:
             MCIClient(schema_file_path=str(toolset_file), validating=True)
-        assert "execution" in str(exc_info.value).lower()
+        assert EXECUTION_RE.search(str(exc_info.value))
 
 
 class TestValidatingModeReadOnlyOperations:
     """Tests that read-only operations work in validating mode."""
 
-    def test_list_tools_works(self, tmp_path):
+    def test_list_tools_works(self, validating_client):
         """Test that list_tools() works in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(TWO_TOOL_SCHEMA)
         tools = client.list_tools()
         assert len(tools) == 2
         assert "tool1" in tools
         assert "tool2" in tools
 
-    def test_tools_works(self, tmp_path):
+    def test_tools_works(self, validating_client):
         """Test that tools() works in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(TWO_TOOL_SCHEMA)
         tools = client.tools()
         assert len(tools) == 2
 
-    def test_only_works(self, tmp_path):
+    def test_only_works(self, validating_client):
         """Test that only() filtering works in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(TWO_TOOL_SCHEMA)
         tools = client.only(["tool1"])
         assert len(tools) == 1
         assert tools[0].name == "tool1"
 
-    def test_without_works(self, tmp_path):
+    def test_without_works(self, validating_client):
         """Test that without() filtering works in validating mode."""
-        schema = {
-            "schemaVersion": "1.0",
-            "tools": [
-                {"name": "tool1", "execution": {"type": "text", "text": "Tool 1"}},
-                {"name": "tool2", "execution": {"type": "text", "text": "Tool 2"}},
-            ],
-        }
-
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(TWO_TOOL_SCHEMA)
         tools = client.without(["tool1"])
         assert len(tools) == 1
         assert tools[0].name == "tool2"
 
-    def test_get_tool_schema_works(self, tmp_path):
+    def test_get_tool_schema_works(self, validating_client):
         """Test that get_tool_schema() works in validating mode."""
         schema = {
             "schemaVersion": "1.0",
@@ -612,10 +510,7 @@ class TestValidatingModeReadOnlyOperations:
             ],
         }
 
-        schema_file = tmp_path / "schema.json"
-        schema_file.write_text(json.dumps(schema))
-
-        client = MCIClient(schema_file_path=str(schema_file), validating=True)
+        client = validating_client(schema)
         schema_obj = client.get_tool_schema("tool1")
         assert "properties" in schema_obj
         assert "param" in schema_obj["properties"]